@@ -0,0 +1,116 @@
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from employees.models import Employee
+
+from .models import Attendance
+
+
+BULK_MAX_ROWS = 10000
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 5000
+
+STATUSES = {value for value, _ in Attendance.STATUS_CHOICES}
+
+
+def _row_errors(row):
+    """
+    Field-level checks that need no database access.
+    Returns (employee_id, date, status, errors).
+    """
+    errors = {}
+    if not isinstance(row, dict):
+        return None, None, None, {"non_field_errors": ["Expected an object."]}
+
+    employee_id = row.get("employee")
+    if isinstance(employee_id, bool) or not isinstance(employee_id, (int, str)):
+        errors["employee"] = ["A valid integer is required."]
+    else:
+        try:
+            employee_id = int(employee_id)
+        except ValueError:
+            errors["employee"] = ["A valid integer is required."]
+
+    day = row.get("date")
+    try:
+        day = parse_date(day) if isinstance(day, str) else None
+    except ValueError:
+        day = None
+    if day is None:
+        errors["date"] = ["Date has wrong format. Use YYYY-MM-DD."]
+
+    status = row.get("status")
+    if status not in STATUSES:
+        errors["status"] = [f'"{status}" is not a valid choice.']
+
+    return employee_id, day, status, errors
+
+
+def bulk_upsert_attendance(rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Insert or update many {employee, date, status} rows at once.
+
+    Validation is done for the whole batch: one query resolves every
+    employee id, one query finds which (employee, date) pairs already
+    exist, and duplicates inside the batch are rejected (the first
+    occurrence wins). Valid rows are written with
+    bulk_create(update_conflicts=True) in chunks of `batch_size`.
+
+    Returns:
+      {"inserted": n, "updated": n, "rejected": n,
+       "errors": [{"index": i, "errors": {field: [message]}}, ...]}
+    """
+    parsed = []
+    errors = []
+    for index, row in enumerate(rows):
+        employee_id, day, status, row_errors = _row_errors(row)
+        if row_errors:
+            errors.append({"index": index, "errors": row_errors})
+        else:
+            parsed.append((index, employee_id, day, status))
+
+    known = set(
+        Employee.objects.filter(pk__in={employee_id for _, employee_id, _, _ in parsed})
+        .values_list("pk", flat=True)
+    )
+
+    seen = {}
+    valid = []
+    for index, employee_id, day, status in parsed:
+        if employee_id not in known:
+            message = f'Invalid pk "{employee_id}" - object does not exist.'
+            errors.append({"index": index, "errors": {"employee": [message]}})
+        elif (employee_id, day) in seen:
+            message = f"Duplicate employee/date in this batch (row {seen[employee_id, day]})."
+            errors.append({"index": index, "errors": {"non_field_errors": [message]}})
+        else:
+            seen[employee_id, day] = index
+            valid.append(Attendance(employee_id=employee_id, date=day, status=status))
+
+    updated = 0
+    if valid:
+        # Rollups are refreshed by attendance_bulk_changed in the same transaction
+        with transaction.atomic():
+            # One over-approximating lookup, narrowed to the exact pairs in Python
+            existing = set(
+                Attendance.objects.filter(
+                    employee_id__in={obj.employee_id for obj in valid},
+                    date__in={obj.date for obj in valid},
+                ).values_list("employee_id", "date")
+            )
+            updated = sum((obj.employee_id, obj.date) in existing for obj in valid)
+            Attendance.objects.bulk_create(
+                valid,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["employee", "date"],
+                update_fields=["status"],
+            )
+
+    errors.sort(key=lambda error: error["index"])
+    return {
+        "inserted": len(valid) - updated,
+        "updated": updated,
+        "rejected": len(errors),
+        "errors": errors,
+    }
@@ -0,0 +1,89 @@
+# attendance/management/commands/partition_attendance.py
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from attendance.partitioning import (
+    PartitioningError,
+    add_months,
+    convert_to_partitioned,
+    detach_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Opt-in monthly range partitioning of the attendance table (PostgreSQL only). "
+        "--convert migrates the existing table; run with --ahead regularly (e.g. daily cron) "
+        "to pre-create future partitions, and --detach-before to detach old months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert attendance_attendance into a partitioned table (locks it while copying)",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=3,
+            help="Months after the current one that must have a partition (default: 3)",
+        )
+        parser.add_argument(
+            "--detach-before",
+            type=str,
+            help="Detach partitions for months before YYYY-MM (tables are kept for archiving)",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Only list the current partitions",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Attendance partitioning requires PostgreSQL.")
+        if options["ahead"] < 0:
+            raise CommandError("--ahead must not be negative.")
+
+        try:
+            if options["list"]:
+                with connection.cursor() as cursor:
+                    for name, bound in list_partitions(cursor):
+                        self.stdout.write(f"{name}: {bound}")
+                return
+
+            if options["convert"]:
+                count = convert_to_partitioned(months_ahead=options["ahead"])
+                self.stdout.write(
+                    self.style.SUCCESS(f"Converted attendance to {count} monthly partitions.")
+                )
+            else:
+                with connection.cursor() as cursor:
+                    if not is_partitioned(cursor):
+                        raise CommandError(
+                            "attendance_attendance is not partitioned; run with --convert first."
+                        )
+                this_month = month_start(date.today())
+                created = ensure_partitions(this_month, add_months(this_month, options["ahead"]))
+                self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partition(s)."))
+
+            if options["detach_before"]:
+                try:
+                    year, month = options["detach_before"].split("-")
+                    cutoff = date(int(year), int(month), 1)
+                except ValueError:
+                    raise CommandError("--detach-before must be YYYY-MM.")
+                detached = detach_partitions_before(cutoff)
+                for name in detached:
+                    self.stdout.write(f"Detached {name}")
+                self.stdout.write(self.style.SUCCESS(f"Detached {len(detached)} partition(s)."))
+        except PartitioningError as exc:
+            raise CommandError(str(exc))
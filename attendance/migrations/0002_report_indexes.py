@@ -0,0 +1,27 @@
+# Generated by Django 4.2.4 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["date", "status"], name="attendance_date_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                condition=models.Q(("status__in", ["absent", "late"])),
+                fields=["status", "date"],
+                name="attendance_exception_idx",
+            ),
+        ),
+    ]
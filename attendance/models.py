@@ -1,9 +1,49 @@
 from django.db import models
 
 # Create your models here.
-from django.db import models
+from django.db import models, transaction
 from employees.models import Employee
 
+from .signals import attendance_bulk_changed
+
+
+class AttendanceQuerySet(models.QuerySet):
+    """
+    bulk_create() and update() do not send post_save for each row, so they
+    announce the touched dates/employees through `attendance_bulk_changed`.
+    Model.save() goes through QuerySet._update() and is not affected.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            attendance_bulk_changed.send(
+                sender=self.model,
+                dates={obj.date for obj in objs},
+                employee_ids={obj.employee_id for obj in objs},
+            )
+        return objs
+
+    def update(self, **kwargs):
+        # Capture the rows' cells before they move (date/employee may change)
+        touched = set(self.values_list("date", "employee_id").distinct())
+        rows = super().update(**kwargs)
+        if rows:
+            dates = {day for day, _ in touched}
+            employee_ids = {employee_id for _, employee_id in touched}
+            # Literal new values are known up front; expressions (e.g. F())
+            # are not supported here and need a full rollup rebuild.
+            new_date = kwargs.get("date")
+            if new_date is not None and not hasattr(new_date, "resolve_expression"):
+                dates.add(new_date)
+            employee = kwargs.get("employee", kwargs.get("employee_id"))
+            if employee is not None and not hasattr(employee, "resolve_expression"):
+                employee_ids.add(getattr(employee, "pk", employee))
+            attendance_bulk_changed.send(
+                sender=self.model, dates=dates, employee_ids=employee_ids
+            )
+        return rows
+
 
 class Attendance(models.Model):
     STATUS_CHOICES = [
@@ -17,8 +57,25 @@ class Attendance(models.Model):
     date = models.DateField()
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
 
+    objects = AttendanceQuerySet.as_manager()
+
     class Meta:
         unique_together = ("employee", "date")
+        indexes = [
+            # Date-range report scans (time series, rollup rebuilds); covers status
+            models.Index(fields=["date", "status"], name="attendance_date_status_idx"),
+            # Small partial index for the absent/late exception reports
+            models.Index(
+                fields=["status", "date"],
+                name="attendance_exception_idx",
+                condition=models.Q(status__in=["absent", "late"]),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # post_save updates DailyAttendanceRollup in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.employee.name}: {self.date} → {self.status}"
@@ -0,0 +1,276 @@
+# attendance/partitioning.py
+"""
+Opt-in monthly range partitioning of attendance_attendance (PostgreSQL only).
+
+Layout after `manage.py partition_attendance --convert`:
+
+    attendance_attendance              PARTITION BY RANGE (date)
+      attendance_attendance_p2025_01   FOR VALUES FROM ('2025-01-01') TO ('2025-02-01')
+      attendance_attendance_p2025_02   ...
+      attendance_attendance_default    DEFAULT (catches dates without a partition)
+
+- The primary key becomes (id, date): PostgreSQL requires the partition key
+  in every unique constraint. `id` stays an identity column, so Django keeps
+  using it as the pk.
+- unique (employee_id, date) contains the partition key and is therefore
+  still enforced across all partitions.
+- Report queries filter with half-open date ranges on constants, so the
+  planner prunes them to the partitions of the requested months.
+- Months detached with detach_partitions_before() keep their
+  DailyAttendanceRollup rows; the rollup rebuild and drift check skip
+  months before the earliest attached partition that have no rows left
+  (see attached_since()).
+"""
+
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+TABLE = "attendance_attendance"
+LEGACY_TABLE = f"{TABLE}_legacy"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+class PartitioningError(Exception):
+    pass
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def iter_month_starts(first, last):
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name):
+    """
+    First day of a monthly partition's month, or None for other tables.
+    """
+    match = re.fullmatch(rf"{TABLE}_p(\d{{4}})_(\d{{2}})", name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def _check_vendor():
+    if connection.vendor != "postgresql":
+        raise PartitioningError("Attendance partitioning requires PostgreSQL.")
+
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT c.relkind FROM pg_class c "
+        "WHERE c.oid = to_regclass(%s)",
+        [TABLE],
+    )
+    row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def list_partitions(cursor):
+    """
+    [(partition name, bound expression)] ordered by name.
+    """
+    cursor.execute(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname",
+        [TABLE],
+    )
+    return cursor.fetchall()
+
+
+def attached_since():
+    """
+    First day of the earliest monthly partition still attached, or None when
+    attendance is not partitioned (or not on PostgreSQL). Older months may
+    have been detached.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        if not is_partitioned(cursor):
+            return None
+        months = [partition_month(name) for name, _ in list_partitions(cursor)]
+    months = [month for month in months if month is not None]
+    return min(months) if months else None
+
+
+def _create_partition(cursor, month):
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" '
+        f'PARTITION OF "{TABLE}" FOR VALUES FROM (%s) TO (%s)',
+        [month, add_months(month, 1)],
+    )
+
+
+def _create_partition_from_default(cursor, month):
+    """
+    Create the month's partition when a DEFAULT partition exists. PostgreSQL
+    refuses while DEFAULT holds rows of that month, so they are taken out
+    into a temporary table first and inserted again afterwards, which routes
+    them to the new partition.
+    """
+    moving = f"{TABLE}_moving"
+    bounds = [month, add_months(month, 1)]
+    cursor.execute(
+        f'CREATE TEMPORARY TABLE "{moving}" ON COMMIT DROP AS '
+        f'SELECT * FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s',
+        bounds,
+    )
+    cursor.execute(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s', bounds)
+    _create_partition(cursor, month)
+    # a partition has the parent's column order
+    cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{moving}"')
+    cursor.execute(f'DROP TABLE "{moving}"')
+
+
+def ensure_partitions(first, last):
+    """
+    Create the monthly partitions covering [first, last]; returns the names
+    created. Existing ones are left alone. Rows that landed in the DEFAULT
+    partition for one of those months are moved into the new partition.
+    """
+    _check_vendor()
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not is_partitioned(cursor):
+            raise PartitioningError(
+                f"{TABLE} is not partitioned yet; run partition_attendance --convert."
+            )
+        existing = {name for name, _ in list_partitions(cursor)}
+        for month in iter_month_starts(first, last):
+            if partition_name(month) in existing:
+                continue
+            if DEFAULT_PARTITION in existing:
+                _create_partition_from_default(cursor, month)
+            else:
+                _create_partition(cursor, month)
+            created.append(partition_name(month))
+    return created
+
+
+def detach_partitions_before(month):
+    """
+    Detach the monthly partitions that end on or before `month` (the tables
+    are kept, e.g. for archiving with pg_dump). Returns their names.
+    """
+    _check_vendor()
+    cutoff = partition_name(month_start(month))
+    detached = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name, _ in list_partitions(cursor):
+            if name == DEFAULT_PARTITION or not name < cutoff:
+                continue
+            cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"')
+            detached.append(name)
+    return detached
+
+
+def convert_to_partitioned(months_ahead=3):
+    """
+    Rebuild attendance_attendance as a partitioned table in one transaction:
+    rename the old table, create the partitioned parent with the same
+    columns, create partitions for every month that has data plus
+    `months_ahead` future months, copy the rows over, drop the old table and
+    recreate its indexes and constraints under their original names (so
+    later Django migrations keep working). Holds an ACCESS EXCLUSIVE lock on
+    the table while it runs. Returns the number of monthly partitions.
+    """
+    _check_vendor()
+    with transaction.atomic(), connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            raise PartitioningError(f"{TABLE} is already partitioned.")
+
+        cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        cursor.execute(
+            f'ALTER TABLE "{LEGACY_TABLE}" RENAME CONSTRAINT "{TABLE}_pkey" TO "{LEGACY_TABLE}_pkey"'
+        )
+
+        # Constraints (unique, foreign key) and plain indexes to replay on the new parent
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype IN ('u', 'f') ORDER BY contype DESC",
+            [LEGACY_TABLE],
+        )
+        constraints = cursor.fetchall()
+        constraint_names = {name for name, _ in constraints}
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s",
+            [LEGACY_TABLE],
+        )
+        indexes = [
+            re.sub(rf"\bON (\S+\.)?{LEGACY_TABLE}\b", rf"ON \g<1>{TABLE}", definition)
+            for name, definition in cursor.fetchall()
+            if name != f"{LEGACY_TABLE}_pkey" and name not in constraint_names
+        ]
+
+        # id is an identity column (Django >= 4.1) or a serial with a sequence default
+        cursor.execute(
+            "SELECT attidentity FROM pg_attribute "
+            "WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+            [LEGACY_TABLE],
+        )
+        is_identity = bool(cursor.fetchone()[0])
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [LEGACY_TABLE])
+        sequence = cursor.fetchone()[0]
+
+        cursor.execute(
+            f'CREATE TABLE "{TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS) '
+            "PARTITION BY RANGE (date)"
+        )
+        if is_identity:
+            cursor.execute(
+                f'ALTER TABLE "{TABLE}" ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY'
+            )
+        elif sequence:
+            # Keep the serial's sequence alive when the old table is dropped
+            cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{TABLE}".id')
+        cursor.execute(
+            f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, date)'
+        )
+
+        cursor.execute(f'SELECT min(date), max(date) FROM "{LEGACY_TABLE}"')
+        lo, hi = cursor.fetchone()
+        today = date.today()
+        months = list(
+            iter_month_starts(
+                month_start(min(lo or today, today)),
+                add_months(month_start(max(hi or today, today)), months_ahead),
+            )
+        )
+        for month in months:
+            _create_partition(cursor, month)
+        cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+        cursor.execute(
+            f'INSERT INTO "{TABLE}" (id, date, status, employee_id) '
+            f'SELECT id, date, status, employee_id FROM "{LEGACY_TABLE}"'
+        )
+        if is_identity:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), "
+                f'COALESCE((SELECT max(id) FROM "{TABLE}"), 0) + 1, false)'
+            )
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}"')
+
+        # Unique constraints include `date`, so they stay enforced globally;
+        # indexes and constraints on the parent cascade to every partition
+        for name, definition in constraints:
+            cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+        for definition in indexes:
+            cursor.execute(definition)
+
+    return len(months)
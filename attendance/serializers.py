@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from employees.fieldsets import SparseFieldsetSerializerMixin
 from .models import Attendance
 
 
-class AttendanceSerializer(serializers.ModelSerializer):
+class AttendanceSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Attendance
         fields = [
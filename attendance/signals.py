@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent after Attendance rows are written through a bulk queryset path
+# (bulk_create / update). Those paths skip the per-row post_save signal,
+# so receivers get the affected `dates` and `employee_ids` instead.
+attendance_bulk_changed = Signal()
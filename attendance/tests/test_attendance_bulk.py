@@ -0,0 +1,95 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from attendance.models import Attendance
+from attendance.bulk import bulk_upsert_attendance
+from reports.models import DailyAttendanceRollup
+
+
+class AttendanceBulkUpsertTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="EngDept")
+        self.hr_group = Group.objects.create(name="HR")
+        self.emp_group = Group.objects.create(name="Employee")
+
+        self.hr_user = User.objects.create_user(username="hr", password="pass123")
+        self.hr_group.user_set.add(self.hr_user)
+        self.hr_token = Token.objects.create(user=self.hr_user)
+
+        self.emp_user = User.objects.create_user(username="alice", password="pass123")
+        self.emp_group.user_set.add(self.emp_user)
+        self.emp_token = Token.objects.create(user=self.emp_user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=self.emp_user
+        )
+        self.bob = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+        Attendance.objects.create(employee=self.alice, date="2024-01-01", status="absent")
+
+        self.url = reverse("attendance-bulk")
+
+    def test_upsert_with_per_row_errors(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        payload = [
+            {"employee": self.alice.id, "date": "2024-01-01", "status": "present"},
+            {"employee": self.bob.id, "date": "2024-01-01", "status": "late"},
+            {"employee": self.bob.id, "date": "2024-01-01", "status": "absent"},
+            {"employee": 99999, "date": "2024-01-02", "status": "present"},
+            {"employee": self.bob.id, "date": "2024-13-01", "status": "present"},
+            {"employee": self.bob.id, "date": "2024-01-03", "status": "sick"},
+        ]
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["inserted"], 1)
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(response.data["rejected"], 4)
+        self.assertEqual([e["index"] for e in response.data["errors"]], [2, 3, 4, 5])
+        self.assertIn("status", response.data["errors"][3]["errors"])
+
+        self.assertEqual(Attendance.objects.get(employee=self.alice).status, "present")
+        self.assertEqual(Attendance.objects.get(employee=self.bob).status, "late")
+
+        cell = DailyAttendanceRollup.objects.get(department=self.dept, date="2024-01-01")
+        self.assertEqual((cell.present, cell.absent, cell.late), (1, 0, 1))
+
+    def test_query_count_independent_of_batch_length(self):
+        def rows(month, days):
+            return [
+                {"employee": employee.id, "date": f"2024-{month:02d}-{day:02d}", "status": "present"}
+                for employee in (self.alice, self.bob)
+                for day in range(1, days + 1)
+            ]
+
+        with CaptureQueriesContext(connection) as small:
+            bulk_upsert_attendance(rows(2, 2))
+        with CaptureQueriesContext(connection) as large:
+            result = bulk_upsert_attendance(rows(3, 28))
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(result["inserted"], 56)
+        self.assertEqual(Attendance.objects.count(), 61)
+
+    def test_only_admin_or_hr(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.emp_token.key)
+        response = self.client.post(self.url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_rejects_non_list_and_bad_batch_size(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.post(self.url, {"employee": 1}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(self.url + "?batch_size=0", [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,80 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from attendance.models import Attendance
+
+
+class AttendanceExportTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="EngDept")
+        self.hr_group = Group.objects.create(name="HR")
+        self.emp_group = Group.objects.create(name="Employee")
+
+        self.hr_user = User.objects.create_user(username="hr", password="pass123")
+        self.hr_group.user_set.add(self.hr_user)
+        self.hr_token = Token.objects.create(user=self.hr_user)
+
+        self.emp_user = User.objects.create_user(username="alice", password="pass123")
+        self.emp_group.user_set.add(self.emp_user)
+        self.emp_token = Token.objects.create(user=self.emp_user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=self.emp_user
+        )
+        self.bob = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+
+        Attendance.objects.create(employee=self.alice, date="2024-01-01", status="present")
+        Attendance.objects.create(employee=self.alice, date="2024-01-02", status="late")
+        Attendance.objects.create(employee=self.bob, date="2024-01-01", status="absent")
+
+        self.url = reverse("attendance-export")
+
+    def read(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_streams_all_rows(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.get(self.url, {"ordering": "date"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        lines = self.read(response).splitlines()
+        self.assertEqual(lines[0], "id,employee,date,status")
+        self.assertEqual(len(lines), 4)
+
+    def test_ndjson_export_honors_filters(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.get(self.url, {"output": "ndjson", "status": "absent"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(rows, [
+            {"id": rows[0]["id"], "employee": self.bob.id, "date": "2024-01-01", "status": "absent"}
+        ])
+
+    def test_employee_exports_only_own_rows(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.emp_token.key)
+        response = self.client.get(self.url, {"output": "ndjson"})
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual({row["employee"] for row in rows}, {self.alice.id})
+        self.assertEqual(len(rows), 2)
+
+    def test_invalid_output(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
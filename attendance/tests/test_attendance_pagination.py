@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from attendance.models import Attendance
+
+
+class AttendanceKeysetPaginationTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="EngDept")
+        self.hr_group = Group.objects.create(name="HR")
+        self.hr_user = User.objects.create_user(username="hr", password="pass123")
+        self.hr_group.user_set.add(self.hr_user)
+        self.token = Token.objects.create(user=self.hr_user)
+
+        employees = [
+            Employee.objects.create(
+                name=f"Emp{i}",
+                email=f"emp{i}@example.com",
+                date_of_joining="2024-01-01",
+                department=self.dept,
+                user=User.objects.create_user(username=f"emp{i}", password="pass123")
+            )
+            for i in range(3)
+        ]
+        # Three rows per date, so every page boundary falls inside a tie
+        statuses = ["present", "absent", "late"]
+        for day in range(9):
+            for i, employee in enumerate(employees):
+                Attendance.objects.create(
+                    employee=employee,
+                    date=date(2024, 1, 1) + timedelta(days=day),
+                    status=statuses[(day + i) % 3],
+                )
+
+        self.url = reverse("attendance-list")
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+    def walk(self, params):
+        ids, url, pages = [], self.url, 0
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(row["id"] for row in response.data["results"])
+            pages += 1
+            if not response.data["next"]:
+                return ids, pages, response
+            response = self.client.get(response.data["next"])
+
+    def test_pages_cover_every_row_once_in_order(self):
+        for ordering, key in [
+            ("-date", lambda a: (-a.date.toordinal(), -a.id)),
+            ("status", lambda a: (a.status, a.id)),
+            ("date,-status", None),
+        ]:
+            ids, pages, _ = self.walk({"pagination": "keyset", "page_size": 4, "ordering": ordering})
+            self.assertEqual(len(ids), 27, ordering)
+            self.assertEqual(len(set(ids)), 27, ordering)
+            self.assertEqual(pages, 7, ordering)
+            if key:
+                expected = [a.id for a in sorted(Attendance.objects.all(), key=key)]
+                self.assertEqual(ids, expected, ordering)
+
+    def test_previous_link_returns_the_prior_page(self):
+        first = self.client.get(self.url, {"pagination": "keyset", "page_size": 5})
+        self.assertIsNone(first.data["previous"])
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(back.data["results"], first.data["results"])
+
+    def test_deep_pages_skip_count_and_offset(self):
+        first = self.client.get(self.url, {"pagination": "keyset", "page_size": 2})
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(first.data["next"])
+        sql = " ".join(q["sql"] for q in context.captured_queries)
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor_and_page_size_ceiling(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        first = self.client.get(self.url, {"pagination": "keyset", "ordering": "date"})
+        response = self.client.get(first.data["next"].replace("ordering=date", "ordering=status"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        with self.settings(KEYSET_MAX_PAGE_SIZE=5):
+            response = self.client.get(self.url, {"pagination": "keyset", "page_size": 100})
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_page_number_mode_is_unchanged(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 27)
+        self.assertEqual(len(response.data["results"]), 10)
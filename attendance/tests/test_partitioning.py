@@ -0,0 +1,113 @@
+from datetime import date
+from unittest import skipUnless
+
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.contrib.auth.models import User
+from employees.models import Employee, Department
+from attendance.models import Attendance
+from attendance.partitioning import (
+    DEFAULT_PARTITION,
+    PartitioningError,
+    add_months,
+    attached_since,
+    convert_to_partitioned,
+    detach_partitions_before,
+    ensure_partitions,
+    list_partitions,
+    partition_name,
+)
+from reports.models import DailyAttendanceRollup
+from reports.rollups import find_drift, rebuild_rollups
+
+
+class PartitionNamingTests(TestCase):
+    def test_month_arithmetic_and_names(self):
+        self.assertEqual(add_months(date(2024, 11, 1), 3), date(2025, 2, 1))
+        self.assertEqual(add_months(date(2024, 1, 1), -1), date(2023, 12, 1))
+        self.assertEqual(partition_name(date(2025, 3, 1)), "attendance_attendance_p2025_03")
+
+    @skipUnless(connection.vendor != "postgresql", "non-PostgreSQL behavior")
+    def test_requires_postgresql(self):
+        with self.assertRaises(PartitioningError):
+            convert_to_partitioned()
+        self.assertIsNone(attached_since())
+
+
+@skipUnless(connection.vendor == "postgresql", "Declarative partitioning needs PostgreSQL")
+class AttendancePartitioningTests(TestCase):
+    def setUp(self):
+        dept = Department.objects.create(name="EngDept")
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=dept,
+            user=User.objects.create_user(username="alice", password="pass123")
+        )
+        Attendance.objects.create(employee=self.alice, date="2024-01-15", status="present")
+        Attendance.objects.create(employee=self.alice, date="2024-03-02", status="late")
+
+    def partitions(self):
+        with connection.cursor() as cursor:
+            return [name for name, _ in list_partitions(cursor)]
+
+    def test_convert_keeps_rows_constraints_and_prunes(self):
+        convert_to_partitioned(months_ahead=1)
+
+        self.assertIn(partition_name(date(2024, 1, 1)), self.partitions())
+        self.assertEqual(Attendance.objects.count(), 2)
+
+        # New ids keep counting after the copied rows
+        created = Attendance.objects.create(employee=self.alice, date="2024-02-01", status="absent")
+        self.assertGreater(created.id, max(a.id for a in Attendance.objects.exclude(pk=created.pk)))
+
+        # unique (employee, date) is still enforced
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Attendance.objects.create(employee=self.alice, date="2024-01-15", status="absent")
+
+        # A month's report only reads that month's partition
+        plan = Attendance.objects.filter(
+            date__gte=date(2024, 3, 1), date__lt=date(2024, 4, 1)
+        ).explain()
+        self.assertIn(partition_name(date(2024, 3, 1)), plan)
+        self.assertNotIn(partition_name(date(2024, 1, 1)), plan)
+
+    def test_ensure_and_detach(self):
+        convert_to_partitioned(months_ahead=0)
+        this_month = date.today().replace(day=1)
+        created = ensure_partitions(this_month, add_months(this_month, 2))
+        self.assertEqual(created, [
+            partition_name(add_months(this_month, 1)),
+            partition_name(add_months(this_month, 2)),
+        ])
+
+        detached = detach_partitions_before(date(2024, 2, 1))
+        self.assertEqual(detached, [partition_name(date(2024, 1, 1))])
+        self.assertEqual(Attendance.objects.count(), 1)
+
+    def test_ensure_moves_rows_out_of_the_default_partition(self):
+        convert_to_partitioned(months_ahead=0)
+        far = add_months(date.today().replace(day=1), 6)
+        row = Attendance.objects.create(employee=self.alice, date=far, status="present")
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{DEFAULT_PARTITION}"')
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+        self.assertEqual(ensure_partitions(far, far), [partition_name(far)])
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{DEFAULT_PARTITION}"')
+            self.assertEqual(cursor.fetchone()[0], 0)
+            cursor.execute(f'SELECT id FROM "{partition_name(far)}"')
+            self.assertEqual(cursor.fetchall(), [(row.pk,)])
+
+    def test_detached_months_keep_their_rollups(self):
+        convert_to_partitioned(months_ahead=0)
+        detach_partitions_before(date(2024, 2, 1))
+        self.assertEqual(attached_since(), date(2024, 2, 1))
+        january = DailyAttendanceRollup.objects.filter(date=date(2024, 1, 15))
+        self.assertEqual(january.get().present, 1)
+
+        self.assertEqual(find_drift(), [])
+        rebuild_rollups()
+        self.assertEqual(january.get().present, 1)
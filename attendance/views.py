@@ -1,23 +1,34 @@
 from django.shortcuts import render
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
 
 from .models import Attendance
 from .serializers import AttendanceSerializer
 from .filters import AttendanceFilter
+from .bulk import BULK_MAX_ROWS, DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, bulk_upsert_attendance
 from employees.permissions import IsAdminGroup, IsHRGroup, IsAttendanceSelfOrHRorAdmin
+from employees.authentication import CachedTokenAuthentication
+from employees.exports import ExportMixin
+from employees.fastpath import FastListMixin
+from employees.fieldsets import SparseFieldsetMixin
+from employees.pagination import PageNumberOrKeysetPagination
+from employees.roles import is_staff_role
+from reports.conditional import ConditionalGetMixin
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+class AttendanceViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, ExportMixin, viewsets.ModelViewSet
+):
     """
     Attendance endpoints:
       - Admin/HR: can list/create/update/delete any attendance record.
       - Employee: can only list/retrieve attendance records for themselves.
     """
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     queryset = Attendance.objects.select_related("employee").all()
     serializer_class = AttendanceSerializer
     filter_backends = [
@@ -28,13 +39,24 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     filterset_class = AttendanceFilter
     ordering_fields = ["date", "status"]
     search_fields = ["status"]
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_ordering = ["-date"]
+    etag_tables = ("attendance", "employee")
+    object_permission_columns = ("employee__user",)
+    export_columns = [
+        ("id", "id"),
+        ("employee", "employee_id"),
+        ("date", "date"),
+        ("status", "status"),
+    ]
+    export_filename = "attendance"
 
     def get_permissions(self):
         """
-        - Only Admin or HR may create a new Attendance record.
+        - Only Admin or HR may create new Attendance records (single or bulk).
         - For all other actions, use IsAttendanceSelfOrHRorAdmin.
         """
-        if self.action == "create":
+        if self.action in ("create", "bulk"):
             permission_classes = [IsAuthenticated & (IsAdminGroup | IsHRGroup)]
         else:
             permission_classes = [IsAuthenticated & IsAttendanceSelfOrHRorAdmin]
@@ -47,6 +69,39 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         Employee sees only Attendance entries where attendance.employee.user == request.user.
         """
         user = self.request.user
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return super().get_queryset()
         return super().get_queryset().filter(employee__user=user)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request, *args, **kwargs):
+        """
+        POST /api/attendance/bulk/?batch_size=N
+        Body: [{"employee": 1, "date": "2025-05-01", "status": "present"}, ...]
+        Inserts new rows and updates the status of existing (employee, date)
+        rows; invalid rows are reported by index and skipped.
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {"detail": "Expected a list of attendance records."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > BULK_MAX_ROWS:
+            return Response(
+                {"detail": f"At most {BULK_MAX_ROWS} records per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            batch_size = int(request.query_params.get("batch_size", DEFAULT_BATCH_SIZE))
+        except ValueError:
+            batch_size = 0
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            return Response(
+                {"detail": f"batch_size must be an integer between 1 and {MAX_BATCH_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = bulk_upsert_attendance(rows, batch_size=batch_size)
+        return Response(result, status=status.HTTP_200_OK)
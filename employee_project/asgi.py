@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "employee_project.settings")
+# Report API through the async views (reports/async_views.py)
+os.environ.setdefault("ROOT_URLCONF", "employee_project.urls_asgi")
 
 application = get_asgi_application()
@@ -0,0 +1,276 @@
+# employee_project/metrics.py
+"""
+Prometheus text-format metrics without a client library or outside service.
+
+Every process keeps its counters, histograms and gauges in memory
+(`registry`). With settings.METRICS_DIR set, each process also writes them
+to METRICS_DIR/metrics-<pid>.json (atomically, at most every
+METRICS_FLUSH_INTERVAL seconds and at exit), and GET /metrics merges the
+files of all processes, so a scrape that lands on any gunicorn worker sees
+the totals of all of them:
+
+- counters and histograms are summed over every file, including those of
+  workers that have exited (counters must never go backwards); a worker
+  that reuses a dead worker's pid continues from its file
+- gauges are summed over live processes only
+
+Without METRICS_DIR the numbers cover the serving process only.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.http import HttpResponse
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+# name -> (type, help, buckets)
+METRICS = {
+    "http_requests_total": ("counter", "Requests by route, method and status.", None),
+    "http_request_duration_seconds": ("histogram", "Request latency by route.", LATENCY_BUCKETS),
+    "http_response_size_bytes": ("histogram", "Response body size by route.", SIZE_BUCKETS),
+    "http_request_db_queries": ("histogram", "SQL queries per request by route.", QUERY_BUCKETS),
+    "http_requests_in_flight": ("gauge", "Requests currently being served.", None),
+    "cache_requests_total": ("counter", "Cache lookups by cache and result.", None),
+}
+
+
+def _cache_counters():
+    """
+    Hit/miss counters of the in-process caches, read at flush/scrape time.
+    """
+    from employees.authentication import token_cache
+    from reports.cache import report_cache
+
+    values = {}
+    for cache, stats in (("reports", report_cache.stats()), ("token_auth", token_cache.stats())):
+        values[("cache_requests_total", (("cache", cache), ("result", "hit")))] = stats["hits"]
+        values[("cache_requests_total", (("cache", cache), ("result", "miss")))] = stats["misses"]
+    return values
+
+
+class Registry:
+    def __init__(self, collectors=(_cache_counters,)):
+        self._lock = threading.Lock()
+        self._collectors = list(collectors)
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self.counters = {}  # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [bucket counts..., +Inf count, sum]
+        self.gauges = {}
+        self._base_counters = {}  # inherited from a dead process with our pid
+        self._base_histograms = {}
+        self._inherited = False
+        self._last_flush = 0.0
+
+    def _check_fork(self):
+        # State inherited from the parent belongs to the parent
+        if self._pid != os.getpid():
+            self._reset()
+
+    # ─────────── recording ───────────
+
+    def inc(self, name, labels=(), amount=1):
+        key = (name, tuple(labels))
+        with self._lock:
+            self._check_fork()
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        buckets = METRICS[name][2]
+        key = (name, tuple(labels))
+        with self._lock:
+            self._check_fork()
+            row = self.histograms.get(key)
+            if row is None:
+                row = self.histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            row[bisect_left(buckets, value)] += 1
+            row[-1] += value
+
+    def add_gauge(self, name, amount, labels=()):
+        key = (name, tuple(labels))
+        with self._lock:
+            self._check_fork()
+            self.gauges[key] = self.gauges.get(key, 0) + amount
+
+    # ─────────── snapshots ───────────
+
+    def snapshot(self):
+        """
+        This process' state as plain dicts (collectors included).
+        """
+        collected = {}
+        for collector in self._collectors:
+            collected.update(collector())
+        with self._lock:
+            self._check_fork()
+            counters = dict(self._base_counters)
+            for key, value in list(self.counters.items()) + list(collected.items()):
+                counters[key] = counters.get(key, 0) + value
+            histograms = {key: list(row) for key, row in self._base_histograms.items()}
+            for key, row in self.histograms.items():
+                _add_rows(histograms, key, row)
+            gauges = dict(self.gauges)
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    # ─────────── multi-process store ───────────
+
+    def _path(self, directory):
+        return os.path.join(directory, f"metrics-{os.getpid()}.json")
+
+    def flush(self, force=False):
+        directory = getattr(settings, "METRICS_DIR", "")
+        if not directory:
+            return
+        now = time.monotonic()
+        interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0)
+        if not force and now - self._last_flush < interval:
+            return
+        self._last_flush = now
+        path = self._path(directory)
+        if not self._inherited:
+            self._inherit(path)
+        data = _encode(os.getpid(), self.snapshot())
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, path)
+
+    def _inherit(self, path):
+        self._inherited = True
+        previous = _read(path)
+        if previous is not None:
+            with self._lock:
+                self._base_counters = previous["counters"]
+                self._base_histograms = previous["histograms"]
+
+    def collect(self):
+        """
+        Merged state of all processes (or just this one without METRICS_DIR).
+        """
+        directory = getattr(settings, "METRICS_DIR", "")
+        merged = {"counters": {}, "histograms": {}, "gauges": {}}
+        states = [self.snapshot()]
+        if directory:
+            self.flush(force=True)
+            own = self._path(directory)
+            for entry in os.scandir(directory):
+                if not entry.name.startswith("metrics-") or entry.path == own:
+                    continue
+                state = _read(entry.path)
+                if state is None:
+                    continue
+                if not _alive(state["pid"]):
+                    state["gauges"] = {}
+                states.append(state)
+        for state in states:
+            for key, value in state["counters"].items():
+                merged["counters"][key] = merged["counters"].get(key, 0) + value
+            for key, row in state["histograms"].items():
+                _add_rows(merged["histograms"], key, row)
+            for key, value in state["gauges"].items():
+                merged["gauges"][key] = merged["gauges"].get(key, 0) + value
+        return merged
+
+
+def _add_rows(target, key, row):
+    current = target.get(key)
+    if current is None or len(current) != len(row):
+        target[key] = list(row)
+    else:
+        target[key] = [a + b for a, b in zip(current, row)]
+
+
+def _encode(pid, state):
+    return {
+        "pid": pid,
+        **{
+            kind: [[name, [list(pair) for pair in labels], value] for (name, labels), value in values.items()]
+            for kind, values in state.items()
+        },
+    }
+
+
+def _read(path):
+    try:
+        with open(path) as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    state = {"pid": data.get("pid")}
+    for kind in ("counters", "histograms", "gauges"):
+        state[kind] = {
+            (name, tuple(tuple(pair) for pair in labels)): value
+            for name, labels, value in data.get(kind, [])
+        }
+    return state
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, TypeError):
+        return pid is not None
+    return True
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(value) if not value.is_integer() else str(int(value))
+    return str(value)
+
+
+def render(state):
+    """
+    Prometheus text exposition (format 0.0.4) of a collected state.
+    """
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        source = state["histograms"] if kind == "histogram" else state[f"{kind}s"]
+        rows = sorted((labels, value) for (metric, labels), value in source.items() if metric == name)
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in rows:
+            if kind != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets + ("+Inf",), value[:-1]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels, [('le', _number(bound))])} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(value[-1])}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+atexit.register(lambda: registry.flush(force=True))
+
+
+def metrics_view(request):
+    return HttpResponse(render(registry.collect()), content_type=CONTENT_TYPE)
@@ -0,0 +1,319 @@
+# employee_project/middleware.py
+"""
+Sampled per-request instrumentation.
+
+For a sampled request the response gets a Server-Timing header, e.g.
+
+    Server-Timing: pre;dur=0.4, auth;dur=0.2, roles;dur=0.9, db;dur=3.1;desc="4 queries",
+                   view;dur=6.8, render;dur=1.2, total;dur=8.6
+
+and one JSON line is logged to the "employee_project.perf" logger with the
+same phases plus method, path, status, query count and response size.
+
+- pre:    middleware before the view (sessions, auth middleware, ...)
+- view:   the view itself, including auth, roles and most of db
+- render: DRF/template rendering (process_template_response -> rendered)
+- auth / roles: time spent in token authentication and group lookups,
+  reported by employees/authentication.py and employees/roles.py via timed()
+- db:     cumulative SQL time from a connection execute wrapper
+
+PERF_SAMPLE_RATE (0..1) picks the sampled share of requests; the others
+pass straight through, so leaving it on in production costs one random()
+call per unsampled request.
+
+Both middlewares run natively under WSGI and ASGI. SQL is observed by one
+execute wrapper installed on every connection (`install_query_observer`,
+connected in reports/apps.py) that reports to the observers of the current
+request, held in a ContextVar, so queries an async view runs in worker
+threads are counted too.
+"""
+
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from employee_project.metrics import registry
+from reports.slow_queries import current_view, view_label
+
+logger = logging.getLogger("employee_project.perf")
+
+_current = ContextVar("perf_timings", default=None)
+_query_observers = ContextVar("query_observers", default=())
+
+
+class QueryObserver:
+    """
+    connection.execute_wrapper hook; times the statement when the current
+    request has observers (objects with `observe_query(seconds)`).
+    """
+
+    def __call__(self, execute, sql, params, many, context):
+        observers = _query_observers.get()
+        if not observers:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            for observer in observers:
+                observer.observe_query(elapsed)
+
+
+def install_query_observer(sender, connection, **kwargs):
+    """
+    connection_created receiver (connected in reports/apps.py). Installed
+    once per connection rather than around each request, so statements run
+    from any thread the request hands work to are seen.
+    """
+    if not any(isinstance(w, QueryObserver) for w in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, QueryObserver())
+
+
+@contextmanager
+def observing_queries(observer):
+    token = _query_observers.set(_query_observers.get() + (observer,))
+    try:
+        yield
+    finally:
+        _query_observers.reset(token)
+
+
+class RequestTimings:
+    __slots__ = ("phases", "queries", "db_seconds")
+
+    def __init__(self):
+        self.phases = {}
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def observe_query(self, seconds):
+        self.db_seconds += seconds
+        self.queries += 1
+
+
+@contextmanager
+def timed(name):
+    """
+    Add the block's duration to phase `name` of the current sampled request
+    (a no-op outside one).
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def server_timing(timings, total):
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.phases.items()]
+    parts.append(f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.queries} queries"')
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def response_size(response):
+    if getattr(response, "streaming", False):
+        return None
+    return len(response.content)
+
+
+class PerformanceMiddleware:
+    """
+    Place first in MIDDLEWARE so `pre` and `total` cover the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Django would run sync hooks through sync_to_async (a thread hop each)
+            self.process_view = self._aprocess_view
+            self.process_template_response = self._aprocess_template_response
+
+    @property
+    def sample_rate(self):
+        return getattr(settings, "PERF_SAMPLE_RATE", 0.0)
+
+    def _sampled(self):
+        rate = self.sample_rate
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        request._perf_mark, request._perf_phase = start, "pre"
+        try:
+            with observing_queries(timings):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timings, start)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        request._perf_mark, request._perf_phase = start, "pre"
+        try:
+            with observing_queries(timings):
+                response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timings, start)
+
+    def _finish(self, request, response, timings, start):
+        end = time.perf_counter()
+        # close the phase still open (pre if no view ran, view or render otherwise)
+        timings.add(request._perf_phase, end - request._perf_mark)
+        total = end - start
+
+        if getattr(settings, "PERF_SERVER_TIMING", True):
+            response["Server-Timing"] = server_timing(timings, total)
+        self.log(request, response, timings, total)
+        return response
+
+    def _next_phase(self, request, current, following):
+        timings = _current.get()
+        if timings is not None and getattr(request, "_perf_phase", None) == current:
+            now = time.perf_counter()
+            timings.add(current, now - request._perf_mark)
+            request._perf_mark, request._perf_phase = now, following
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self._next_phase(request, "pre", "view")
+        return None
+
+    def process_template_response(self, request, response):
+        self._next_phase(request, "view", "render")
+        return response
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self._next_phase(request, "pre", "view")
+        return None
+
+    async def _aprocess_template_response(self, request, response):
+        self._next_phase(request, "view", "render")
+        return response
+
+    def log(self, request, response, timings, total):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(timings.db_seconds * 1000, 2),
+            "queries": timings.queries,
+            "bytes": response_size(response),
+        }
+        record.update(
+            (f"{name}_ms", round(seconds * 1000, 2)) for name, seconds in timings.phases.items()
+        )
+        logger.info(json.dumps(record))
+
+
+class _QueryCounter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def observe_query(self, seconds):
+        self.count += 1
+
+
+class MetricsMiddleware:
+    """
+    Feeds employee_project.metrics for every request: count, latency,
+    response size and query count per resolved URL name, plus the in-flight
+    gauge. Place it first in MIDDLEWARE. Also names the current view for
+    the slow query log.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter = _QueryCounter()
+        registry.add_gauge("http_requests_in_flight", 1)
+        token = current_view.set(None)
+        start = time.perf_counter()
+        try:
+            with observing_queries(counter):
+                response = self.get_response(request)
+        finally:
+            current_view.reset(token)
+            registry.add_gauge("http_requests_in_flight", -1)
+        self._record(request, response, counter, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        counter = _QueryCounter()
+        registry.add_gauge("http_requests_in_flight", 1)
+        token = current_view.set(None)
+        start = time.perf_counter()
+        try:
+            with observing_queries(counter):
+                response = await self.get_response(request)
+        finally:
+            current_view.reset(token)
+            registry.add_gauge("http_requests_in_flight", -1)
+        self._record(request, response, counter, time.perf_counter() - start)
+        return response
+
+    def _record(self, request, response, counter, elapsed):
+        match = getattr(request, "resolver_match", None)
+        route = (match.view_name if match else None) or "unmatched"
+        registry.inc(
+            "http_requests_total",
+            (("route", route), ("method", request.method), ("status", str(response.status_code))),
+        )
+        registry.observe(
+            "http_request_duration_seconds", elapsed, (("route", route), ("method", request.method))
+        )
+        registry.observe("http_request_db_queries", counter.count, (("route", route),))
+        size = response_size(response)
+        if size is not None:
+            registry.observe("http_response_size_bytes", size, (("route", route),))
+        registry.flush()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        current_view.set(view_label(view_func, request))
+        return None
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        current_view.set(view_label(view_func, request))
+        return None
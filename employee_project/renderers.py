@@ -0,0 +1,224 @@
+# employee_project/renderers.py
+"""
+Response renderers registered in REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].
+
+- FastJSONRenderer (application/json, the default): DRF's JSONRenderer
+  encoded with orjson when it is installed, which handles dicts, lists,
+  dates and datetimes in C. Decimals, lazy strings and the other types
+  DRF's encoder knows go through that encoder's default(). Without orjson,
+  when the client asks for indentation, or when the output holds a float
+  orjson writes in another form (1e16 for 1e+16), DRF's stdlib encoder is
+  used, so the bytes match DRF's. The one difference: NaN and infinities,
+  which DRF refuses to encode, are written as null.
+- MessagePackRenderer (application/msgpack, ?format=msgpack): compact
+  binary encoding of the same data, through the msgpack package when it is
+  installed and a pure-Python encoder producing the same bytes otherwise.
+  Dates and decimals are encoded as in JSON (ISO strings, floats).
+
+Clients choose with the Accept header; */* gets JSON.
+"""
+
+import re
+import struct
+from collections.abc import Mapping
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_encoder = JSONEncoder()
+
+# encoded U+2028 / U+2029, which DRF escapes for JSONP-style embedding
+_LINE_SEPARATOR, _PARAGRAPH_SEPARATOR = "\u2028".encode(), "\u2029".encode()
+
+
+def encode_default(obj):
+    """
+    Types neither orjson nor MessagePack encode natively, as DRF's JSON
+    encoder converts them.
+    """
+    return _encoder.default(obj)
+
+
+# numbers json writes in another form than orjson: orjson writes 1e+16 as
+# 1e16 and 2.5e-05 as 0.000025 (json writes floats as repr() does)
+# one pattern each: an alternation loses the regex engine's fast literal scan
+_MARKERS = (re.compile(rb"e[-\d]"), re.compile(rb"0\.0000"))
+_NUMBER = re.compile(rb"-?\d+(?:\.\d+)?e-?\d+|-?0\.0000\d+")
+_NUMBER_CHARS = frozenset(b"0123456789.-")
+
+
+def _float_at(content, index):
+    """
+    Whether the marker at `index` of orjson's `content` is part of a float
+    (a value, or a dict key converted by OPT_NON_STR_KEYS), not of a string.
+    """
+    start = index
+    while start and content[start - 1] in _NUMBER_CHARS:
+        start -= 1
+    match = _NUMBER.match(content, start)
+    if match is None or match.end() <= index:
+        return False
+    if start == 0 or content[start - 1] in b"[:,":
+        return True
+    return content[start - 1] == ord('"') and content.startswith(b'":', match.end())
+
+
+def _differs_from_stdlib(content):
+    """
+    Whether orjson's `content` holds a float DRF's encoder writes differently.
+    False positives (e.g. ",1e5" inside a string) only cost a fallback.
+    """
+    return any(
+        _float_at(content, match.start())
+        for marker in _MARKERS
+        for match in marker.finditer(content)
+    )
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not api_settings.UNICODE_JSON
+            or not api_settings.COMPACT_JSON
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(
+                data, default=encode_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder accepts
+            return super().render(data, accepted_media_type, renderer_context)
+        if _differs_from_stdlib(content):
+            return super().render(data, accepted_media_type, renderer_context)
+        if _LINE_SEPARATOR in content or _PARAGRAPH_SEPARATOR in content:
+            content = content.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+                _PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        return content
+
+
+# ─────────── MessagePack ───────────
+
+
+_STR_MARKERS = ((0xD9, ">BB", 1 << 8), (0xDA, ">BH", 1 << 16), (0xDB, ">BI", 1 << 32))
+_BIN_MARKERS = ((0xC4, ">BB", 1 << 8), (0xC5, ">BH", 1 << 16), (0xC6, ">BI", 1 << 32))
+_ARRAY_MARKERS = ((0xDC, ">BH", 1 << 16), (0xDD, ">BI", 1 << 32))
+_MAP_MARKERS = ((0xDE, ">BH", 1 << 16), (0xDF, ">BI", 1 << 32))
+_UINT_MARKERS = (
+    (0xCC, ">BB", 1 << 8),
+    (0xCD, ">BH", 1 << 16),
+    (0xCE, ">BI", 1 << 32),
+    (0xCF, ">BQ", 1 << 64),
+)
+# (marker, format, magnitude of the most negative value)
+_INT_MARKERS = (
+    (0xD0, ">Bb", 1 << 7),
+    (0xD1, ">Bh", 1 << 15),
+    (0xD2, ">Bi", 1 << 31),
+    (0xD3, ">Bq", 1 << 63),
+)
+
+
+def _pack_length(out, length, small_marker, small_limit, markers):
+    if length < small_limit:
+        out.append(struct.pack("B", small_marker | length))
+        return
+    for marker, fmt, limit in markers:
+        if length < limit:
+            out.append(struct.pack(fmt, marker, length))
+            return
+    raise ValueError("Object too large for MessagePack.")
+
+
+def _pack_int(out, value):
+    if 0 <= value < 0x80:
+        out.append(struct.pack("B", value))
+    elif -32 <= value < 0:
+        out.append(struct.pack("b", value))
+    elif value >= 0:
+        for marker, fmt, limit in _UINT_MARKERS:
+            if value < limit:
+                out.append(struct.pack(fmt, marker, value))
+                return
+        raise OverflowError("Integer too large for MessagePack.")
+    else:
+        for marker, fmt, limit in _INT_MARKERS:
+            if value >= -limit:
+                out.append(struct.pack(fmt, marker, value))
+                return
+        raise OverflowError("Integer too small for MessagePack.")
+
+
+def _pack(obj, out, depth=0):
+    if depth > 512:
+        raise ValueError("Object nested too deeply for MessagePack.")
+    if obj is None:
+        out.append(b"\xc0")
+    elif obj is True:
+        out.append(b"\xc3")
+    elif obj is False:
+        out.append(b"\xc2")
+    elif isinstance(obj, int):
+        _pack_int(out, obj)
+    elif isinstance(obj, float):
+        out.append(struct.pack(">Bd", 0xCB, obj))
+    elif isinstance(obj, str):
+        encoded = obj.encode("utf-8")
+        _pack_length(out, len(encoded), 0xA0, 32, _STR_MARKERS)
+        out.append(encoded)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        encoded = bytes(obj)
+        _pack_length(out, len(encoded), 0x00, 0, _BIN_MARKERS)
+        out.append(encoded)
+    elif isinstance(obj, (list, tuple)):
+        _pack_length(out, len(obj), 0x90, 16, _ARRAY_MARKERS)
+        for item in obj:
+            _pack(item, out, depth + 1)
+    elif isinstance(obj, Mapping):
+        _pack_length(out, len(obj), 0x80, 16, _MAP_MARKERS)
+        for key, value in obj.items():
+            _pack(key, out, depth + 1)
+            _pack(value, out, depth + 1)
+    else:
+        converted = encode_default(obj)
+        if type(converted) is type(obj):
+            raise TypeError(f"Cannot encode {type(obj).__name__} as MessagePack.")
+        _pack(converted, out, depth + 1)
+
+
+def packb(obj):
+    """
+    MessagePack encoding of `obj` (msgpack.packb's output, without msgpack).
+    """
+    out = []
+    _pack(obj, out)
+    return b"".join(out)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if msgpack is not None:
+            return msgpack.packb(data, default=encode_default, use_bin_type=True)
+        return packb(data)
@@ -70,6 +70,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "employee_project.middleware.MetricsMiddleware",
+    "employee_project.middleware.PerformanceMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -79,7 +81,9 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "employee_project.urls"
+# employee_project/asgi.py defaults this to employee_project.urls_asgi, which
+# serves the report API through the async views of reports/async_views.py
+ROOT_URLCONF = env("ROOT_URLCONF", default="employee_project.urls")
 
 TEMPLATES = [
     {
@@ -107,6 +111,89 @@ DATABASES = {
     "default": env.db(),  # reads DATABASE_URL from .env
 }
 
+# Caches
+# CACHE_URL / REPORTS_CACHE_URL accept any django-environ cache URL, e.g.
+#   locmemcache://reports?max_entries=5000   (per-process LRU, default)
+#   filecache:///var/tmp/report-cache         (shared by processes on one host)
+#   redis://redis:6379/1                      (docker-compose `redis` service)
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+    "reports": env.cache("REPORTS_CACHE_URL", default="locmemcache://reports"),
+}
+
+
+def shared_cache_configured(var):
+    # Anything but a per-process locmem cache is seen by every process
+    return not env.str(var, default="locmemcache://").startswith("locmemcache:")
+
+
+# Report result cache (reports/cache.py): seconds a result is kept, 0 = off.
+# On by default only when REPORTS_CACHE_URL is shared by all processes; a
+# per-process cache would keep serving results other processes invalidated.
+REPORTS_CACHE_ALIAS = "reports"
+REPORTS_CACHE_TIMEOUT = env.int(
+    "REPORTS_CACHE_TIMEOUT",
+    default=60 * 60 * 24 if shared_cache_configured("REPORTS_CACHE_URL") else 0,
+)
+
+# Conditional GET (reports/conditional.py): ETags are derived from the data
+# versions in the report cache, so they are only sent when REPORTS_CACHE_URL
+# is shared by all processes; with a per-process cache another worker could
+# answer 304 for data it never saw change.
+CONDITIONAL_GET = env.bool(
+    "CONDITIONAL_GET", default=shared_cache_configured("REPORTS_CACHE_URL")
+)
+
+# Cross-request role cache (employees/roles.py); 0 keeps it per request only.
+# Only enable it when CACHE_URL points at a cache shared by all processes.
+ROLES_CACHE_ALIAS = "default"
+ROLES_CACHE_TIMEOUT = env.int("ROLES_CACHE_TIMEOUT", default=0)
+
+# Token -> user cache (employees/authentication.py): LRU size and TTL in
+# seconds. Revocations reach other processes through CACHE_URL, so the TTL
+# defaults to 0 (off) unless that cache is shared by all processes.
+TOKEN_AUTH_CACHE_ALIAS = "default"
+TOKEN_AUTH_CACHE_SIZE = env.int("TOKEN_AUTH_CACHE_SIZE", default=10000)
+TOKEN_AUTH_CACHE_TTL = env.int(
+    "TOKEN_AUTH_CACHE_TTL", default=300 if shared_cache_configured("CACHE_URL") else 0
+)
+
+# Per-request instrumentation (employee_project/middleware.py): share of
+# requests that get a Server-Timing header and a log line on the
+# "employee_project.perf" logger (0 = off, 1 = every request).
+PERF_SAMPLE_RATE = env.float("PERF_SAMPLE_RATE", default=0.01)
+PERF_SERVER_TIMING = env.bool("PERF_SERVER_TIMING", default=True)
+
+# Prometheus metrics (GET /metrics, employee_project/metrics.py). With several
+# worker processes set METRICS_DIR to a directory writable by all of them
+# (cleared on deploy); each worker writes its counters there at most every
+# METRICS_FLUSH_INTERVAL seconds and /metrics sums them.
+METRICS_DIR = env("METRICS_DIR", default="")
+METRICS_FLUSH_INTERVAL = env.float("METRICS_FLUSH_INTERVAL", default=1.0)
+
+# Slow query log (reports/slow_queries.py): statements taking at least
+# SLOW_QUERY_MS (-1 = off) are kept in a per-process ring buffer and, with
+# SLOW_QUERY_LOG_FILE, appended as JSON lines for `manage.py top_queries`.
+SLOW_QUERY_MS = env.float("SLOW_QUERY_MS", default=200)
+SLOW_QUERY_BUFFER_SIZE = env.int("SLOW_QUERY_BUFFER_SIZE", default=500)
+SLOW_QUERY_LOG_FILE = env("SLOW_QUERY_LOG_FILE", default="")
+SLOW_QUERY_LOG_MAX_BYTES = env.int("SLOW_QUERY_LOG_MAX_BYTES", default=10 * 1024 * 1024)
+SLOW_QUERY_LOG_BACKUPS = env.int("SLOW_QUERY_LOG_BACKUPS", default=5)
+
+# Background report jobs (reports/jobs.py): a job still running after
+# REPORT_JOB_LEASE seconds is assumed lost with its worker and requeued
+# (0 = never requeue).
+REPORT_JOB_LEASE = env.int("REPORT_JOB_LEASE", default=600)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "employee_project.perf": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
+
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = env("EMAIL_HOST")
 EMAIL_PORT = env("EMAIL_PORT")
@@ -157,13 +244,20 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "employees.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
         #'rest_framework.authtoken.authentication.TokenAuthentication',
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # orjson / MessagePack when installed, pure-Python fallbacks otherwise
+    # (employee_project/renderers.py); chosen by the Accept header
+    "DEFAULT_RENDERER_CLASSES": [
+        "employee_project.renderers.FastJSONRenderer",
+        "employee_project.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": [
@@ -172,3 +266,17 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
     ],
 }
+
+# In-process trigram index for ?search= on /api/employees/ (non-PostgreSQL
+# databases, employees/search.py). Other processes learn about writes through
+# CACHE_URL, so it is on by default only when that cache is shared. Up to
+# EMPLOYEE_SEARCH_MAX_CANDIDATES matches are passed to the query as pks.
+EMPLOYEE_SEARCH_INDEX = env.bool("EMPLOYEE_SEARCH_INDEX", default=shared_cache_configured("CACHE_URL"))
+EMPLOYEE_SEARCH_MAX_CANDIDATES = env.int("EMPLOYEE_SEARCH_MAX_CANDIDATES", default=500)
+
+# Largest ?page_size= accepted by ?pagination=keyset (employees/pagination.py)
+KEYSET_MAX_PAGE_SIZE = env.int("KEYSET_MAX_PAGE_SIZE", default=1000)
+
+# Employee, attendance and performance lists read rows with values_list() and
+# a compiled serializer (employees/fastpath.py); False uses DRF's per-field path
+FAST_LIST_SERIALIZATION = env.bool("FAST_LIST_SERIALIZATION", default=True)
@@ -6,6 +6,8 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from employee_project.metrics import metrics_view
+
 # 1) Import DRF ViewSets
 from employees.views import EmployeeViewSet, DepartmentViewSet
 from attendance.views import AttendanceViewSet
@@ -18,8 +20,12 @@ from reports.views import (
     MonthlyAttendanceChartView,
     EmployeesPerDepartmentAPIView,           # ← newly added
     MonthlyAttendanceOverviewAPIView,         # ← newly added
+    TimeSeriesAPIView,
+    ReportCacheStatsAPIView,
 )
 
+from reports.job_views import ReportJobDetailAPIView, ReportJobListAPIView
+
 # 3) Import template‐rendering endpoints
 from reports.views import (
     attendance_chart_view,
@@ -83,6 +89,26 @@ urlpatterns = [
         MonthlyAttendanceOverviewAPIView.as_view(),
         name="monthly-attendance-overview-api",
     ),
+    path(
+        "api/reports/timeseries/",
+        TimeSeriesAPIView.as_view(),
+        name="timeseries-api",
+    ),
+    path(
+        "api/reports/cache-stats/",
+        ReportCacheStatsAPIView.as_view(),
+        name="report-cache-stats-api",
+    ),
+    path(
+        "api/reports/jobs/",
+        ReportJobListAPIView.as_view(),
+        name="report-job-list",
+    ),
+    path(
+        "api/reports/jobs/<int:pk>/",
+        ReportJobDetailAPIView.as_view(),
+        name="report-job-detail",
+    ),
 
     # ───────── template‐rendered report pages ─────────
     path(
@@ -106,6 +132,9 @@ urlpatterns = [
         name="monthly-attendance-overview",
     ),
 
+    # ───────── Prometheus metrics ─────────
+    path("metrics", metrics_view, name="metrics"),
+
     # ───────── Swagger / OpenAPI ─────────
     path(
         "api/swagger<str:format>",
@@ -0,0 +1,35 @@
+# employee_project/urls_asgi.py
+"""
+URLconf used by employee_project/asgi.py: employee_project/urls.py with the
+report API views swapped for their async variants (reports/async_views.py).
+Paths and URL names are unchanged, so reverse() gives the same URLs.
+"""
+
+from django.urls import path
+
+from reports.async_views import (
+    AsyncAveragePerformanceByDepartmentView,
+    AsyncEmployeesPerDepartmentAPIView,
+    AsyncMonthlyAttendanceChartView,
+    AsyncMonthlyAttendanceOverviewAPIView,
+    AsyncMonthlyAttendanceRateByDepartmentView,
+    AsyncTimeSeriesAPIView,
+)
+
+from .urls import urlpatterns as wsgi_urlpatterns
+
+ASYNC_VIEWS = {
+    "average-performance-by-department": AsyncAveragePerformanceByDepartmentView,
+    "monthly-attendance-rate-by-department": AsyncMonthlyAttendanceRateByDepartmentView,
+    "monthly-attendance-chart-api": AsyncMonthlyAttendanceChartView,
+    "employees-per-department-api": AsyncEmployeesPerDepartmentAPIView,
+    "monthly-attendance-overview-api": AsyncMonthlyAttendanceOverviewAPIView,
+    "timeseries-api": AsyncTimeSeriesAPIView,
+}
+
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name)
+    if getattr(pattern, "name", None) in ASYNC_VIEWS
+    else pattern
+    for pattern in wsgi_urlpatterns
+]
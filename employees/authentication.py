@@ -0,0 +1,177 @@
+# employees/authentication.py
+"""
+Token authentication with an in-process token -> user cache.
+
+DRF's TokenAuthentication joins Token and User on every request. The cache
+here keeps the resolved (user, token) pair in a bounded LRU with a TTL, so
+steady-state authenticated requests issue no auth queries at all.
+
+Invalidation (receivers in employees/signals.py):
+  - a Token is deleted or saved (rotation) -> entries of its user are dropped
+  - a User is saved (e.g. deactivated) or deleted -> entries of that user
+    are dropped
+
+Each drop also bumps that user's generation counter in the
+settings.TOKEN_AUTH_CACHE_ALIAS cache; entries from an older generation are
+treated as misses, which is how other processes learn about revocations when
+that cache is shared (Redis). A per-process cache cannot tell other
+processes, so settings.TOKEN_AUTH_CACHE_TTL defaults to 0 (cache off) unless
+CACHE_URL is shared.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+
+from employee_project.middleware import timed
+
+def _generation_key(user_id):
+    return f"token-auth:generation:{user_id}"
+
+
+def _fresh_generation():
+    # Time-based so a counter evicted from the cache never restarts at a
+    # value an older entry was stored with.
+    return time.time_ns()
+
+
+class TokenUserCache:
+    def __init__(self, max_entries=None, ttl=None, alias=None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._alias = alias
+        self._entries = OrderedDict()  # key -> (user, token, expires, user's generation)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_entries(self):
+        if self._max_entries is not None:
+            return self._max_entries
+        return getattr(settings, "TOKEN_AUTH_CACHE_SIZE", 10000)
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, "TOKEN_AUTH_CACHE_TTL", 0)
+
+    @property
+    def backend(self):
+        return caches[self._alias or getattr(settings, "TOKEN_AUTH_CACHE_ALIAS", "default")]
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.ttl > 0
+
+    def generation(self, user_id):
+        key = _generation_key(user_id)
+        generation = self.backend.get(key)
+        if generation is None:
+            self.backend.add(key, _fresh_generation(), timeout=None)
+            generation = self.backend.get(key)
+        return generation
+
+    def get(self, key):
+        """
+        (user copy, token) for a cached key, or None.
+        """
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        # the generation lives in the shared backend: look it up unlocked
+        valid = (
+            entry is not None
+            and entry[2] > now
+            and entry[3] == self.generation(entry[0].pk)
+        )
+        with self._lock:
+            if not valid:
+                if entry is not None and self._entries.get(key) is entry:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        # A fresh copy per request, so per-request memos (e.g. roles) never leak
+        return copy.copy(entry[0]), entry[1]
+
+    def put(self, key, user, token):
+        if not self.enabled:
+            return
+        entry = (copy.copy(user), token, time.monotonic() + self.ttl, self.generation(user.pk))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id):
+        """
+        Drop every entry of this user here, and everywhere else via the
+        user's shared generation counter.
+        """
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry[0].pk == user_id]:
+                del self._entries[key]
+        key = _generation_key(user_id)
+        try:
+            self.backend.incr(key)
+        except ValueError:
+            self.backend.set(key, _fresh_generation(), timeout=None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            size, evictions = len(self._entries), self.evictions
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "size": size,
+            "evictions": evictions,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+token_cache = TokenUserCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for TokenAuthentication backed by `token_cache`.
+    Inactive users and unknown tokens are never cached.
+    """
+
+    def authenticate(self, request):
+        with timed("auth"):
+            return super().authenticate(request)
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+        user, token = super().authenticate_credentials(key)
+        token_cache.put(key, user, token)
+        return user, token
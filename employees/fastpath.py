@@ -0,0 +1,236 @@
+# employees/fastpath.py
+"""
+Fast read-only list serialization.
+
+For a page of rows DRF builds a model instance per row, then asks every
+field for get_attribute() and to_representation(). For the field types
+ModelSerializer generates for this project that amounts to reading a
+column (and calling isoformat() on dates), so `compile_serializer()` turns
+a serializer into:
+
+- `paths`: the values_list() lookups its readable fields read (a nested
+  serializer becomes `relation__field`, a primary key relation its FK
+  column)
+- `convert(rows)`: a generated function mapping those tuples to the dicts
+  DRF would produce, same keys in the same order, so the rendered JSON is
+  byte-identical
+
+Serializers using anything else (SerializerMethodField, hyperlinks,
+source="*", model properties, a to_representation() override) are not
+compiled, and FastListMixin falls back to the regular list().
+"""
+
+import datetime
+import threading
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+from .fieldsets import ordering_columns
+
+# to_representation() returns the database value unchanged
+_IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+# to_representation() depends only on the value and the field's options
+_VALUE_FIELDS = (
+    serializers.ChoiceField,
+    serializers.DateField,
+    serializers.DateTimeField,
+    serializers.DecimalField,
+    serializers.DurationField,
+    serializers.FloatField,
+    serializers.JSONField,
+    serializers.TimeField,
+    serializers.UUIDField,
+)
+_UNSUPPORTED = object()
+_CACHE_SIZE = 256
+
+
+class RowSerializer:
+    __slots__ = ("paths", "convert", "source")
+
+    def __init__(self, paths, convert, source):
+        self.paths = paths
+        self.convert = convert
+        self.source = source
+
+
+def _resolve(model, source):
+    """
+    (values_list lookup, model field) for a dotted serializer source, or
+    None unless every step is a concrete field and every relation crossed
+    is non-null (a missing row would make DRF skip the field).
+    """
+    parts = source.split(".")
+    for position, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        if position < len(parts) - 1:
+            if not field.is_relation or field.null:
+                return None
+            model = field.related_model
+    return "__".join(parts), field
+
+
+def _converter(field):
+    """
+    None when the value passes through unchanged, a callable, or _UNSUPPORTED.
+    """
+    kind = type(field)
+    if kind in _IDENTITY_FIELDS:
+        return None
+    if kind is serializers.DateField and getattr(field, "format", api_settings.DATE_FORMAT) == ISO_8601:
+        return datetime.date.isoformat
+    if kind is serializers.ChoiceField and all(
+        key == value for key, value in field.choice_strings_to_values.items()
+    ):
+        return None  # string choices map to themselves
+    if kind in _VALUE_FIELDS:
+        return field.to_representation
+    return _UNSUPPORTED
+
+
+def _has_custom_representation(serializer):
+    return type(serializer).to_representation is not serializers.Serializer.to_representation
+
+
+class _Plan:
+    def __init__(self):
+        self.paths = []
+        self.functions = {}
+
+    def column(self, lookup):
+        if lookup not in self.paths:
+            self.paths.append(lookup)
+        return self.paths.index(lookup)
+
+    def function(self, convert):
+        name = f"_f{len(self.functions)}"
+        self.functions[name] = convert
+        return name
+
+
+def _dict_source(fields, model, prefix, plan):
+    """
+    Python source of a dict display reading `row`, or None.
+    """
+    items = []
+    for name, field in fields.items():
+        if field.write_only:
+            continue
+        source = field.source or name
+        resolved = None if source == "*" else _resolve(model, source)
+        if resolved is None:
+            return None
+        lookup, model_field = resolved
+        value = f"row[{plan.column(prefix + lookup)}]"
+        if isinstance(field, serializers.BaseSerializer):
+            if (
+                isinstance(field, serializers.ListSerializer)
+                or not model_field.is_relation
+                or _has_custom_representation(field)
+            ):
+                return None
+            nested = _dict_source(field.fields, model_field.related_model, f"{prefix}{lookup}__", plan)
+            if nested is None:
+                return None
+            expression = f"None if {value} is None else {nested}"
+        elif model_field.is_relation:
+            if type(field) is not serializers.PrimaryKeyRelatedField or field.pk_field is not None:
+                return None
+            expression = value
+        else:
+            convert = _converter(field)
+            if convert is _UNSUPPORTED:
+                return None
+            if convert is None:
+                expression = value
+            else:
+                expression = f"None if {value} is None else {plan.function(convert)}({value})"
+        items.append(f"{name!r}: {expression}")
+    return "{" + ", ".join(items) + "}"
+
+
+def _compile(serializer):
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    if not isinstance(serializer, serializers.ModelSerializer) or _has_custom_representation(serializer):
+        return None
+    plan = _Plan()
+    display = _dict_source(serializer.fields, serializer.Meta.model, "", plan)
+    if display is None:
+        return None
+    source = f"def convert(rows):\n    return [{display} for row in rows]\n"
+    namespace = dict(plan.functions)
+    exec(compile(source, f"<fastpath {type(serializer).__name__}>", "exec"), namespace)
+    return RowSerializer(tuple(plan.paths), namespace["convert"], source)
+
+
+_compiled = {}
+_lock = threading.Lock()
+
+
+def compile_serializer(serializer):
+    """
+    RowSerializer for `serializer` (with its current, possibly sparse, set
+    of fields), or None if it cannot be compiled. Cached per serializer
+    class and field set.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    key = (type(serializer), tuple(serializer.fields))
+    try:
+        return _compiled[key]
+    except KeyError:
+        pass
+    compiled = _compile(serializer)
+    with _lock:
+        if len(_compiled) >= _CACHE_SIZE:
+            _compiled.clear()
+        _compiled[key] = compiled
+    return compiled
+
+
+class FastListMixin:
+    """
+    Opt-in fast path for list() on a ModelViewSet: the filtered queryset is
+    read with values_list() and each page is mapped by the compiled
+    serializer. Filtering, ordering and (keyset or page-number) pagination
+    are unchanged. settings.FAST_LIST_SERIALIZATION = False turns it off.
+    """
+
+    def get_row_serializer(self):
+        if not getattr(settings, "FAST_LIST_SERIALIZATION", True):
+            return None
+        return compile_serializer(self.get_serializer())
+
+    def list(self, request, *args, **kwargs):
+        compiled = self.get_row_serializer()
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        paths = list(compiled.paths)
+        # keyset pagination reads the ordering values (and id) from the rows
+        for column in sorted(ordering_columns(queryset, self) | {"id"}):
+            if column not in paths:
+                paths.append(column)
+        rows = queryset.values_list(*paths, named=True)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.convert(page))
+        return Response(compiled.convert(rows))
@@ -0,0 +1,186 @@
+# employees/fieldsets.py
+"""
+Sparse fieldsets: `?fields=id,name` and `?exclude=address` on GET.
+
+The serializer renders only the chosen fields, and the view narrows the
+queryset to match, so unrequested columns and joins never leave the
+database:
+
+- plain model fields become `.only()` columns
+- a relation rendered as a primary key loads just the foreign key column
+- a nested serializer (or a dotted `source`) adds `select_related()` for
+  that relation only, with the nested fields as `relation__column`
+- columns the view needs besides the output (ordering values read by
+  keyset pagination, `object_permission_columns` on detail routes) are
+  always loaded
+
+Fields that are not model fields (annotations listed in
+`sparse_annotated_fields` excepted) leave the columns unpruned, since
+nothing says what they read. Writes ignore both parameters.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def _names(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Drops every field not in context["sparse_fieldset"] (when set).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fieldset = self.context.get("sparse_fieldset")
+        if fieldset is not None:
+            for name in list(self.fields):
+                if name not in fieldset:
+                    self.fields.pop(name)
+
+
+def _relation(model, name):
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None, None
+    return field, field.related_model if field.is_relation else None
+
+
+def model_columns(fields, model, prefix=""):
+    """
+    (columns, select_related paths) read by serializer `fields` on `model`,
+    or None if any of them reads something other than model fields.
+    """
+    columns, related = set(), set()
+    for name, field in fields.items():
+        source = field.source or name
+        if source == "*":
+            return None
+        path = source.split(".")
+        field_model = model
+        for position, part in enumerate(path):
+            model_field, related_model = _relation(field_model, part)
+            if model_field is None or model_field.many_to_many or model_field.one_to_many:
+                return None
+            lookup = prefix + "__".join(path[: position + 1])
+            columns.add(lookup)
+            if related_model is None:
+                break
+            if position == len(path) - 1:
+                if isinstance(field, serializers.BaseSerializer):
+                    nested = model_columns(field.get_fields(), related_model, lookup + "__")
+                    if nested is None:
+                        return None
+                    related.add(lookup)
+                    columns |= nested[0]
+                    related |= nested[1]
+                # else: rendered as a primary key, the FK column suffices
+            else:
+                related.add(lookup)
+                field_model = related_model
+    return columns, related
+
+
+def ordering_columns(queryset, view):
+    """
+    Model fields the rows of `queryset` are ordered by (including the view's
+    `keyset_ordering`), whose values keyset pagination reads from the rows.
+    """
+    ordering = [str(field) for field in queryset.query.order_by]
+    ordering += list(getattr(view, "keyset_ordering", ()))
+    columns = set()
+    for field in ordering:
+        name = field.lstrip("-")
+        if name not in ("pk", "?") and _relation(queryset.model, name)[0] is not None:
+            columns.add(name)
+    return columns
+
+
+class SparseFieldsetMixin:
+    """
+    Add to a ModelViewSet whose serializer uses SparseFieldsetSerializerMixin.
+
+    - `sparse_annotated_fields`: serializer fields read from queryset
+      annotations, which need no columns
+    - `object_permission_columns`: columns (`relation__column` allowed)
+      that has_object_permission reads, loaded on detail routes
+    """
+
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    sparse_annotated_fields = ()
+    object_permission_columns = ()
+
+    def get_sparse_fieldset(self):
+        """
+        Names of the fields to render, in serializer order, or None for all.
+        """
+        if hasattr(self, "_sparse_fieldset"):
+            return self._sparse_fieldset
+        self._sparse_fieldset = None
+        request = getattr(self, "request", None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        requested = _names(request.query_params.get(self.fields_query_param, ""))
+        excluded = _names(request.query_params.get(self.exclude_query_param, ""))
+        if not requested and not excluded:
+            return None
+
+        fields = self.get_serializer_class()().get_fields()
+        available = [name for name, field in fields.items() if not field.write_only]
+        errors = {}
+        for param, names in ((self.fields_query_param, requested), (self.exclude_query_param, excluded)):
+            unknown = [name for name in names if name not in available]
+            if unknown:
+                errors[param] = [
+                    f"Unknown field(s): {', '.join(unknown)}. Choose from: {', '.join(available)}."
+                ]
+        if errors:
+            raise ValidationError(errors)
+        self._sparse_fieldset = [
+            name for name in available if (not requested or name in requested) and name not in excluded
+        ]
+        return self._sparse_fieldset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["sparse_fieldset"] = self.get_sparse_fieldset()
+        return context
+
+    def sparse_queryset(self, queryset):
+        """
+        `queryset` loading only the columns and joins the fieldset reads.
+        """
+        fieldset = self.get_sparse_fieldset()
+        if fieldset is None:
+            return queryset
+        fields = self.get_serializer_class()().get_fields()
+        selected = {
+            name: fields[name] for name in fieldset if name not in self.sparse_annotated_fields
+        }
+        needed = model_columns(selected, queryset.model)
+        if needed is None:
+            return queryset
+        columns, related = needed
+        columns |= ordering_columns(queryset, self)
+        if self.detail:
+            for column in self.object_permission_columns:
+                parts = column.split("__")
+                related.update("__".join(parts[:i]) for i in range(1, len(parts)))
+                columns.update("__".join(parts[:i]) for i in range(1, len(parts) + 1))
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*(columns or {"pk"}))
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in ("list", "retrieve"):
+            queryset = self.sparse_queryset(queryset)
+        return queryset
@@ -5,16 +5,23 @@ import csv
 import string
 import secrets
 import random
+import time
 from datetime import date, timedelta
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User, Group
+from django.contrib.auth.hashers import make_password
 from rest_framework.authtoken.models import Token
 from django.conf import settings
+from django.db import transaction
 
 from employees.models import Department, Employee
+from employees import seeding
+from employees.search import employee_search_index
 from attendance.models import Attendance
 from performance.models import Performance
+from reports.cache import report_cache
+from reports.stats import rebuild_department_stats
 
 from faker import Faker
 
@@ -59,9 +66,38 @@ class Command(BaseCommand):
             default=5,
             help="Maximum Performance reviews per Employee (default: 5)",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="High-volume mode: bulk_create in chunks, one shared password hash",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for reproducible data (--bulk default: 0)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes generating rows in --bulk mode (default: CPU count)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows per bulk_create batch in --bulk mode (default: 5000)",
+        )
 
     def handle(self, *args, **options):
+        if options["bulk"]:
+            return self.handle_bulk(options)
+
         fake = Faker()
+        if options["seed"] is not None:
+            random.seed(options["seed"])
+            fake.seed_instance(options["seed"])
         num_departments = options["num_departments"]
         num_employees = options["num_employees"]
         attendance_days = options["attendance_days"]
@@ -178,10 +214,176 @@ class Command(BaseCommand):
             for review_date in chosen_dates:
                 rating = random.randint(1, 5)
                 Performance.objects.create(
-                    employee=emp, review_date=review_date, rating=rating
+                    employee=emp,
+                    review_date=review_date,
+                    rating=rating,
+                    comment=fake.paragraph(nb_sentences=3),
                 )
         self.stdout.write(self.style.SUCCESS("Seeded Performance records."))
 
+        self.create_staff_users(fake, groups, credentials)
+        self.write_credentials(credentials)
+
+    def handle_bulk(self, options):
+        """
+        --bulk: generate rows in a process pool and write them with
+        bulk_create in chunks. All seeded employees share one password, so it
+        is hashed once; usernames/emails are derived from (seed, index)
+        instead of being checked one by one.
+        """
+        seed = options["seed"] if options["seed"] is not None else 0
+        workers = max(1, options["workers"])
+        chunk_size = options["chunk_size"]
+        num_employees = options["num_employees"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        prefix = f"s{seed}_"
+        if User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(
+                f"Users from --seed {seed} already exist; pick another --seed."
+            )
+
+        fake = Faker()
+        fake.seed_instance(seed)
+        today = date.today()
+        started = time.perf_counter()
+
+        groups = {
+            name: Group.objects.get_or_create(name=name)[0]
+            for name in ["Admin", "HR", "Employee"]
+        }
+        department_ids = sorted(
+            {
+                Department.objects.get_or_create(name=fake.company()[:10])[0].id
+                for _ in range(options["num_departments"])
+            }
+        )
+
+        alphabet = string.ascii_letters + string.digits
+        password = "".join(secrets.choice(alphabet) for _ in range(12))
+        password_hash = make_password(password)
+        Membership = User.groups.through
+
+        # 1) Users, group memberships, tokens and employees, chunk by chunk
+        phase = time.perf_counter()
+        credentials = []
+        tasks = [
+            (seed, start, min(start + chunk_size, num_employees), department_ids, today)
+            for start in range(0, num_employees, chunk_size)
+        ]
+        for rows in seeding.generate(seeding.employee_rows, tasks, workers):
+            with transaction.atomic():
+                User.objects.bulk_create(
+                    [User(username=row[0], email=row[1], password=password_hash) for row in rows]
+                )
+                user_ids = dict(
+                    User.objects.filter(username__in=[row[0] for row in rows]).values_list(
+                        "username", "id"
+                    )
+                )
+                Membership.objects.bulk_create(
+                    [
+                        Membership(user_id=user_ids[row[0]], group_id=groups["Employee"].id)
+                        for row in rows
+                    ]
+                )
+                tokens = [Token(key=Token.generate_key(), user_id=user_ids[row[0]]) for row in rows]
+                Token.objects.bulk_create(tokens)
+                Employee.objects.bulk_create(
+                    [
+                        Employee(
+                            user_id=user_ids[username],
+                            name=name,
+                            email=email,
+                            phone_number=phone,
+                            address=address,
+                            date_of_joining=doj,
+                            department_id=department_id,
+                        )
+                        for username, email, name, phone, address, doj, department_id in rows
+                    ]
+                )
+            credentials.extend(
+                (row[0], password, token.key, "Employee") for row, token in zip(rows, tokens)
+            )
+        self.report_rate("Employees (with users and tokens)", num_employees, phase)
+
+        # Ordered by department so each attendance chunk touches few rollup cells
+        employee_ids = list(
+            Employee.objects.filter(user__username__startswith=prefix)
+            .order_by("department_id", "id")
+            .values_list("id", flat=True)
+        )
+
+        # 2) Attendance, one generated day at a time
+        phase = time.perf_counter()
+        attendance_count = 0
+        tasks = [
+            (seed, today - timedelta(days=i), employee_ids)
+            for i in range(options["attendance_days"])
+        ]
+        for rows in seeding.generate(seeding.attendance_rows, tasks, workers):
+            for start in range(0, len(rows), chunk_size):
+                # Each chunk's bulk_create refreshes its DailyAttendanceRollup cells
+                with transaction.atomic():
+                    Attendance.objects.bulk_create(
+                        [
+                            Attendance(employee_id=employee_id, date=day, status=status)
+                            for employee_id, day, status in rows[start:start + chunk_size]
+                        ]
+                    )
+            attendance_count += len(rows)
+        self.report_rate("Attendance", attendance_count, phase)
+
+        # 3) Performance reviews
+        phase = time.perf_counter()
+        performance_count = 0
+        tasks = [
+            (
+                seed,
+                start,
+                employee_ids[start:start + chunk_size],
+                today,
+                options["min_reviews"],
+                options["max_reviews"],
+            )
+            for start in range(0, len(employee_ids), chunk_size)
+        ]
+        for rows in seeding.generate(seeding.performance_rows, tasks, workers):
+            Performance.objects.bulk_create(
+                [
+                    Performance(employee_id=employee_id, review_date=review_date, rating=rating)
+                    for employee_id, review_date, rating in rows
+                ],
+                batch_size=chunk_size,
+            )
+            performance_count += len(rows)
+        self.report_rate("Performance", performance_count, phase)
+
+        # bulk_create skips the post_save receivers that keep DepartmentStats
+        # and the report cache versions up to date
+        rebuild_department_stats(department_ids)
+        report_cache.bump("employee", "department", "performance", "attendance")
+        employee_search_index.invalidate()
+
+        self.create_staff_users(fake, groups, credentials)
+        self.write_credentials(credentials)
+        self.report_rate(
+            "Total",
+            num_employees * 4 + attendance_count + performance_count,
+            started,
+        )
+
+    def report_rate(self, label, rows, started):
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{label}: {rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/sec)"
+            )
+        )
+
+    def create_staff_users(self, fake, groups, credentials):
         # 6) Create a single HR user (username = "hr_user")
         hr_username = "hr_user"
         if User.objects.filter(username=hr_username).exists():
@@ -219,6 +421,7 @@ class Command(BaseCommand):
             credentials.append((admin_username, admin_password, admin_token_obj.key, "Admin"))
             self.stdout.write(self.style.SUCCESS(f"Created Admin user '{admin_username}'"))
 
+    def write_credentials(self, credentials):
         # 8) Write CSV to project root
         base_dir = settings.BASE_DIR
         csv_path = os.path.join(base_dir, "user_credentials.csv")
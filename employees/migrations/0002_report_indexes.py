@@ -0,0 +1,20 @@
+# Generated by Django 4.2.4 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["date_of_joining", "department"],
+                name="employee_joined_dept_idx",
+            ),
+        ),
+    ]
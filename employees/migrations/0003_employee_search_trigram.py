@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# Expression indexes matching what `name__icontains` / `email__icontains`
+# compile to on PostgreSQL: UPPER("col"::text) LIKE UPPER('%term%')
+TRIGRAM_INDEXES = {
+    "employee_name_trgm_idx": "name",
+    "employee_email_trgm_idx": "email",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return  # other databases use the in-process index in employees/search.py
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "employees_employee" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0002_report_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -1,13 +1,18 @@
 from django.db import models
 
 # Create your models here.
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User  # import the built-in User model
 
 
 class Department(models.Model):
     name = models.CharField(max_length=10, unique=True)
 
+    def save(self, *args, **kwargs):
+        # Its DepartmentStats row (reports/signals.py) is created atomically
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -31,6 +36,20 @@ class Employee(models.Model):
         Department, on_delete=models.CASCADE, related_name="employees"
     )
 
+    class Meta:
+        indexes = [
+            # Hiring time series: date range grouped by department
+            models.Index(
+                fields=["date_of_joining", "department"], name="employee_joined_dept_idx"
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # post_save moves headcount / rollups between departments;
+        # commit that together with the row itself
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
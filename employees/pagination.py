@@ -0,0 +1,197 @@
+# employees/pagination.py
+"""
+Keyset (cursor) pagination for large list endpoints.
+
+Page-number pagination costs an OFFSET scan plus a COUNT(*) per page. The
+keyset mode instead remembers the ordering values of the last row of a page
+in an opaque cursor and asks for rows strictly after it, e.g. for
+?ordering=-date:
+
+    WHERE date < :d OR (date = :d AND id < :id)  ORDER BY date DESC, id DESC
+
+so every page is an index range scan of `page_size + 1` rows, no matter how
+deep it is. `id` is always appended as a tiebreaker, which makes the order
+total and the cursor unambiguous.
+
+Search results are ordered by a computed relevance score (`search_rank`,
+see performance/search.py), which is no column to seek on; keyset pages of
+a search follow the view's `keyset_ordering` instead, unless ?ordering=
+picks a column.
+"""
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    ?cursor=<opaque>&page_size=N, ordered by the queryset's ordering (as set
+    by OrderingFilter) or the view's `keyset_ordering`, plus `id`.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor."
+    # orderings set by the search filters, replaced by `keyset_ordering`
+    search_ordering_fields = ("search_rank",)
+
+    @property
+    def page_size(self):
+        return settings.REST_FRAMEWORK.get("PAGE_SIZE") or 10
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, "KEYSET_MAX_PAGE_SIZE", 1000)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset, view):
+        ordering = [str(field) for field in queryset.query.order_by]
+        if any(field.lstrip("-") in self.search_ordering_fields for field in ordering):
+            ordering = []
+        if not ordering:
+            ordering = list(getattr(view, "keyset_ordering", ["id"]))
+        allowed = set(getattr(view, "ordering_fields", None) or []) | {"id", "pk"}
+        for field in ordering:
+            if field.lstrip("-") not in allowed:
+                raise NotFound(f"Keyset pagination cannot order by '{field}'.")
+        ordering = ["-id" if f == "-pk" else "id" if f == "pk" else f for f in ordering]
+        if not {"id", "-id"} & set(ordering):
+            # Same direction as the last key, so one composite index serves the scan
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return ordering
+
+    # ─────────── cursors ───────────
+
+    def encode_cursor(self, ordering, values, reverse):
+        payload = {"o": ordering, "v": values, "r": int(reverse)}
+        raw = json.dumps(payload, separators=(",", ":"), default=str)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request, ordering):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            values, reverse = payload["v"], bool(payload["r"])
+            if payload["o"] != ordering or len(values) != len(ordering):
+                raise ValueError
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def _position_filter(self, model, ordering, values, reverse):
+        """
+        Rows after `values` in `ordering` (before them when reverse).
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            try:
+                value = model._meta.get_field(name).to_python(value)
+            except Exception:
+                raise NotFound(self.invalid_cursor_message)
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    # ─────────── BasePagination API ───────────
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset, view)
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request, self.ordering)
+        values, reverse = cursor if cursor else (None, False)
+
+        order_by = self.ordering
+        if reverse:
+            order_by = [f[1:] if f.startswith("-") else f"-{f}" for f in order_by]
+        queryset = queryset.order_by(*order_by)
+        if values is not None:
+            queryset = queryset.filter(
+                self._position_filter(queryset.model, self.ordering, values, reverse)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+        self.page = rows
+        return rows
+
+    def _row_values(self, row):
+        return [getattr(row, field.lstrip("-")) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor(self.ordering, self._row_values(self.page[-1]), False)
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if not self.page:
+            return remove_query_param(url, self.cursor_query_param)
+        cursor = self.encode_cursor(self.ordering, self._row_values(self.page[0]), True)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    The default page-number pagination, or KeysetPagination when the client
+    asks for it with ?pagination=keyset (or follows a ?cursor= link).
+    """
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if params.get("pagination") == "keyset" or KeysetPagination.cursor_query_param in params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
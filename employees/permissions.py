@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from .roles import ADMIN, EMPLOYEE, HR, has_role, is_staff_role
+
 
 class IsAdminGroup(permissions.BasePermission):
     """
@@ -8,11 +10,7 @@ class IsAdminGroup(permissions.BasePermission):
 
     def has_permission(self, request, view):
         user = request.user
-        return (
-            user
-            and user.is_authenticated
-            and user.groups.filter(name="Admin").exists()
-        )
+        return has_role(user, ADMIN)
 
 
 class IsHRGroup(permissions.BasePermission):
@@ -22,7 +20,7 @@ class IsHRGroup(permissions.BasePermission):
 
     def has_permission(self, request, view):
         user = request.user
-        return user and user.is_authenticated and user.groups.filter(name="HR").exists()
+        return has_role(user, HR)
 
 
 class IsEmployeeSelfOrHRorAdmin(permissions.BasePermission):
@@ -38,11 +36,11 @@ class IsEmployeeSelfOrHRorAdmin(permissions.BasePermission):
             return False
 
         # If user is in Admin or HR, allow all view-level access (list, create, etc.)
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # If user is in the Employee group, allow view-level (object checks happen below)
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             return True
 
         # Otherwise, deny
@@ -53,13 +51,13 @@ class IsEmployeeSelfOrHRorAdmin(permissions.BasePermission):
         user = request.user
 
         # Admin and HR can do anything
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # Employee can only operate on their own Employee record
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             # CORRECTION: obj is already an Employee, so `obj.user` is the related User
-            return obj.user == user
+            return obj.user_id == user.pk
 
         return False
 
@@ -81,11 +79,11 @@ class IsAttendanceSelfOrHRorAdmin(permissions.BasePermission):
             return False
 
         # Admin or HR may list/create attendance
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # Employee may list (object-level filtering occurs below)
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             return True
 
         return False
@@ -95,13 +93,14 @@ class IsAttendanceSelfOrHRorAdmin(permissions.BasePermission):
         user = request.user
 
         # Admin and HR can do anything
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # Employee can only view/edit their own attendance
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             # obj.employee.user is the User who owns this attendance
-            return obj.employee.user == user
+            # (compare ids so the User row is not fetched)
+            return obj.employee.user_id == user.pk
 
         return False
 
@@ -119,11 +118,11 @@ class IsPerformanceSelfOrHRorAdmin(permissions.BasePermission):
             return False
 
         # Admin or HR may list/create performance
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # Employee may list (object-level filtering occurs below)
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             return True
 
         return False
@@ -133,12 +132,13 @@ class IsPerformanceSelfOrHRorAdmin(permissions.BasePermission):
         user = request.user
 
         # Admin and HR can do anything
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
+        if is_staff_role(user):
             return True
 
         # Employee can only view/edit their own performance
-        if user.groups.filter(name="Employee").exists():
+        if has_role(user, EMPLOYEE):
             # obj.employee.user is the User who owns this performance entry
-            return obj.employee.user == user
+            # (compare ids so the User row is not fetched)
+            return obj.employee.user_id == user.pk
 
         return False
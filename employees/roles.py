@@ -0,0 +1,110 @@
+# employees/roles.py
+"""
+Role (auth Group name) resolution shared by the permission classes and
+viewsets.
+
+`get_roles(user)` loads the user's group names with one query and memoizes
+them on the user object, which DRF keeps for the whole request, so every
+later permission check / get_queryset call in that request is free.
+
+With settings.ROLES_CACHE_TIMEOUT > 0 the names are also kept in the
+settings.ROLES_CACHE_ALIAS cache across requests. Entries are dropped when
+the user's groups change (m2m_changed) and all of them are invalidated when
+a Group is renamed or deleted (see employees/signals.py). Only enable it
+with a cache shared by every process (e.g. Redis); a per-process locmem
+cache cannot see invalidations from other processes.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+
+from employee_project.middleware import timed
+
+ADMIN = "Admin"
+HR = "HR"
+EMPLOYEE = "Employee"
+STAFF_ROLES = (ADMIN, HR)
+
+_GENERATION_KEY = "roles:generation"
+
+
+def _cache_timeout():
+    return getattr(settings, "ROLES_CACHE_TIMEOUT", 0)
+
+
+def _cache():
+    return caches[getattr(settings, "ROLES_CACHE_ALIAS", "default")]
+
+
+def _cache_key(user_id, generation):
+    return f"roles:{generation}:{user_id}"
+
+
+def _load(user):
+    return frozenset(user.groups.values_list("name", flat=True))
+
+
+def get_roles(user):
+    """
+    Frozen set of the user's group names (empty for anonymous users).
+    """
+    if not user or not user.is_authenticated:
+        return frozenset()
+
+    roles = getattr(user, "_role_names", None)
+    if roles is not None:
+        return roles
+
+    with timed("roles"):
+        if _cache_timeout():
+            cache = _cache()
+            generation = cache.get_or_set(_GENERATION_KEY, 1, timeout=None)
+            key = _cache_key(user.pk, generation)
+            roles = cache.get(key)
+            if roles is None:
+                roles = _load(user)
+                cache.set(key, roles, _cache_timeout())
+        else:
+            roles = _load(user)
+
+    user._role_names = roles
+    return roles
+
+
+def has_role(user, *names):
+    """
+    True if the user is in any of the given groups.
+    """
+    return not get_roles(user).isdisjoint(names)
+
+
+def is_staff_role(user):
+    """
+    Admin or HR: may see and manage every record.
+    """
+    return has_role(user, *STAFF_ROLES)
+
+
+def forget_roles(user_ids):
+    """
+    Drop cached roles for these users (after their groups changed).
+    """
+    if not _cache_timeout():
+        return
+    cache = _cache()
+    generation = cache.get(_GENERATION_KEY)
+    if generation is not None:
+        cache.delete_many([_cache_key(pk, generation) for pk in user_ids])
+
+
+def forget_all_roles():
+    """
+    Invalidate every cached entry (after a Group rename/delete).
+    """
+    if not _cache_timeout():
+        return
+    cache = _cache()
+    try:
+        cache.incr(_GENERATION_KEY)
+    except ValueError:
+        cache.set(_GENERATION_KEY, 1, timeout=None)
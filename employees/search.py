@@ -0,0 +1,260 @@
+# employees/search.py
+"""
+Employee directory search behind `?search=` on /api/employees/.
+
+- PostgreSQL: `name`/`email` ILIKE '%term%' served by trigram GIN indexes
+  (pg_trgm, migration 0003), ranked by trigram similarity to the query.
+- Other databases: the substring filters, ranked in SQL like the
+  PostgreSQL path. With settings.EMPLOYEE_SEARCH_INDEX an in-process
+  trigram index {trigram: {employee ids}}, built on first use, first narrows
+  the scan to the matching primary keys. Employee post_save/post_delete
+  (employees/signals.py) update it and bump a generation counter in the
+  default cache, as do writes that bypass signals (bulk_create, update())
+  through `employee_search_index.invalidate()`; other processes rebuild when
+  they see a new generation. That only works when the default cache is
+  shared, so the index is off by default otherwise.
+
+Both backends keep SearchFilter's semantics: every whitespace-separated term
+must be a case-insensitive substring of the name or the email. Search never
+truncates: the other filters of the view and the paginator's count see every
+match.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from rest_framework.filters import SearchFilter
+
+from .models import Employee
+
+_GENERATION_KEY = "employee-search:generation"
+
+
+def trigrams(text):
+    text = f"  {text.lower()} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _max_candidates():
+    return getattr(settings, "EMPLOYEE_SEARCH_MAX_CANDIDATES", 500)
+
+
+def _fresh_generation():
+    # Time-based so a counter evicted from the cache never restarts at a
+    # value an index was already built for.
+    return time.time_ns()
+
+
+class TrigramIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = None  # trigram -> set of ids
+        self._documents = {}  # id -> (lowercase name, lowercase email)
+        self._generation = None
+
+    @property
+    def backend(self):
+        return caches["default"]
+
+    def _current_generation(self):
+        generation = self.backend.get(_GENERATION_KEY)
+        if generation is None:
+            self.backend.add(_GENERATION_KEY, _fresh_generation(), timeout=None)
+            generation = self.backend.get(_GENERATION_KEY)
+        return generation
+
+    def _bump(self):
+        """
+        New generation, making every other process rebuild; None when the
+        counter had to be reset.
+        """
+        try:
+            return self.backend.incr(_GENERATION_KEY)
+        except ValueError:
+            self.backend.set(_GENERATION_KEY, _fresh_generation(), timeout=None)
+            return None
+
+    def _advance(self, generation):
+        """
+        Whether the local index may apply a write itself under the new
+        `generation`: only when no other write happened since it was built.
+        Otherwise it is dropped and rebuilt on next use. Call with the lock.
+        """
+        if self._postings is None:
+            return False
+        if generation is None or generation - 1 != self._generation:
+            self._postings = None
+            return False
+        self._generation = generation
+        return True
+
+    def _build(self):
+        postings, documents = {}, {}
+        for pk, name, email in Employee.objects.values_list("pk", "name", "email").iterator(
+            chunk_size=5000
+        ):
+            documents[pk] = (name.lower(), email.lower())
+            for gram in trigrams(name) | trigrams(email):
+                postings.setdefault(gram, set()).add(pk)
+        self._postings, self._documents = postings, documents
+
+    def _ensure(self):
+        generation = self._current_generation()
+        with self._lock:
+            if self._postings is None or generation != self._generation:
+                self._build()
+                self._generation = generation
+
+    def _remove(self, pk):
+        document = self._documents.pop(pk, None)
+        if document is None:
+            return
+        for gram in trigrams(document[0]) | trigrams(document[1]):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(pk)
+                if not ids:
+                    del self._postings[gram]
+
+    def update(self, pk, name, email):
+        generation = self._bump()
+        with self._lock:
+            if not self._advance(generation):
+                return  # (re)built on next search
+            self._remove(pk)
+            self._documents[pk] = (name.lower(), email.lower())
+            for gram in trigrams(name) | trigrams(email):
+                self._postings.setdefault(gram, set()).add(pk)
+
+    def remove(self, pk):
+        generation = self._bump()
+        with self._lock:
+            if self._advance(generation):
+                self._remove(pk)
+
+    def invalidate(self):
+        """
+        Rebuild on next use, in every process sharing the default cache.
+        """
+        self._bump()
+        with self._lock:
+            self._postings = None
+
+    def _candidates(self, terms):
+        """
+        Ids holding every trigram of every term, or None if all terms are
+        too short for the index (then every document is a candidate).
+        """
+        grams = set()
+        for term in terms:
+            # the padded edges of `term` are not part of a substring match
+            grams |= {gram for gram in trigrams(term) if " " not in (gram[0], gram[-1])}
+        if not grams:
+            return None
+        # Smallest posting lists first: the running intersection stays small
+        sets = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            if not result:
+                break
+            result.intersection_update(ids)
+        return result
+
+    def search(self, terms):
+        """
+        Ids of every employee matching every term, best first (name prefix,
+        then name substring, then email only; ties by id).
+        """
+        self._ensure()
+        terms = [term.lower() for term in terms if term]
+        with self._lock:
+            candidates = self._candidates(terms)
+            if candidates is None:
+                candidates = self._documents.keys()
+            scored = []
+            for pk in candidates:
+                name, email = self._documents[pk]
+                score = 0
+                for term in terms:
+                    if name.startswith(term):
+                        score += 3
+                    elif term in name:
+                        score += 2
+                    elif term in email:
+                        score += 1
+                    else:
+                        break
+                else:
+                    scored.append((-score, pk))
+        scored.sort()
+        return [pk for _, pk in scored]
+
+
+employee_search_index = TrigramIndex()
+
+
+def match_score(terms):
+    """
+    SQL relevance of a row matching every term, scored like
+    TrigramIndex.search(): per term 3 for a name prefix, 2 for a name
+    substring, 1 for an email-only match.
+    """
+    scores = [
+        Case(
+            When(name__istartswith=term, then=Value(3)),
+            When(name__icontains=term, then=Value(2)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+        for term in terms
+    ]
+    total = scores[0]
+    for score in scores[1:]:
+        total = total + score
+    return total
+
+
+def search_employees(queryset, terms):
+    """
+    `queryset` narrowed to employees matching all `terms`, ordered by
+    relevance (then pk).
+    """
+    for term in terms:
+        queryset = queryset.filter(Q(name__icontains=term) | Q(email__icontains=term))
+
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        query = " ".join(terms)
+        return queryset.annotate(
+            search_rank=TrigramSimilarity("name", query) + TrigramSimilarity("email", query)
+        ).order_by("-search_rank", "pk")
+
+    if getattr(settings, "EMPLOYEE_SEARCH_INDEX", False):
+        ids = employee_search_index.search(terms)
+        if not ids:
+            return queryset.none()
+        if len(ids) <= _max_candidates():
+            # The index narrows the scan to a few pks; the substring filters
+            # above re-check them, so an entry left stale by a rolled-back
+            # write cannot match. Larger sets are left to those filters.
+            queryset = queryset.filter(pk__in=ids)
+    return queryset.annotate(search_rank=match_score(terms)).order_by("-search_rank", "pk")
+
+
+class EmployeeSearchFilter(SearchFilter):
+    """
+    SearchFilter for the employee directory: same `?search=` parameter,
+    answered by the indexed backends above and ordered by relevance
+    (unless ?ordering= is given).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_employees(queryset, terms)
@@ -0,0 +1,98 @@
+# employees/seeding.py
+"""
+Row generators for `seed_data --bulk`.
+
+Everything here is plain Python (no ORM access), so it can run in worker
+processes. Each task gets its own Random/Faker seeded from (seed, task
+index), which makes the generated data independent of the worker count.
+"""
+
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from faker import Faker
+
+
+STATUSES = ("present", "absent", "late")
+
+
+def _rng(seed, stream, index):
+    return random.Random(f"{seed}:{stream}:{index}")
+
+
+def username_for(seed, index):
+    # Zero-padded so that ordering by username gives creation order
+    return f"s{seed}_{index:08d}"
+
+
+def employee_rows(seed, start, stop, department_ids, today):
+    """
+    (username, email, name, phone, address, date_of_joining, department_id)
+    for employee indexes [start, stop).
+    """
+    rng = _rng(seed, "employee", start)
+    fake = Faker()
+    fake.seed_instance(rng.getrandbits(32))
+    rows = []
+    for index in range(start, stop):
+        rows.append(
+            (
+                username_for(seed, index),
+                f"s{seed}.{index}@example.com",
+                fake.first_name()[:10],
+                fake.msisdn()[:10],
+                fake.address()[:100],
+                today - timedelta(days=rng.randrange(730)),
+                rng.choice(department_ids),
+            )
+        )
+    return rows
+
+
+def attendance_rows(seed, day, employee_ids):
+    """
+    (employee_id, date, status) for every employee on one day; generating
+    day by day keeps each insert chunk on few dates, so the rollup refresh
+    triggered by bulk_create stays cheap.
+    """
+    rng = _rng(seed, "attendance", day.toordinal())
+    return [(employee_id, day, rng.choice(STATUSES)) for employee_id in employee_ids]
+
+
+def performance_rows(seed, start, employee_ids, today, min_reviews, max_reviews):
+    """
+    (employee_id, review_date, rating) with distinct review dates per employee
+    within the last year.
+    """
+    rng = _rng(seed, "performance", start)
+    rows = []
+    for employee_id in employee_ids:
+        count = rng.randint(min_reviews, max_reviews)
+        for offset in rng.sample(range(366), k=min(count, 366)):
+            rows.append((employee_id, today - timedelta(days=offset), rng.randint(1, 5)))
+    return rows
+
+
+def generate(func, tasks, workers):
+    """
+    Yield func(*task) for each task, in order.
+
+    With workers > 1 the tasks run in a process pool, but at most
+    2 * workers results are in flight so memory stays bounded while the
+    caller writes to the database.
+    """
+    if workers <= 1:
+        for task in tasks:
+            yield func(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(func, *task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
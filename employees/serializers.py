@@ -1,14 +1,15 @@
 from rest_framework import serializers
+from .fieldsets import SparseFieldsetSerializerMixin
 from .models import Employee, Department
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Department
         fields = ["id", "name"]
 
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     department = DepartmentSerializer(read_only=True)
     department_id = serializers.PrimaryKeyRelatedField(
         queryset=Department.objects.all(), source="department", write_only=True
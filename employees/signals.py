@@ -0,0 +1,65 @@
+from django.contrib.auth.models import Group, User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache
+from .models import Employee
+from .roles import forget_all_roles, forget_roles
+from .search import employee_search_index
+
+
+# ─────────── role cache invalidation (employees/roles.py) ───────────
+
+@receiver(m2m_changed, sender=User.groups.through)
+def forget_roles_on_group_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear", "pre_clear"):
+        return
+
+    if not reverse:
+        # user.groups.add/remove/clear(...)
+        instance.__dict__.pop("_role_names", None)
+        forget_roles([instance.pk])
+    elif pk_set is not None:
+        # group.user_set.add/remove(...)
+        forget_roles(pk_set)
+    elif action == "pre_clear":
+        # group.user_set.clear(): pk_set is not provided, collect members first
+        forget_roles(list(instance.user_set.values_list("pk", flat=True)))
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def forget_roles_on_group_rename_or_delete(sender, created=False, **kwargs):
+    if not created:
+        forget_all_roles()
+
+
+# ─────────── token -> user cache invalidation (employees/authentication.py) ───────────
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def forget_cached_token(sender, instance, **kwargs):
+    token_cache.invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login; anything else (e.g. is_active) may revoke access
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    token_cache.invalidate_user(instance.pk)
+
+
+# ─────────── employee search index (employees/search.py) ───────────
+
+@receiver(post_save, sender=Employee)
+def index_employee(sender, instance, raw=False, **kwargs):
+    if not raw:
+        employee_search_index.update(instance.pk, instance.name, instance.email)
+
+
+@receiver(post_delete, sender=Employee)
+def unindex_employee(sender, instance, **kwargs):
+    employee_search_index.remove(instance.pk)
@@ -0,0 +1,129 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from employees.search import TrigramIndex, employee_search_index, trigrams
+
+
+@override_settings(EMPLOYEE_SEARCH_INDEX=True)
+class EmployeeSearchTests(APITestCase):
+    def setUp(self):
+        employee_search_index.invalidate()
+        self.dept = Department.objects.create(name="EngDept")
+        hr_group = Group.objects.create(name="HR")
+        hr_user = User.objects.create_user(username="hr", password="pass123")
+        hr_group.user_set.add(hr_user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Token " + Token.objects.create(user=hr_user).key
+        )
+        self.people = {
+            name: self.make(name, email)
+            for name, email in [
+                ("Marian", "m.k@example.com"),
+                ("Ann Mari", "ann@example.com"),
+                ("Bob", "mariana@corp.io"),
+                ("Carol", "carol@example.com"),
+            ]
+        }
+        self.url = reverse("employee-list")
+
+    def make(self, name, email, department=None):
+        return Employee.objects.create(
+            name=name,
+            email=email,
+            date_of_joining="2024-01-01",
+            department=department or self.dept,
+            user=User.objects.create_user(username=email, password="pass123"),
+        )
+
+    def search(self, term, **params):
+        response = self.client.get(self.url, {"search": term, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["name"] for row in response.data["results"]]
+
+    def test_substring_search_ranked_by_relevance(self):
+        # name prefix, then name substring, then email only
+        self.assertEqual(self.search("mari"), ["Marian", "Ann Mari", "Bob"])
+
+    def test_every_term_must_match(self):
+        self.assertEqual(self.search("ann example"), ["Ann Mari"])
+        self.assertEqual(self.search("carol corp"), [])
+
+    def test_short_terms_and_explicit_ordering(self):
+        self.assertEqual(self.search("ob"), ["Bob"])
+        self.assertEqual(self.search("mari", ordering="name"), ["Ann Mari", "Bob", "Marian"])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.search("mari")  # builds the index
+        carol = self.people["Carol"]
+        carol.name = "Marie"
+        carol.save()
+        self.people["Bob"].delete()
+        self.make("Xavier", "mari.x@example.com")
+        self.assertEqual(self.search("mari"), ["Marian", "Marie", "Ann Mari", "Xavier"])
+
+    def test_search_uses_one_employee_query(self):
+        self.search("mari")
+        with CaptureQueriesContext(connection) as context:
+            self.search("carol")
+        employee_queries = [
+            q["sql"] for q in context.captured_queries if 'FROM "employees_employee"' in q["sql"]
+        ]
+        # page + count, both limited to the pks found by the index
+        self.assertEqual(len(employee_queries), 2)
+
+    def test_other_filters_apply_before_any_limit(self):
+        other = Department.objects.create(name="Ops")
+        for i in range(3):
+            self.make(f"Mario{i}", f"mario{i}@example.com", department=other)
+        with override_settings(EMPLOYEE_SEARCH_MAX_CANDIDATES=2):
+            response = self.client.get(self.url, {"search": "mari", "department__name": "EngDept"})
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            [row["name"] for row in response.data["results"]], ["Marian", "Ann Mari", "Bob"]
+        )
+        with override_settings(EMPLOYEE_SEARCH_MAX_CANDIDATES=2):
+            self.assertEqual(self.client.get(self.url, {"search": "mari"}).data["count"], 6)
+
+    def test_same_ranking_without_the_index(self):
+        with override_settings(EMPLOYEE_SEARCH_INDEX=False):
+            self.assertEqual(self.search("mari"), ["Marian", "Ann Mari", "Bob"])
+            self.assertEqual(self.search("ann example"), ["Ann Mari"])
+
+    def test_writes_reach_indexes_of_other_processes(self):
+        elsewhere = TrigramIndex()  # another process sharing the default cache
+        self.assertEqual(len(elsewhere.search(["mari"])), 3)
+        self.make("Marisol", "sol@example.com")
+        self.people["Bob"].delete()
+        self.assertEqual(len(elsewhere.search(["mari"])), 3)
+        self.assertIn(self.people["Marian"].pk, elsewhere.search(["mari"]))
+
+
+class TrigramIndexTests(APITestCase):
+    def test_trigrams_are_padded_like_pg_trgm(self):
+        self.assertEqual(trigrams("Ab"), {"  a", " ab", "ab "})
+
+    def test_rebuilds_after_invalidation_elsewhere(self):
+        dept = Department.objects.create(name="D")
+        index = TrigramIndex()
+        Employee.objects.create(
+            name="Zed", email="zed@x.io", date_of_joining="2024-01-01", department=dept,
+            user=User.objects.create_user(username="zed"),
+        )
+        self.assertEqual(len(index.search(["zed"])), 1)
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    name="Zedd", email="zedd@x.io", date_of_joining="2024-01-01", department=dept,
+                    user=User.objects.create_user(username="zedd"),
+                )
+            ]
+        )
+        self.assertEqual(len(index.search(["zed"])), 1)
+        employee_search_index.invalidate()  # bumps the shared generation
+        self.assertEqual(len(index.search(["zed"])), 2)
@@ -0,0 +1,117 @@
+# employees/tests/test_fastpath.py
+
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from attendance.models import Attendance
+from attendance.serializers import AttendanceSerializer
+from employees.fastpath import compile_serializer
+from employees.models import Department, Employee
+from employees.serializers import EmployeeSerializer
+from performance.models import Performance
+from performance.serializers import PerformanceSerializer
+from reports.benchmark import serializer_benchmark
+
+
+class FastListSerializationTests(APITestCase):
+    def setUp(self):
+        hr_group = Group.objects.create(name="HR")
+        Group.objects.create(name="Employee")
+        hr_user = User.objects.create_user(username="hr", password="password")
+        hr_group.user_set.add(hr_user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=hr_user).key)
+
+        eng = Department.objects.create(name="EngDept")
+        ops = Department.objects.create(name="Ops")
+        self.employees = [
+            Employee.objects.create(
+                name=f"Emp {i}", email=f"emp{i}@example.com", phone_number=f"555000{i:04d}",
+                address=f'{i} "Quoted" Street\nFlat é', date_of_joining=date(2024, 1, 1 + i),
+                department=eng if i % 2 else ops, user=User.objects.create_user(username=f"emp{i}"),
+            )
+            for i in range(6)
+        ]
+        for employee in self.employees:
+            for day in range(1, 4):
+                Attendance.objects.create(
+                    employee=employee, date=date(2025, 5, day),
+                    status=("present", "absent", "late")[day % 3],
+                )
+            Performance.objects.create(
+                employee=employee, review_date=date(2025, 4, 1), rating=3,
+                comment=f"Review of {employee.name} <ok>",
+            )
+
+    def assertIdentical(self, url, **params):
+        with override_settings(FAST_LIST_SERIALIZATION=False):
+            slow = self.client.get(url, params)
+        with CaptureQueriesContext(connection) as queries:
+            fast = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+        return fast, queries
+
+    def test_lists_render_byte_identical_json(self):
+        for name in ("employee-list", "attendance-list", "performance-list"):
+            with self.subTest(name):
+                self.assertIdentical(reverse(name), page_size=50)
+
+    def test_identical_with_filters_ordering_and_sparse_fields(self):
+        self.assertIdentical(reverse("employee-list"), ordering="-date_of_joining", fields="id,department")
+        self.assertIdentical(reverse("employee-list"), search="emp 1")
+        self.assertIdentical(reverse("attendance-list"), status="late", exclude="employee")
+        self.assertIdentical(reverse("performance-list"), include="comment")
+
+    def test_identical_keyset_pages_and_cursors(self):
+        url = reverse("attendance-list")
+        fast, _ = self.assertIdentical(url, pagination="keyset", ordering="-date", page_size=4)
+        self.assertIsNotNone(fast.data["next"])
+        self.assertIdentical(fast.data["next"])
+
+    def test_fast_path_reads_tuples_without_model_instances(self):
+        _, queries = self.assertIdentical(reverse("employee-list"), fields="id,name")
+        select = [q["sql"] for q in queries.captured_queries if 'FROM "employees_employee"' in q["sql"]][-1]
+        self.assertNotIn('"address"', select)
+
+    def test_search_snippet_falls_back_to_drf(self):
+        fast, _ = self.assertIdentical(reverse("performance-list"), search="review")
+        self.assertIn("<mark>", fast.data["results"][0]["search_snippet"])
+
+    def test_compiled_paths(self):
+        compiled = compile_serializer(EmployeeSerializer())
+        self.assertEqual(
+            compiled.paths,
+            ("id", "name", "email", "phone_number", "address", "date_of_joining",
+             "department", "department__id", "department__name", "user"),
+        )
+        self.assertEqual(compile_serializer(AttendanceSerializer()).paths, ("id", "employee", "date", "status"))
+        self.assertIs(compile_serializer(EmployeeSerializer()), compiled)
+
+    def test_unsupported_serializers_are_not_compiled(self):
+        class Computed(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Employee
+                fields = ["id", "label"]
+
+            def get_label(self, obj):
+                return obj.name
+
+        self.assertIsNone(compile_serializer(Computed()))
+        self.assertIsNone(compile_serializer(PerformanceSerializer(context={"search": True})))
+
+    def test_serializer_benchmark_is_identical(self):
+        results = serializer_benchmark(rows=50, repeat=1)
+        self.assertEqual({row["serializer"] for row in results}, {"attendance", "performance", "employee"})
+        for row in results:
+            self.assertTrue(row["identical"], row)
+            self.assertGreater(row["drf_ms"], 0)
@@ -0,0 +1,114 @@
+import json
+import os
+import re
+import tempfile
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employee_project.metrics import Registry, registry
+from employees.models import Department
+
+
+def sample(text, name, **labels):
+    """
+    Value of one sample line in a text exposition, or None.
+    """
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = re.match(r"(\w+)(?:\{(.*)\})? (\S+)$", line)
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2) or ""))
+        if match.group(1) == name and found == {k: str(v) for k, v in labels.items()}:
+            return float(match.group(3))
+    return None
+
+
+class MetricsEndpointTests(APITestCase):
+    def setUp(self):
+        registry._reset()
+        Department.objects.create(name="EngDept")
+        hr_group = Group.objects.create(name="HR")
+        user = User.objects.create_user(username="hr", password="pass123")
+        hr_group.user_set.add(user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+
+    def tearDown(self):
+        registry._reset()
+
+    def test_per_route_metrics(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get(reverse("department-list")).status_code, 200)
+        self.client.get("/no-such-page/")
+
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+
+        self.assertEqual(
+            sample(text, "http_requests_total", route="department-list", method="GET", status=200), 3
+        )
+        self.assertEqual(
+            sample(text, "http_requests_total", route="unmatched", method="GET", status=404), 1
+        )
+        self.assertEqual(
+            sample(
+                text, "http_request_duration_seconds_bucket",
+                route="department-list", method="GET", le="+Inf",
+            ),
+            3,
+        )
+        self.assertEqual(
+            sample(text, "http_request_db_queries_count", route="department-list"), 3
+        )
+        self.assertEqual(sample(text, "http_response_size_bytes_count", route="department-list"), 3)
+        # the scrape itself is in flight
+        self.assertEqual(sample(text, "http_requests_in_flight"), 1)
+        self.assertIsNotNone(sample(text, "cache_requests_total", cache="token_auth", result="hit"))
+        self.assertIn("# TYPE http_request_duration_seconds histogram", text)
+
+
+class MultiProcessStoreTests(APITestCase):
+    def write_worker(self, directory, pid, requests, in_flight):
+        with open(os.path.join(directory, f"metrics-{pid}.json"), "w") as fh:
+            json.dump(
+                {
+                    "pid": pid,
+                    "counters": [
+                        ["http_requests_total", [["route", "x"], ["method", "GET"], ["status", "200"]], requests]
+                    ],
+                    "histograms": [],
+                    "gauges": [["http_requests_in_flight", [], in_flight]],
+                },
+                fh,
+            )
+
+    def test_counters_sum_over_all_workers_and_gauges_over_live_ones(self):
+        local = Registry(collectors=())
+        with tempfile.TemporaryDirectory() as tmp, override_settings(METRICS_DIR=tmp):
+            self.write_worker(tmp, os.getppid(), requests=5, in_flight=2)  # alive
+            self.write_worker(tmp, 2**22 + 12345, requests=7, in_flight=3)  # exited
+            local.inc("http_requests_total", (("route", "x"), ("method", "GET"), ("status", "200")))
+            local.add_gauge("http_requests_in_flight", 1)
+
+            state = local.collect()
+            key = ("http_requests_total", (("route", "x"), ("method", "GET"), ("status", "200")))
+            self.assertEqual(state["counters"][key], 13)
+            self.assertEqual(state["gauges"][("http_requests_in_flight", ())], 3)
+            self.assertTrue(os.path.exists(os.path.join(tmp, f"metrics-{os.getpid()}.json")))
+
+    def test_reused_pid_continues_from_previous_file(self):
+        with tempfile.TemporaryDirectory() as tmp, override_settings(METRICS_DIR=tmp):
+            self.write_worker(tmp, os.getpid(), requests=4, in_flight=9)
+            local = Registry(collectors=())
+            local.inc("http_requests_total", (("route", "x"), ("method", "GET"), ("status", "200")))
+            local.flush(force=True)
+
+            state = local.collect()
+            key = ("http_requests_total", (("route", "x"), ("method", "GET"), ("status", "200")))
+            self.assertEqual(state["counters"][key], 5)
+            self.assertEqual(state["gauges"], {})
@@ -0,0 +1,66 @@
+import json
+import re
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.authentication import token_cache
+from employees.models import Department
+
+
+def timing_entries(header):
+    """
+    {name: (duration ms, desc)} from a Server-Timing header.
+    """
+    entries = {}
+    for part in header.split(", "):
+        match = re.match(r'(\w+);dur=([\d.]+)(?:;desc="([^"]*)")?$', part)
+        entries[match.group(1)] = (float(match.group(2)), match.group(3))
+    return entries
+
+
+class PerformanceMiddlewareTests(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        Department.objects.create(name="EngDept")
+        hr_group = Group.objects.create(name="HR")
+        self.user = User.objects.create_user(username="hr", password="pass123")
+        hr_group.user_set.add(self.user)
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        self.url = reverse("department-list")
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    def test_sampled_request_gets_server_timing_and_log_line(self):
+        with self.assertLogs("employee_project.perf", "INFO") as logs:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        entries = timing_entries(response["Server-Timing"])
+        for phase in ("pre", "auth", "roles", "view", "render", "db", "total"):
+            self.assertIn(phase, entries)
+        queries = int(entries["db"][1].split()[0])
+        self.assertGreater(queries, 0)
+        self.assertLessEqual(entries["view"][0], entries["total"][0])
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["path"], self.url)
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["queries"], queries)
+        self.assertEqual(record["bytes"], len(response.content))
+        self.assertIn("auth_ms", record)
+
+    @override_settings(PERF_SAMPLE_RATE=1.0, PERF_SERVER_TIMING=False)
+    def test_header_can_be_disabled(self):
+        with self.assertLogs("employee_project.perf", "INFO"):
+            response = self.client.get(self.url)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(PERF_SAMPLE_RATE=0)
+    def test_unsampled_request_is_untouched(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,150 @@
+# employees/tests/test_renderers.py
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import Group, User
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from attendance.models import Attendance
+from employee_project import renderers
+from employee_project.renderers import FastJSONRenderer, MessagePackRenderer, packb
+from employees.models import Department, Employee
+from reports.benchmark import renderer_benchmark
+
+
+class PackbTests(SimpleTestCase):
+    def test_scalars_use_the_smallest_encoding(self):
+        cases = [
+            (None, b"\xc0"),
+            (True, b"\xc3"),
+            (False, b"\xc2"),
+            (5, b"\x05"),
+            (-3, b"\xfd"),
+            (200, b"\xcc\xc8"),
+            (-200, b"\xd1\xff\x38"),
+            (70000, b"\xce\x00\x01\x11\x70"),
+            (2**40, b"\xcf\x00\x00\x01\x00\x00\x00\x00\x00"),
+            (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+            ("é", b"\xa2\xc3\xa9"),
+            ("x" * 40, b"\xd9\x28" + b"x" * 40),
+            (b"\x00\x01", b"\xc4\x02\x00\x01"),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(packb(value), expected)
+
+    def test_containers(self):
+        self.assertEqual(packb([1, [2]]), b"\x92\x01\x91\x02")
+        self.assertEqual(packb({"a": None}), b"\x81\xa1a\xc0")
+        self.assertEqual(packb(list(range(16)))[:3], b"\xdc\x00\x10")
+        self.assertEqual(packb({str(i): i for i in range(16)})[:3], b"\xde\x00\x10")
+
+    def test_other_types_are_converted_like_json(self):
+        self.assertEqual(packb(date(2025, 5, 1)), packb("2025-05-01"))
+        self.assertEqual(packb(Decimal("2.5")), packb(2.5))
+        with self.assertRaises(TypeError):
+            packb(object())
+
+    @skipUnless(renderers.msgpack, "msgpack is not installed")
+    def test_matches_msgpack(self):
+        data = {"id": 1, "values": [0, -1, 255, -129, 2**33, 0.1, "text", None, True], "nested": {"x": []}}
+        self.assertEqual(packb(data), renderers.msgpack.packb(data, use_bin_type=True))
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    data = {
+        "id": 1,
+        "name": "Zoë \u2028 \"quoted\"",
+        "date": date(2025, 5, 1),
+        "amount": Decimal("12.50"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "rate": 85.71428571428571,
+        "rows": [{"status": "present"}, None, True],
+        7: "int key",
+    }
+
+    def test_same_bytes_as_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_floats_in_exponent_form_match_drf(self):
+        for value in (1e16, -3.03e19, 1.5e300, 1e-7, 2.5e-05, Decimal("1E+20")):
+            with self.subTest(value=value):
+                data = {"value": value, "values": [0.1, value]}
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_float_keys_in_exponent_form_match_drf(self):
+        data = {1e16: "big", 2.5e-05: "small"}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    @skipUnless(renderers.orjson, "orjson is not installed")
+    def test_exponent_like_strings_do_not_fall_back(self):
+        data = {"code": "1e5", "id": "12345678-1e34-5678-9e12-567812345678", "rate": 0.0001}
+        with mock.patch.object(JSONRenderer, "render") as stdlib_render:
+            FastJSONRenderer().render(data)
+        stdlib_render.assert_not_called()
+
+    @skipUnless(renderers.orjson, "orjson is not installed")
+    def test_non_finite_floats_are_written_as_null(self):
+        # DRF's encoder refuses them
+        self.assertEqual(FastJSONRenderer().render({"rate": float("nan")}), b'{"rate":null}')
+
+    def test_utc_datetimes_use_z(self):
+        moment = datetime(2025, 5, 1, 8, 30, tzinfo=timezone.utc)
+        self.assertEqual(FastJSONRenderer().render({"at": moment}), b'{"at":"2025-05-01T08:30:00Z"}')
+
+    def test_falls_back_without_orjson_or_with_indent(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+        indented = FastJSONRenderer().render(self.data, "application/json; indent=2")
+        self.assertIn(b'\n  "id": 1', indented)
+
+    def test_benchmark_reports_every_renderer(self):
+        results = renderer_benchmark(rows=20, repeat=1)
+        self.assertEqual(len(results), 6)
+        sizes = {(row["payload"], row["renderer"]): row["bytes"] for row in results}
+        for payload in ("attendance-list", "monthly-attendance-rate"):
+            self.assertEqual(sizes[(payload, "json")], sizes[(payload, "drf-json")])
+            self.assertLess(sizes[(payload, "msgpack")], sizes[(payload, "json")])
+
+
+class RendererNegotiationTests(APITestCase):
+    def setUp(self):
+        hr_group = Group.objects.create(name="HR")
+        hr_user = User.objects.create_user(username="hr", password="password")
+        hr_group.user_set.add(hr_user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=hr_user).key)
+        employee = Employee.objects.create(
+            name="Alice", email="alice@example.com", date_of_joining="2024-01-01",
+            department=Department.objects.create(name="EngDept"),
+            user=User.objects.create_user(username="alice"),
+        )
+        Attendance.objects.create(employee=employee, date=date(2025, 5, 1), status="present")
+        self.url = reverse("attendance-list")
+
+    def test_json_is_the_default(self):
+        response = self.client.get(self.url, HTTP_ACCEPT="*/*")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content)["results"][0]["status"], "present")
+
+    def test_msgpack_by_accept_header_or_format(self):
+        response = self.client.get(self.url, HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(response.content, MessagePackRenderer().render(response.data))
+
+        by_format = self.client.get(self.url, {"format": "msgpack"})
+        self.assertEqual(by_format["Content-Type"], "application/msgpack")
+
+    @override_settings(CONDITIONAL_GET=True)
+    def test_representations_get_different_etags(self):
+        as_json = self.client.get(self.url, HTTP_ACCEPT="application/json")
+        as_msgpack = self.client.get(self.url, HTTP_ACCEPT="application/msgpack")
+        self.assertNotEqual(as_json["ETag"], as_msgpack["ETag"])
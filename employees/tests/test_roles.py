@@ -0,0 +1,88 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from attendance.models import Attendance
+
+
+def group_queries(context):
+    return [q["sql"] for q in context.captured_queries if "auth_group" in q["sql"]]
+
+
+class RoleResolutionTests(APITestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.dept = Department.objects.create(name="EngDept")
+        self.hr_group = Group.objects.create(name="HR")
+        self.emp_group = Group.objects.create(name="Employee")
+
+        self.hr_user = User.objects.create_user(username="hr", password="pass123")
+        self.hr_group.user_set.add(self.hr_user)
+        self.hr_token = Token.objects.create(user=self.hr_user)
+
+        self.emp_user = User.objects.create_user(username="alice", password="pass123")
+        self.emp_group.user_set.add(self.emp_user)
+        self.emp_token = Token.objects.create(user=self.emp_user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=self.emp_user
+        )
+        self.record = Attendance.objects.create(
+            employee=self.alice, date="2024-01-01", status="present"
+        )
+
+    def get(self, token, url):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, context
+
+    def test_one_role_query_per_detail_request(self):
+        url = reverse("attendance-detail", args=[self.record.id])
+        response, context = self.get(self.emp_token, url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(group_queries(context)), 1)
+        # token, roles, attendance row
+        self.assertEqual(len(context.captured_queries), 3)
+
+    def test_one_role_query_per_list_request(self):
+        for name in ("attendance-list", "performance-list", "employee-list"):
+            response, context = self.get(self.hr_token, reverse(name))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(group_queries(context)), 1, name)
+
+    @override_settings(ROLES_CACHE_TIMEOUT=60)
+    def test_cross_request_cache_invalidated_on_group_change(self):
+        url = reverse("attendance-list")
+        self.get(self.emp_token, url)
+        response, context = self.get(self.emp_token, url)
+        self.assertEqual(len(group_queries(context)), 0)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        # Promote Alice to HR: the cached roles must be dropped
+        other = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+        Attendance.objects.create(employee=other, date="2024-01-01", status="absent")
+        self.hr_group.user_set.add(self.emp_user)
+
+        response, context = self.get(self.emp_token, url)
+        self.assertEqual(len(group_queries(context)), 1)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        self.emp_user.groups.remove(self.hr_group)
+        response, _ = self.get(self.emp_token, url)
+        self.assertEqual(len(response.data["results"]), 1)
@@ -0,0 +1,62 @@
+import tempfile
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from attendance.models import Attendance
+from employees import seeding
+from employees.models import Employee
+from performance.models import Performance
+from reports.rollups import find_drift
+from reports.stats import find_stats_drift
+
+
+class BulkSeedDataTests(TestCase):
+    def test_bulk_seed_creates_consistent_dataset(self):
+        out = StringIO()
+        with tempfile.TemporaryDirectory() as tmp, override_settings(BASE_DIR=tmp):
+            call_command(
+                "seed_data",
+                bulk=True,
+                seed=3,
+                workers=1,
+                chunk_size=7,
+                num_departments=2,
+                num_employees=20,
+                attendance_days=5,
+                min_reviews=1,
+                max_reviews=2,
+                stdout=out,
+            )
+
+        self.assertEqual(Employee.objects.count(), 20)
+        self.assertEqual(User.objects.filter(username__startswith="s3_").count(), 20)
+        self.assertEqual(Attendance.objects.count(), 100)
+        self.assertTrue(20 <= Performance.objects.count() <= 40)
+        self.assertIn("rows/sec", out.getvalue())
+
+        # One shared hash for every seeded employee
+        self.assertEqual(
+            User.objects.filter(username__startswith="s3_").values("password").distinct().count(),
+            1,
+        )
+        self.assertEqual(find_drift(), [])
+        self.assertEqual(find_stats_drift(), [])
+
+    def test_generators_are_deterministic(self):
+        today = date(2025, 1, 31)
+        self.assertEqual(
+            seeding.employee_rows(5, 0, 10, [1, 2], today),
+            seeding.employee_rows(5, 0, 10, [1, 2], today),
+        )
+        self.assertEqual(
+            seeding.attendance_rows(5, today, [1, 2, 3]),
+            seeding.attendance_rows(5, today, [1, 2, 3]),
+        )
+        self.assertNotEqual(
+            seeding.performance_rows(5, 0, range(50), today, 2, 5),
+            seeding.performance_rows(6, 0, range(50), today, 2, 5),
+        )
@@ -0,0 +1,168 @@
+# employees/tests/test_sparse_fieldsets.py
+
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from attendance.models import Attendance
+from employees.models import Department, Employee
+from performance.models import Performance
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="EngDept")
+        hr_group = Group.objects.create(name="HR")
+        emp_group = Group.objects.create(name="Employee")
+
+        hr_user = User.objects.create_user(username="hr", password="password")
+        hr_group.user_set.add(hr_user)
+        self.hr_token = Token.objects.create(user=hr_user)
+
+        emp_user = User.objects.create_user(username="alice", password="password")
+        emp_group.user_set.add(emp_user)
+        self.emp_token = Token.objects.create(user=emp_user)
+
+        self.alice = Employee.objects.create(
+            name="Alice", email="alice@example.com", address="123 Long Street",
+            date_of_joining="2024-01-01", department=self.dept, user=emp_user,
+        )
+        self.bob = Employee.objects.create(
+            name="Bob", email="bob@example.com", address="456 Avenue",
+            date_of_joining="2024-02-01", department=self.dept,
+            user=User.objects.create_user(username="bob"),
+        )
+        for day in (1, 2, 3):
+            Attendance.objects.create(employee=self.alice, date=date(2025, 5, day), status="present")
+        self.review = Performance.objects.create(
+            employee=self.alice, review_date=date(2025, 4, 1), rating=4, comment="Solid quarter.",
+        )
+
+    def get(self, url, token=None, **params):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + (token or self.hr_token).key)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        return response, queries
+
+    def data_query(self, queries, table):
+        """
+        The SELECT that loaded the rows (not the COUNT or auth lookups).
+        """
+        selects = [
+            q["sql"] for q in queries.captured_queries
+            if q["sql"].startswith("SELECT") and f'FROM "{table}"' in q["sql"] and "COUNT(" not in q["sql"]
+        ]
+        self.assertEqual(len(selects), 1, selects)
+        return selects[0]
+
+    def test_fields_trims_output_columns_and_joins(self):
+        response, queries = self.get(reverse("employee-list"), fields="id,name")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([set(row) for row in response.data["results"]], [{"id", "name"}] * 2)
+        sql = self.data_query(queries, "employees_employee")
+        self.assertNotIn('"address"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_nested_field_joins_only_its_relation(self):
+        response, queries = self.get(reverse("employee-list"), fields="name,department")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0]["department"], {"id": self.dept.id, "name": "EngDept"}
+        )
+        sql = self.data_query(queries, "employees_employee")
+        self.assertIn('JOIN "employees_department"', sql)
+        self.assertNotIn('"auth_user"', sql)
+        self.assertNotIn('"address"', sql)
+
+    def test_exclude_defers_the_column(self):
+        response, queries = self.get(reverse("employee-list"), exclude="address,department")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = response.data["results"][0]
+        self.assertEqual(
+            set(row), {"id", "name", "email", "phone_number", "date_of_joining", "user"}
+        )
+        sql = self.data_query(queries, "employees_employee")
+        self.assertNotIn('"address"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_unknown_or_write_only_field_is_rejected(self):
+        response, _ = self.get(reverse("employee-list"), fields="name,salary")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("salary", str(response.data["fields"]))
+        response, _ = self.get(reverse("employee-list"), exclude="department_id")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_without_parameters_everything_is_returned(self):
+        response, _ = self.get(reverse("employee-detail", args=[self.bob.pk]))
+        self.assertIn("address", response.data)
+        self.assertEqual(response.data["department"]["name"], "EngDept")
+
+    def test_employee_may_retrieve_own_record_sparsely(self):
+        url = reverse("employee-detail", args=[self.alice.pk])
+        response, queries = self.get(url, self.emp_token, fields="name")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"name": "Alice"})
+        # the permission check reads user_id from the same row
+        self.data_query(queries, "employees_employee")
+
+        url = reverse("employee-detail", args=[self.bob.pk])
+        response, _ = self.get(url, self.emp_token, fields="name")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_writes_ignore_fields(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.patch(
+            reverse("employee-detail", args=[self.bob.pk]) + "?fields=name",
+            {"address": "789 Road"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["address"], "789 Road")
+
+    def test_attendance_keyset_pages_with_sparse_fields(self):
+        url = reverse("attendance-list")
+        response, queries = self.get(url, fields="status", pagination="keyset", page_size=2)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [{"status": "present"}] * 2)
+        sql = self.data_query(queries, "attendance_attendance")
+        self.assertNotIn("JOIN", sql)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        with CaptureQueriesContext(connection) as queries:
+            following = self.client.get(response.data["next"])
+        self.assertEqual(following.data["results"], [{"status": "present"}])
+        self.data_query(queries, "attendance_attendance")
+
+    def test_employee_retrieves_own_attendance_sparsely(self):
+        record = Attendance.objects.filter(employee=self.alice).first()
+        response, _ = self.get(
+            reverse("attendance-detail", args=[record.pk]), self.emp_token, fields="date"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"date": str(record.date)})
+
+    def test_performance_fields_can_request_the_comment(self):
+        url = reverse("performance-list")
+        response, queries = self.get(url, fields="id,comment")
+        self.assertEqual(response.data["results"], [{"id": self.review.pk, "comment": "Solid quarter."}])
+
+        response, queries = self.get(url, fields="rating")
+        self.assertEqual(response.data["results"], [{"rating": 4}])
+        sql = self.data_query(queries, "performance_performance")
+        self.assertNotIn('"comment"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_performance_search_snippet_with_fields(self):
+        response, _ = self.get(reverse("performance-list"), search="quarter", fields="id,search_snippet")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["id"], self.review.pk)
+        self.assertIn("<mark>", response.data["results"][0]["search_snippet"])
+
+    def test_department_fields(self):
+        response, _ = self.get(reverse("department-list"), fields="name")
+        self.assertEqual(response.data["results"], [{"name": "EngDept"}])
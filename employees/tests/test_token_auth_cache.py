@@ -0,0 +1,104 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.authentication import TokenUserCache, token_cache
+from employees.models import Department
+
+
+def token_queries(context):
+    return [q["sql"] for q in context.captured_queries if "authtoken_token" in q["sql"]]
+
+
+@override_settings(TOKEN_AUTH_CACHE_TTL=300)
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        token_cache.reset_stats()
+        Department.objects.create(name="EngDept")
+        self.hr_group = Group.objects.create(name="HR")
+        self.user = User.objects.create_user(username="hr", password="pass123")
+        self.hr_group.user_set.add(self.user)
+        self.token = Token.objects.create(user=self.user)
+        self.url = reverse("department-list")
+
+    def get(self, token_key=None):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + (token_key or self.token.key))
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        return response, context
+
+    def test_steady_state_needs_no_auth_query(self):
+        response, context = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(token_queries(context)), 1)
+
+        response, context = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(token_queries(context)), 0)
+        self.assertEqual(token_cache.stats()["hits"], 1)
+
+    def test_deleted_token_is_rejected(self):
+        self.get()
+        old_key = self.token.key
+        self.token.delete()
+        response, _ = self.get(old_key)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotated_token(self):
+        self.get()
+        old_key = self.token.key
+        self.token.delete()
+        new_token = Token.objects.create(user=self.user)
+        self.assertEqual(self.get(old_key)[0].status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get(new_token.key)[0].status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user_is_rejected(self):
+        self.get()
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self.get()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalidation_is_per_user(self):
+        other = User.objects.create_user(username="hr2")
+        self.hr_group.user_set.add(other)
+        other_token = Token.objects.create(user=other)
+        self.get()
+        self.get(other_token.key)
+
+        other.first_name = "Renamed"
+        other.save()
+        self.assertEqual(len(token_queries(self.get()[1])), 0)
+        self.assertEqual(len(token_queries(self.get(other_token.key)[1])), 1)
+
+    def test_other_processes_see_revocations(self):
+        # two caches sharing one backend, as two workers sharing Redis
+        first, second = TokenUserCache(max_entries=10), TokenUserCache(max_entries=10)
+        first.put("key", self.user, self.token)
+        self.assertIsNotNone(first.get("key"))
+        second.invalidate_user(self.user.pk)
+        self.assertIsNone(first.get("key"))
+
+    @override_settings(TOKEN_AUTH_CACHE_TTL=0)
+    def test_off_with_zero_ttl(self):
+        self.get()
+        self.assertEqual(len(token_queries(self.get()[1])), 1)
+        self.assertEqual(token_cache.stats()["size"], 0)
+
+    def test_lru_and_ttl(self):
+        cache = TokenUserCache(max_entries=2, ttl=60)
+        users = [User(pk=i, username=f"u{i}") for i in range(3)]
+        for user in users:
+            cache.put(f"key{user.pk}", user, token=None)
+        self.assertIsNone(cache.get("key0"))
+        self.assertEqual(cache.get("key2")[0].username, "u2")
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+        expired = TokenUserCache(max_entries=2, ttl=-1)
+        expired.put("key", users[0], token=None)
+        self.assertIsNone(expired.get("key"))
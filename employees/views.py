@@ -2,48 +2,56 @@ from django.shortcuts import render
 from rest_framework import viewsets, filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
 
 from .models import Employee, Department
 from .serializers import EmployeeSerializer, DepartmentSerializer
 from .filters import EmployeeFilter
+from .search import EmployeeSearchFilter
+from .authentication import CachedTokenAuthentication
+from .fastpath import FastListMixin
+from .fieldsets import SparseFieldsetMixin
 from .permissions import IsAdminGroup, IsHRGroup, IsEmployeeSelfOrHRorAdmin
+from reports.conditional import ConditionalGetMixin
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     Department list/create/update/delete endpoints.
     Allow only Admin or HR users to manage departments.
     """
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated & (IsAdminGroup | IsHRGroup)]
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name"]
     ordering_fields = ["name"]
+    etag_tables = ("department",)
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     """
     Employee list/retrieve/update/delete endpoints.
     - Admin/HR: can list all Employees, create new, update/delete any.
     - Employee: can only retrieve or update their own record.
+    - ?fields= / ?exclude= pick the returned fields (and loaded columns).
     """
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     queryset = Employee.objects.select_related("department", "user").all()
     serializer_class = EmployeeSerializer
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        EmployeeSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_class = EmployeeFilter
     search_fields = ["name", "email"]
     ordering_fields = ["name", "date_of_joining"]
+    etag_tables = ("employee", "department")
+    object_permission_columns = ("user",)
 
     def get_permissions(self):
         """
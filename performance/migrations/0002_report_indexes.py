@@ -0,0 +1,19 @@
+# Generated by Django 4.2.4 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("performance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(
+                fields=["review_date", "rating"], name="performance_date_rating_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+FTS_TABLE = "performance_comment_fts"
+PG_INDEX = "performance_comment_fts_idx"
+
+# SQLite: an external-content FTS5 table over performance_performance.comment,
+# kept in sync by triggers. Note that a later migration which makes Django
+# rebuild performance_performance on SQLite (e.g. altering a column) drops
+# the triggers; re-run create_comment_index from that migration.
+SQLITE_INDEX = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "comment, content='performance_performance', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON performance_performance BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, comment) VALUES (new.id, new.comment); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON performance_performance BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, comment) VALUES ('delete', old.id, old.comment); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF comment ON performance_performance BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, comment) VALUES ('delete', old.id, old.comment); "
+    f"INSERT INTO {FTS_TABLE}(rowid, comment) VALUES (new.id, new.comment); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def create_comment_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        # Same expression as performance.search.comment_vector()
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{PG_INDEX}" ON "performance_performance" '
+            "USING gin (to_tsvector('english'::regconfig, \"comment\"))"
+        )
+    elif vendor == "sqlite":
+        for statement in SQLITE_INDEX:
+            schema_editor.execute(statement)
+
+
+def drop_comment_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{PG_INDEX}"')
+    elif vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("performance", "0002_report_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="performance",
+            name="comment",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.RunPython(create_comment_index, drop_comment_index),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 
 # Create your models here.
-from django.db import models
+from django.db import models, transaction
 from employees.models import Employee
 
 
@@ -11,9 +11,21 @@ class Performance(models.Model):
     )
     rating = models.IntegerField()  # Expect 1–5
     review_date = models.DateField()
+    # Free-text review; full-text indexed (migration 0003, performance/search.py)
+    # and deferred on list endpoints unless requested
+    comment = models.TextField(blank=True, default="")
 
     class Meta:
         unique_together = ("employee", "review_date")
+        indexes = [
+            # Date-range rating reports read only this index
+            models.Index(fields=["review_date", "rating"], name="performance_date_rating_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # post_save updates the DepartmentStats rating totals in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.employee.name} – {self.review_date}: {self.rating}"
@@ -0,0 +1,136 @@
+# performance/search.py
+"""
+Full-text search over review comments behind `?search=` on /api/performance/.
+
+- PostgreSQL: to_tsvector('english', comment) @@ websearch_to_tsquery(...),
+  served by the GIN expression index from migration 0003, ranked with
+  ts_rank and highlighted with ts_headline.
+- SQLite: the external-content FTS5 table performance_comment_fts (kept in
+  sync by triggers, migration 0003), ranked with bm25() and highlighted
+  with snippet().
+- Other databases: every term as a case-insensitive substring, unranked.
+
+Matching rows are annotated with `search_rank` (higher is better) and
+`search_snippet`, whose highlighted words are wrapped in SNIPPET_START /
+SNIPPET_END; `highlight()` turns that into HTML-escaped text with <mark>.
+"""
+
+import html
+
+from django.db import connection
+from django.db.models import F, FloatField, Func, TextField, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+FTS_TABLE = "performance_comment_fts"
+SNIPPET_START, SNIPPET_END = "\x02", "\x03"
+SNIPPET_WORDS = 16
+
+
+def highlight(snippet):
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(SNIPPET_START, "<mark>")
+        .replace(SNIPPET_END, "</mark>")
+    )
+
+
+def fts5_query(terms):
+    """
+    Terms as quoted FTS5 strings (implicitly ANDed), so user input can never
+    be parsed as FTS5 syntax.
+    """
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def comment_vector():
+    """
+    Must stay identical to the expression of the PostgreSQL index.
+    """
+    from django.contrib.postgres.search import SearchVectorField
+
+    return Func(
+        F("comment"),
+        function="to_tsvector",
+        template="%(function)s('english'::regconfig, %(expressions)s)",
+        output_field=SearchVectorField(),
+    )
+
+
+def _search_postgresql(queryset, terms):
+    from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+
+    query = SearchQuery(" ".join(terms), config="english", search_type="websearch")
+    return (
+        queryset.annotate(comment_vector=comment_vector())
+        .filter(comment_vector=query)
+        .annotate(
+            search_rank=SearchRank(F("comment_vector"), query),
+            search_snippet=SearchHeadline(
+                "comment",
+                query,
+                config="english",
+                start_sel=SNIPPET_START,
+                stop_sel=SNIPPET_END,
+                max_words=SNIPPET_WORDS,
+                min_words=SNIPPET_WORDS // 2,
+            ),
+        )
+        .order_by("-search_rank", "pk")
+    )
+
+
+def _search_sqlite(queryset, terms):
+    match = fts5_query(terms)
+    table = queryset.model._meta.db_table
+    # bm25() is lower for better matches; negate it so higher is better everywhere
+    rank = RawSQL(
+        f"(SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} "
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id")',
+        [match],
+        output_field=FloatField(),
+    )
+    snippet = RawSQL(
+        f"(SELECT snippet({FTS_TABLE}, 0, %s, %s, '…', %s) FROM {FTS_TABLE} "
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id")',
+        [SNIPPET_START, SNIPPET_END, SNIPPET_WORDS, match],
+        output_field=TextField(),
+    )
+    matching = RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+    return (
+        queryset.filter(pk__in=matching)
+        .annotate(search_rank=rank, search_snippet=snippet)
+        .order_by("-search_rank", "pk")
+    )
+
+
+def search_comments(queryset, terms):
+    """
+    `queryset` narrowed to reviews whose comment matches all `terms`,
+    best match first.
+    """
+    if connection.vendor == "postgresql":
+        return _search_postgresql(queryset, terms)
+    if connection.vendor == "sqlite":
+        return _search_sqlite(queryset, terms)
+    for term in terms:
+        queryset = queryset.filter(comment__icontains=term)
+    return queryset.annotate(
+        search_rank=Value(0.0, output_field=FloatField()),
+        search_snippet=Value(None, output_field=TextField()),
+    )
+
+
+class CommentSearchFilter(SearchFilter):
+    """
+    `?search=` over Performance.comment through the full-text index, ordered
+    by relevance (unless ?ordering= is given).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_comments(queryset, terms)
@@ -1,8 +1,13 @@
 from rest_framework import serializers
+from employees.fieldsets import SparseFieldsetSerializerMixin
 from .models import Performance
+from .search import highlight
 
 
-class PerformanceSerializer(serializers.ModelSerializer):
+class PerformanceSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    # Highlighted comment excerpt, only present on ?search= results
+    search_snippet = serializers.SerializerMethodField()
+
     class Meta:
         model = Performance
         fields = [
@@ -10,4 +15,16 @@ class PerformanceSerializer(serializers.ModelSerializer):
             "employee",   # FK to Employee (integer ID)
             "rating",
             "review_date",
+            "comment",
+            "search_snippet",
         ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.context.get("omit_comment"):
+            self.fields.pop("comment", None)
+        if not self.context.get("search"):
+            self.fields.pop("search_snippet", None)
+
+    def get_search_snippet(self, obj):
+        return highlight(getattr(obj, "search_snippet", None))
@@ -0,0 +1,118 @@
+# performance/tests/test_performance_comment_search.py
+
+from datetime import date
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from performance.models import Performance
+from performance.search import fts5_query, highlight
+
+
+class PerformanceCommentSearchTests(APITestCase):
+    def setUp(self):
+        dept = Department.objects.create(name="EngDept")
+        hr_group = Group.objects.create(name="HR")
+        emp_group = Group.objects.create(name="Employee")
+
+        hr_user = User.objects.create_user(username="hr", password="password")
+        hr_group.user_set.add(hr_user)
+        self.hr_token = Token.objects.create(user=hr_user)
+
+        self.emp_user = User.objects.create_user(username="alice", password="password")
+        emp_group.user_set.add(self.emp_user)
+        self.emp_token = Token.objects.create(user=self.emp_user)
+
+        alice = Employee.objects.create(
+            name="Alice", email="alice@example.com", date_of_joining="2024-01-01",
+            department=dept, user=self.emp_user,
+        )
+        bob = Employee.objects.create(
+            name="Bob", email="bob@example.com", date_of_joining="2024-01-01",
+            department=dept, user=User.objects.create_user(username="bob"),
+        )
+        self.reviews = {
+            "deadline": Performance.objects.create(
+                employee=alice, review_date=date(2024, 3, 1), rating=4,
+                comment="Consistently delivered the migration ahead of the deadline.",
+            ),
+            "deadlines": Performance.objects.create(
+                employee=bob, review_date=date(2024, 3, 1), rating=2,
+                comment="Missed deadlines twice; deadlines need to be <b>planned</b> earlier.",
+            ),
+            "other": Performance.objects.create(
+                employee=bob, review_date=date(2024, 6, 1), rating=3,
+                comment="Great mentoring of new hires.",
+            ),
+        }
+        self.url = reverse("performance-list")
+
+    def get(self, token, **params):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def test_ranked_search_with_stemming_and_snippets(self):
+        results = self.get(self.hr_token, search="deadline")
+        # "deadlines" matches "deadline" after stemming; two hits rank it first
+        self.assertEqual(
+            [row["id"] for row in results],
+            [self.reviews["deadlines"].pk, self.reviews["deadline"].pk],
+        )
+        snippet = results[0]["search_snippet"]
+        self.assertIn("<mark>", snippet)
+        self.assertIn("&lt;b&gt;planned&lt;/b&gt;", snippet)  # comment text is escaped
+        self.assertNotIn("comment", results[0])
+
+    def test_all_terms_must_match_and_syntax_is_inert(self):
+        results = self.get(self.hr_token, search="mentoring hires")
+        self.assertEqual([row["id"] for row in results], [self.reviews["other"].pk])
+        self.assertEqual(self.get(self.hr_token, search="mentoring deadline"), [])
+        self.assertEqual(self.get(self.hr_token, search='"NEAR( OR *'), [])
+
+    def test_search_respects_role_scope_and_updates(self):
+        review = self.reviews["deadline"]
+        review.comment = "Excellent mentoring this quarter."
+        review.save()
+        results = self.get(self.emp_token, search="mentoring")
+        self.assertEqual([row["id"] for row in results], [review.pk])
+
+    def test_keyset_pages_of_a_search(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.get(
+            self.url, {"search": "deadline", "pagination": "keyset", "page_size": 1}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # keyset_ordering (newest review first, then id) instead of relevance
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.reviews["deadlines"].pk])
+        self.assertIn("search_snippet", response.data["results"][0])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.reviews["deadline"].pk])
+        self.assertIsNone(response.data["next"])
+
+    def test_list_defers_comment_unless_included(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertNotIn("comment", response.data["results"][0])
+        self.assertNotIn("search_snippet", response.data["results"][0])
+        select = next(q["sql"] for q in context.captured_queries if "LIMIT" in q["sql"])
+        self.assertNotIn('"comment"', select)
+
+        results = self.get(self.hr_token, include="comment")
+        self.assertIn("comment", results[0])
+
+        detail = self.client.get(reverse("performance-detail", args=[self.reviews["other"].pk]))
+        self.assertEqual(detail.data["comment"], "Great mentoring of new hires.")
+
+    def test_helpers(self):
+        self.assertEqual(fts5_query(['a"b', "c"]), '"a""b" "c"')
+        self.assertEqual(highlight("x \x02<y>\x03"), "x <mark>&lt;y&gt;</mark>")
+        self.assertIsNone(highlight(None))
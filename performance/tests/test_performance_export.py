@@ -0,0 +1,35 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Employee, Department
+from performance.models import Performance
+
+
+class PerformanceExportTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="EngDept")
+        self.admin_group = Group.objects.create(name="Admin")
+        self.admin_user = User.objects.create_user(username="admin", password="pass123")
+        self.admin_group.user_set.add(self.admin_user)
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=User.objects.create_user(username="alice", password="pass123")
+        )
+        Performance.objects.create(employee=self.alice, review_date="2024-01-10", rating=4)
+        Performance.objects.create(employee=self.alice, review_date="2024-06-10", rating=2)
+
+    def test_csv_export_with_filter(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.admin_token.key)
+        response = self.client.get(reverse("performance-export"), {"rating_min": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,employee,rating,review_date")
+        self.assertEqual(lines[1:], [f"{Performance.objects.get(rating=4).id},{self.alice.id},4,2024-01-10"])
@@ -4,31 +4,55 @@ from django.shortcuts import render
 from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.authentication import TokenAuthentication
 
 from .models import Performance
 from .serializers import PerformanceSerializer
 from .filters import PerformanceFilter
+from .search import CommentSearchFilter
 from employees.permissions import IsAdminGroup, IsHRGroup, IsPerformanceSelfOrHRorAdmin
+from employees.authentication import CachedTokenAuthentication
+from employees.exports import ExportMixin
+from employees.fastpath import FastListMixin
+from employees.fieldsets import SparseFieldsetMixin
+from employees.pagination import PageNumberOrKeysetPagination
+from employees.roles import is_staff_role
+from reports.conditional import ConditionalGetMixin
 
 
-class PerformanceViewSet(viewsets.ModelViewSet):
+class PerformanceViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, ExportMixin, viewsets.ModelViewSet
+):
     """
     Performance endpoints:
       - Admin and HR users can list/create/update/delete any Performance record.
       - An Employee user can only see and modify their own Performance records.
+      - ?search= runs a full-text search over comments (ranked, with snippets).
+      - Lists leave out the comment text unless asked for with ?include=comment
+        (or ?fields=comment,...).
     """
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     serializer_class = PerformanceSerializer
     filter_backends = [
         DjangoFilterBackend,
+        CommentSearchFilter,
         filters.OrderingFilter,
-        filters.SearchFilter,
     ]
     filterset_class = PerformanceFilter
     search_fields = ["comment"]
     ordering_fields = ["review_date", "rating"]
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_ordering = ["-review_date"]
+    etag_tables = ("performance", "employee")
+    object_permission_columns = ("employee__user",)
+    sparse_annotated_fields = ("search_snippet",)
+    export_columns = [
+        ("id", "id"),
+        ("employee", "employee_id"),
+        ("rating", "rating"),
+        ("review_date", "review_date"),
+    ]
+    export_filename = "performance"
 
     def get_permissions(self):
         """
@@ -42,14 +66,29 @@ class PerformanceViewSet(viewsets.ModelViewSet):
 
         return [permission() for permission in permission_classes]
 
+    def comment_requested(self):
+        if self.action != "list":
+            return True
+        params = self.request.query_params
+        requested = params.get("include", "").split(",") + params.get(self.fields_query_param, "").split(",")
+        return "comment" in (name.strip() for name in requested)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["omit_comment"] = not self.comment_requested()
+        context["search"] = bool(self.request.query_params.get(CommentSearchFilter.search_param))
+        return context
+
     def get_queryset(self):
         """
         Admin and HR see all Performance records;
         Employee sees only Performance records linked to their own Employee user.
         """
         user = self.request.user
-        if user.groups.filter(name__in=["Admin", "HR"]).exists():
-            return Performance.objects.select_related("employee").all()
-        return Performance.objects.select_related("employee").filter(
-            employee__user=user
-        )
+        queryset = Performance.objects.select_related("employee")
+        if not self.comment_requested():
+            # Comments can be long; keep them out of list queries
+            queryset = queryset.defer("comment")
+        if is_staff_role(user):
+            return queryset.all()
+        return queryset.filter(employee__user=user)
@@ -4,3 +4,21 @@ from django.apps import AppConfig
 class ReportsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reports"
+
+    def ready(self):
+        # Register the rollup maintenance receivers
+        from . import signals  # noqa: F401
+
+        # Time every statement for the slow query log
+        from django.db.backends.signals import connection_created
+
+        from .slow_queries import install
+
+        connection_created.connect(install, dispatch_uid="reports.slow_queries.install")
+
+        # Per-request query counts for the performance and metrics middleware
+        from employee_project.middleware import install_query_observer
+
+        connection_created.connect(
+            install_query_observer, dispatch_uid="employee_project.middleware.install_query_observer"
+        )
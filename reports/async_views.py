@@ -0,0 +1,161 @@
+# reports/async_views.py
+"""
+Async variants of the report API views, routed by employee_project/urls_asgi.py
+when the project is served through employee_project/asgi.py.
+
+Each view keeps the URL, parameters, permissions, ETags and response of
+its synchronous original in reports/views.py; only the place the work runs
+changes:
+
+- authentication, permissions and the conditional GET check run in a
+  worker thread, and so does the report itself, so the event loop never
+  waits on the database or the cache backend;
+- reports made of independent queries run them concurrently with
+  asyncio.gather: the monthly attendance rate matrix reads the rollup and
+  the department list at the same time.
+
+The worker threads come from `in_thread`, not from Django's async ORM
+(QuerySet.aget() and friends). In Django 4.2 those are sync_to_async with
+thread_sensitive=True: every query of every request is queued on the one
+thread that owns the request's connection, so gathered queries would still
+run one after another. `in_thread` uses thread_sensitive=False, giving each
+call a pool thread with its own connection, and closes that connection
+afterwards unless CONN_MAX_AGE allows reuse. Note that such threads do not
+see the uncommitted transaction of a TestCase; test these views with
+TransactionTestCase.
+"""
+
+import asyncio
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db import close_old_connections
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cache import MISSING, report_cache
+from .views import (
+    AveragePerformanceByDepartmentView,
+    EmployeesPerDepartmentAPIView,
+    MonthlyAttendanceChartView,
+    MonthlyAttendanceOverviewAPIView,
+    MonthlyAttendanceRateByDepartmentView,
+    TimeSeriesAPIView,
+    attendance_rate_matrix,
+    attendance_rate_series,
+    build_rate_matrix,
+    department_names,
+)
+
+
+def _with_fresh_connections(func, *args, **kwargs):
+    # the request_started/finished signals only clean up the request's own
+    # thread, so pool threads do it around each call
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def in_thread(func, *args, **kwargs):
+    """
+    Await func(*args, **kwargs) run in a worker thread with its own
+    database connection.
+    """
+    return await sync_to_async(_with_fresh_connections, thread_sensitive=False)(
+        func, *args, **kwargs
+    )
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose dispatch() is a coroutine. Handlers may be coroutines
+    (awaited on the event loop) or plain methods (run with in_thread).
+    Django serves the view as async once every handler it defines, other
+    than options(), is a coroutine.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await in_thread(self.initial, request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await in_thread(handler, request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncReportView(AsyncAPIView):
+    """
+    Async wrapper for a report view that runs one query: put it before the
+    synchronous view in the bases and its get() runs in a worker thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return await in_thread(super().get, request, *args, **kwargs)
+
+
+async def attendance_rate_matrix_async(first_month, last_month, department_id=None):
+    """
+    views.attendance_rate_matrix() sharing its cache entries, with the
+    rollup and department queries of a miss run concurrently.
+    """
+    key, matrix = await in_thread(
+        attendance_rate_matrix.lookup, first_month, last_month, department_id
+    )
+    if matrix is MISSING:
+        result, departments = await asyncio.gather(
+            in_thread(attendance_rate_series, first_month, last_month, department_id),
+            in_thread(department_names, department_id),
+        )
+        matrix = build_rate_matrix(result, departments)
+        await in_thread(report_cache.store, key, matrix)
+    return matrix
+
+
+class AsyncAveragePerformanceByDepartmentView(AsyncReportView, AveragePerformanceByDepartmentView):
+    pass
+
+
+class AsyncMonthlyAttendanceChartView(AsyncReportView, MonthlyAttendanceChartView):
+    pass
+
+
+class AsyncEmployeesPerDepartmentAPIView(AsyncReportView, EmployeesPerDepartmentAPIView):
+    pass
+
+
+class AsyncMonthlyAttendanceOverviewAPIView(AsyncReportView, MonthlyAttendanceOverviewAPIView):
+    pass
+
+
+class AsyncTimeSeriesAPIView(AsyncReportView, TimeSeriesAPIView):
+    pass
+
+
+class AsyncMonthlyAttendanceRateByDepartmentView(AsyncAPIView, MonthlyAttendanceRateByDepartmentView):
+    async def get(self, request, *args, **kwargs):
+        query = self.rate_query(request)
+        if isinstance(query, Response):
+            return query
+        try:
+            matrix = await attendance_rate_matrix_async(*query)
+        except ValueError as exc:
+            return self.range_error(exc)
+        return self.rate_response(request, matrix)
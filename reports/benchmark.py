@@ -0,0 +1,538 @@
+# reports/benchmark.py
+"""
+End-to-end API benchmark used by `manage.py benchmark_api`.
+
+Every GET route in employee_project/urls.py is requested through the Django
+test client as each role (Admin, HR, Employee), recording wall-time
+percentiles, query count and database time. Results can be compared with a
+stored baseline to fail when an endpoint exceeds its query or latency budget.
+
+`serializer_benchmark()` (`manage.py benchmark_serializers`) compares DRF
+serialization of model instances with the compiled values_list() path of
+employees/fastpath.py on in-memory rows, and `renderer_benchmark()`
+(`manage.py benchmark_renderers`) the response renderers of
+employee_project/renderers.py on list and report payloads.
+
+`server_benchmark()` (`manage.py benchmark_asgi`) fires concurrent report
+requests through Django's WSGI handler (sync views, one thread per
+in-flight request) and its ASGI handler (reports/async_views.py on one
+event loop) and compares throughput and tail latency.
+"""
+
+import asyncio
+import math
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, reset_queries
+from django.test import AsyncClient, Client, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+
+from attendance.models import Attendance
+from attendance.serializers import AttendanceSerializer
+from employee_project import renderers
+from employees.fastpath import compile_serializer
+from employees.models import Department, Employee
+from employees.serializers import EmployeeSerializer
+from performance.models import Performance
+from performance.serializers import PerformanceSerializer
+
+# employees x days of attendance seeded per scale
+SCALES = {
+    "tiny": {"num_employees": 20, "attendance_days": 10},
+    "small": {"num_employees": 200, "attendance_days": 30},
+    "medium": {"num_employees": 2000, "attendance_days": 90},
+    "large": {"num_employees": 20000, "attendance_days": 365},
+}
+ROLES = ("Admin", "HR", "Employee")
+SKIPPED_NAMESPACES = ("admin",)
+
+
+def query_params(name, today=None):
+    """
+    Query string for routes that need parameters to do real work.
+    """
+    today = today or date.today()
+    month = {"year": today.year, "month": today.month}
+    params = {
+        "monthly-attendance-rate-by-department": month,
+        "monthly-attendance-chart-api": month,
+        "monthly-attendance-overview-api": month,
+        "attendance-chart": month,
+        "monthly-attendance-overview": month,
+        "timeseries-api": {
+            "source": "attendance",
+            "granularity": "month",
+            "start": f"{today.year - 1}-{today.month:02d}-01",
+            "end": today.isoformat(),
+            "group_by": "department,status",
+        },
+    }
+    return params.get(name, {})
+
+
+def _is_get_route(callback):
+    actions = getattr(callback, "actions", None)
+    if actions is not None:  # DRF viewset route
+        return "get" in actions
+    view_class = getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+    if view_class is not None:
+        return hasattr(view_class, "get")
+    return True  # function view
+
+
+def discover_routes(patterns=None, namespace=None):
+    """
+    [(url name, {kwarg names})] for every named GET route, excluding the
+    admin site and DRF's format-suffix duplicates.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    routes = []
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            if entry.namespace in SKIPPED_NAMESPACES or entry.app_name in SKIPPED_NAMESPACES:
+                continue
+            routes.extend(discover_routes(entry.url_patterns, entry.namespace or namespace))
+        elif isinstance(entry, URLPattern) and entry.name and _is_get_route(entry.callback):
+            kwargs = set(entry.pattern.regex.groupindex)
+            if "format" in kwargs and entry.name != "schema-json":
+                continue
+            name = f"{namespace}:{entry.name}" if namespace else entry.name
+            routes.append((name, kwargs))
+    return routes
+
+
+class Fixtures:
+    """
+    Users per role and object ids the Employee user is allowed to read.
+    """
+
+    def __init__(self, seed):
+        prefix = f"s{seed}_"
+        self.users = {
+            "Admin": User.objects.get(username="admin_user"),
+            "HR": User.objects.get(username="hr_user"),
+            "Employee": User.objects.filter(username__startswith=prefix)
+            .order_by("username")
+            .first(),
+        }
+        self.tokens = {
+            role: Token.objects.get_or_create(user=user)[0].key
+            for role, user in self.users.items()
+        }
+        employee = Employee.objects.get(user=self.users["Employee"])
+        self.pks = {
+            "employee": employee.pk,
+            "department": employee.department_id,
+            "attendance": Attendance.objects.filter(employee=employee)
+            .values_list("pk", flat=True)
+            .first(),
+            "performance": Performance.objects.filter(employee=employee)
+            .values_list("pk", flat=True)
+            .first(),
+        }
+
+    def url_for(self, name, kwargs):
+        values = {}
+        for kwarg in kwargs:
+            if kwarg == "format":
+                values[kwarg] = ".json"
+            elif kwarg == "pk":
+                basename = name.rsplit(":", 1)[-1].rsplit("-", 1)[0]
+                if self.pks.get(basename) is None:
+                    return None
+                values[kwarg] = self.pks[basename]
+            else:
+                return None
+        return reverse(name, kwargs=values)
+
+
+def is_seeded(seed=0):
+    return User.objects.filter(username__startswith=f"s{seed}_").exists()
+
+
+def seed_dataset(scale, seed=0, workers=1):
+    """
+    Populate the current database through `seed_data --bulk`.
+    """
+    options = dict(SCALES[scale])
+    with tempfile.TemporaryDirectory() as tmp, override_settings(BASE_DIR=tmp):
+        call_command(
+            "seed_data",
+            bulk=True,
+            seed=seed,
+            workers=workers,
+            num_departments=5,
+            stdout=StringIO(),
+            **options,
+        )
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class _QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+def measure(client, url, params, iterations):
+    """
+    Request `url` `iterations` times; the first (cold) call's query count is
+    the budgeted one, since later calls may be served from caches.
+    """
+    timings, statuses, queries, db_ms = [], set(), [], []
+    for _ in range(iterations):
+        timer = _QueryTimer()
+        reset_queries()
+        with connection.execute_wrapper(timer):
+            start = time.perf_counter()
+            response = client.get(url, params)
+            if getattr(response, "streaming", False):
+                b"".join(response.streaming_content)
+            timings.append((time.perf_counter() - start) * 1000)
+        statuses.add(response.status_code)
+        queries.append(timer.count)
+        db_ms.append(timer.seconds * 1000)
+    return {
+        "url": url,
+        "status": sorted(statuses),
+        "queries": queries[0],
+        "queries_warm": queries[-1],
+        "db_ms": round(sum(db_ms) / len(db_ms), 3),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p90_ms": round(percentile(timings, 90), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "max_ms": round(max(timings), 3),
+    }
+
+
+def run_benchmark(seed=0, iterations=20, routes=None, roles=ROLES):
+    """
+    Benchmark every route for every role on the already seeded database.
+    Returns {"<route> [<role>]": metrics}.
+    """
+    fixtures = Fixtures(seed)
+    results = {}
+    for role in roles:
+        client = Client()
+        client.force_login(fixtures.users[role])  # template views use the session
+        client.defaults["HTTP_AUTHORIZATION"] = f"Token {fixtures.tokens[role]}"
+        for name, kwargs in routes or discover_routes():
+            url = fixtures.url_for(name, kwargs)
+            if url is None:
+                continue
+            results[f"{name} [{role}]"] = measure(
+                client, url, query_params(name.rsplit(":", 1)[-1]), iterations
+            )
+    return results
+
+
+def compare(results, baseline, latency_factor=1.5, latency_slack_ms=5.0, query_slack=0):
+    """
+    Budget violations of `results` against a previous report's endpoints.
+
+    - queries: the cold query count may not exceed the baseline's + query_slack
+    - latency: p95 may not exceed baseline p95 * latency_factor + latency_slack_ms
+    Endpoints missing from either side are ignored.
+    """
+    violations = []
+    for key, base in baseline.items():
+        current = results.get(key)
+        if current is None:
+            continue
+        if current["queries"] > base["queries"] + query_slack:
+            violations.append(
+                f"{key}: {current['queries']} queries (budget {base['queries'] + query_slack})"
+            )
+        budget = base["p95_ms"] * latency_factor + latency_slack_ms
+        if current["p95_ms"] > budget:
+            violations.append(f"{key}: p95 {current['p95_ms']:.1f} ms (budget {budget:.1f} ms)")
+    return violations
+
+
+# ─────────── serializer micro-benchmark ───────────
+
+
+def _sample_instances(kind, rows):
+    departments = [Department(id=i + 1, name=f"Dept {i}") for i in range(10)]
+    if kind == "employee":
+        return [
+            Employee(
+                id=i + 1,
+                name=f"Employee {i}",
+                email=f"employee{i}@example.com",
+                phone_number=f"{5550000000 + i}",
+                address=f"{i} Main Street, Springfield",
+                date_of_joining=date(2020, 1, 1 + i % 28),
+                department=departments[i % len(departments)],
+                user_id=i + 1,
+            )
+            for i in range(rows)
+        ]
+    if kind == "attendance":
+        return [
+            Attendance(
+                id=i + 1,
+                employee_id=i % 500 + 1,
+                date=date(2025, 1 + i % 12, 1 + i % 28),
+                status=("present", "absent", "late")[i % 3],
+            )
+            for i in range(rows)
+        ]
+    return [
+        Performance(
+            id=i + 1,
+            employee_id=i % 500 + 1,
+            rating=1 + i % 5,
+            review_date=date(2025, 1 + i % 12, 1 + i % 28),
+        )
+        for i in range(rows)
+    ]
+
+
+def _column(instance, lookup):
+    """
+    The value values_list(lookup) would return for `instance`.
+    """
+    *relations, name = lookup.split("__")
+    for relation in relations:
+        instance = getattr(instance, relation)
+    return getattr(instance, instance._meta.get_field(name).attname)
+
+
+def serializer_benchmark(rows=10000, repeat=5):
+    """
+    Best-of-`repeat` time to serialize `rows` rows per serializer, through
+    DRF (model instances) and through the compiled fast path (tuples), plus
+    whether both render to the same JSON bytes. Performance rows are
+    serialized as lists are (without the comment).
+    """
+    cases = (
+        ("attendance", AttendanceSerializer, {}),
+        ("performance", PerformanceSerializer, {"omit_comment": True}),
+        ("employee", EmployeeSerializer, {}),
+    )
+    renderer = JSONRenderer()
+    results = []
+    for kind, serializer_class, context in cases:
+        instances = _sample_instances(kind, rows)
+        compiled = compile_serializer(serializer_class(context=context))
+        tuples = [tuple(_column(obj, path) for path in compiled.paths) for obj in instances]
+
+        drf, fast = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            slow_data = serializer_class(instances, many=True, context=context).data
+            drf.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            fast_data = compiled.convert(tuples)
+            fast.append(time.perf_counter() - start)
+
+        drf_ms, fast_ms = min(drf) * 1000, min(fast) * 1000
+        results.append(
+            {
+                "serializer": kind,
+                "rows": rows,
+                "drf_ms": round(drf_ms, 3),
+                "fast_ms": round(fast_ms, 3),
+                "speedup": round(drf_ms / fast_ms, 1) if fast_ms else None,
+                "identical": renderer.render(slow_data) == renderer.render(fast_data),
+            }
+        )
+    return results
+
+
+# ─────────── renderer benchmark ───────────
+
+
+def renderer_payloads(rows=1000, departments=50, months=24):
+    """
+    Payloads shaped like the responses of
+    /api/attendance/?pagination=keyset&page_size=<rows> and
+    /api/reports/monthly-attendance-rate/?start=...&end=... (departments x months).
+    """
+    from reports.views import _rate_cell
+
+    attendance = {
+        "next": "http://testserver/api/attendance/?cursor=eyJvIjpbIi1kYXRlIiwiLWlkIl19&pagination=keyset",
+        "previous": None,
+        "results": AttendanceSerializer(_sample_instances("attendance", rows), many=True).data,
+    }
+    labels = [f"{2024 + i // 12}-{i % 12 + 1:02d}" for i in range(months)]
+    rate = {
+        "months": labels,
+        "departments": [
+            {
+                "department_id": d + 1,
+                "department_name": f"Dept {d}",
+                "months": [
+                    dict(month=label, **_rate_cell(18 + (d + m) % 4, (d * m) % 3, (d + 2 * m) % 2))
+                    for m, label in enumerate(labels)
+                ],
+            }
+            for d in range(departments)
+        ],
+    }
+    return {"attendance-list": attendance, "monthly-attendance-rate": rate}
+
+
+def renderer_benchmark(rows=1000, repeat=20):
+    """
+    Best-of-`repeat` encode time, body size and gzipped size of each payload
+    per renderer. `backend` says whether the accelerator or the pure-Python
+    fallback was used.
+    """
+    cases = (
+        ("drf-json", JSONRenderer(), "json"),
+        ("json", renderers.FastJSONRenderer(), "orjson" if renderers.orjson else "json"),
+        ("msgpack", renderers.MessagePackRenderer(), "msgpack" if renderers.msgpack else "python"),
+    )
+    results = []
+    for payload_name, payload in renderer_payloads(rows=rows).items():
+        for name, renderer, backend in cases:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                body = renderer.render(payload, renderer.media_type, {})
+                timings.append(time.perf_counter() - start)
+            results.append(
+                {
+                    "payload": payload_name,
+                    "renderer": name,
+                    "backend": backend,
+                    "encode_ms": round(min(timings) * 1000, 3),
+                    "bytes": len(body),
+                    "gzip_bytes": len(zlib.compress(body, 6)),
+                }
+            )
+    return results
+
+
+# ─────────── WSGI vs ASGI under concurrency ───────────
+
+
+WSGI_URLCONF = "employee_project.urls"
+ASGI_URLCONF = "employee_project.urls_asgi"
+
+
+def report_requests(count):
+    """
+    `count` (url, params) pairs cycling through the report API routes that
+    have an async variant.
+    """
+    from employee_project.urls_asgi import ASYNC_VIEWS
+
+    with override_settings(ROOT_URLCONF=WSGI_URLCONF):
+        routes = [(reverse(name), query_params(name)) for name in ASYNC_VIEWS]
+    return [routes[i % len(routes)] for i in range(count)]
+
+
+def _summary(server, concurrency, latencies, statuses, elapsed):
+    return {
+        "server": server,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(1 for code in statuses if code != 200),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(max(latencies), 3) if latencies else 0.0,
+    }
+
+
+def wsgi_benchmark(token, requests, concurrency):
+    """
+    The synchronous views through the WSGI handler, `concurrency` requests
+    in flight on as many threads (a threaded WSGI server).
+    """
+    local = threading.local()
+
+    def call(url_params):
+        if not hasattr(local, "client"):
+            local.client = Client(HTTP_AUTHORIZATION=f"Token {token}")
+        url, params = url_params
+        start = time.perf_counter()
+        response = local.client.get(url, params)
+        return (time.perf_counter() - start) * 1000, response.status_code
+
+    with override_settings(ROOT_URLCONF=WSGI_URLCONF):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(call, requests))
+        elapsed = time.perf_counter() - start
+    return _summary("wsgi", concurrency, [r[0] for r in results], [r[1] for r in results], elapsed)
+
+
+def asgi_benchmark(token, requests, concurrency):
+    """
+    The async views through the ASGI handler, `concurrency` requests in
+    flight as tasks on one event loop. The loop's default executor, which
+    runs the views' database work, gets `concurrency` threads.
+    """
+    pending = list(reversed(requests))
+    latencies, statuses = [], []
+
+    async def worker():
+        client = AsyncClient()
+        while pending:
+            url, params = pending.pop()
+            start = time.perf_counter()
+            response = await client.get(url, params, headers={"Authorization": f"Token {token}"})
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses.append(response.status_code)
+
+    async def main():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    with override_settings(ROOT_URLCONF=ASGI_URLCONF):
+        start = time.perf_counter()
+        asyncio.run(main())
+        elapsed = time.perf_counter() - start
+    return _summary("asgi", concurrency, latencies, statuses, elapsed)
+
+
+def server_benchmark(seed=0, requests=500, concurrency=32, cached=False):
+    """
+    [wsgi summary, asgi summary] for the same report requests, made as the
+    HR user on the already seeded database. Unless `cached`, the report
+    cache is bypassed so every request reaches the database.
+    """
+    token = Fixtures(seed).tokens["HR"]
+    batch = report_requests(requests)
+    with override_settings(REPORTS_CACHE_TIMEOUT=60 * 60 if cached else 0):
+        # warm both paths (URLconf import, middleware chain, prepared plans)
+        warmup = report_requests(6)
+        wsgi_benchmark(token, warmup, 1)
+        asgi_benchmark(token, warmup, 1)
+        return [
+            wsgi_benchmark(token, batch, concurrency),
+            asgi_benchmark(token, batch, concurrency),
+        ]
@@ -0,0 +1,205 @@
+# reports/cache.py
+"""
+Version-keyed cache for report results.
+
+Every cached result is stored under
+    report:<name>:<hash of normalized params>:<data versions of its tables>
+Writes to a table bump that table's data version (see reports/signals.py),
+so later lookups use a new key and never see stale results; old entries
+simply age out of the cache backend.
+
+The backend is the Django cache alias named by settings.REPORTS_CACHE_ALIAS
+(local-memory LRU, file-based or Redis, configured via REPORTS_CACHE_URL).
+Bumps only reach the processes that share that backend, so results are
+cached only while settings.REPORTS_CACHE_TIMEOUT > 0, which by default
+requires a REPORTS_CACHE_URL other than the per-process locmem cache.
+"""
+
+import functools
+import hashlib
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+# Tables whose writes invalidate report results
+TABLES = ("attendance", "performance", "employee", "department")
+
+MISSING = object()
+
+
+def _version_key(table):
+    return f"report-data-version:{table}"
+
+
+def _modified_key(table):
+    return f"report-data-modified:{table}"
+
+
+def _fresh_version():
+    # Time-based so a version evicted from the cache never restarts at a
+    # value that was already used for an older state of the table.
+    return time.time_ns()
+
+
+class ReportCache:
+    """
+    Thin wrapper around a Django cache alias that adds data versioning and
+    hit/miss counters (per process).
+    """
+
+    def __init__(self, alias=None, timeout=None):
+        self._alias = alias
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self._alias or getattr(settings, "REPORTS_CACHE_ALIAS", "default")]
+
+    @property
+    def timeout(self):
+        if self._timeout is not None:
+            return self._timeout
+        return getattr(settings, "REPORTS_CACHE_TIMEOUT", 0)
+
+    @property
+    def enabled(self):
+        return self.timeout > 0
+
+    # ─────────── data versions ───────────
+
+    def versions(self, tables):
+        """
+        Current data version of each table, initializing missing ones.
+        """
+        keys = {_version_key(table): table for table in tables}
+        found = self.backend.get_many(list(keys))
+        for key in keys:
+            if key not in found:
+                self.backend.add(key, _fresh_version(), timeout=None)
+                found[key] = self.backend.get(key)
+        return {keys[key]: found[key] for key in keys}
+
+    def bump(self, *tables):
+        """
+        Invalidate every cached result that depends on `tables`.
+        """
+        now = time.time()
+        for table in tables:
+            key = _version_key(table)
+            try:
+                self.backend.incr(key)
+            except ValueError:
+                self.backend.set(key, _fresh_version(), timeout=None)
+        self.backend.set_many({_modified_key(table): now for table in tables}, timeout=None)
+
+    def last_modified(self, tables):
+        """
+        Unix time of the latest bump of any of `tables`. A table never
+        bumped since the cache was (re)started counts as modified now, so
+        the answer may be too new but never too old.
+        """
+        keys = [_modified_key(table) for table in tables]
+        found = self.backend.get_many(keys)
+        for key in keys:
+            if key not in found:
+                now = time.time()
+                self.backend.add(key, now, timeout=None)
+                found[key] = self.backend.get(key, now)
+        return max(found.values())
+
+    def bump_on_commit(self, *tables):
+        """
+        Bump now and again once the surrounding transaction commits: a reader
+        that computed from pre-commit data under the first bump is superseded
+        by the second one. Outside a transaction both happen immediately.
+        """
+        self.bump(*tables)
+        transaction.on_commit(lambda: self.bump(*tables))
+
+    # ─────────── results ───────────
+
+    def make_key(self, name, params, versions):
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        stamp = ".".join(str(versions[table]) for table in sorted(versions))
+        return f"report:{name}:{digest}:{stamp}"
+
+    def lookup(self, name, params, tables):
+        """
+        (key, cached value) for a report, the value being MISSING on a miss;
+        store(key, value) then saves the computed result. get_or_compute()
+        in two steps, for callers that compute outside the calling thread
+        (reports/async_views.py). With caching off the key is None.
+        """
+        if not self.enabled:
+            return None, MISSING
+        key = self.make_key(name, params, self.versions(tables))
+        value = self.backend.get(key, MISSING)
+        with self._lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return key, value
+
+    def store(self, key, value):
+        if key is None or not self.enabled:
+            return
+        self.backend.set(key, value, timeout=self.timeout)
+
+    def get_or_compute(self, name, params, tables, compute):
+        key, value = self.lookup(name, params, tables)
+        if value is MISSING:
+            value = compute()
+            self.store(key, value)
+        return value
+
+    def cached(self, name, tables):
+        """
+        Decorator caching a report function by its arguments. The wrapped
+        function stays reachable as `.uncached`, and `.lookup(*args,
+        **kwargs)` is lookup() for the same key the call would use.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                params = {"args": args, "kwargs": kwargs}
+                return self.get_or_compute(
+                    name, params, tables, lambda: func(*args, **kwargs)
+                )
+
+            def lookup(*args, **kwargs):
+                return self.lookup(name, {"args": args, "kwargs": kwargs}, tables)
+
+            wrapper.uncached = func
+            wrapper.lookup = lookup
+            return wrapper
+
+        return decorator
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+report_cache = ReportCache()
@@ -0,0 +1,111 @@
+# reports/conditional.py
+"""
+Conditional GET (ETag / Last-Modified -> 304) for DRF views, driven by the
+per-table data versions of reports/cache.py.
+
+The validators are computed right after authentication and permission
+checks, before the view's queryset or report runs:
+
+    ETag          = hash(path + query, Accept, today, data versions of
+                         `etag_tables`, and the user and roles unless
+                         `etag_per_user` is False)
+    Last-Modified = latest bump time of `etag_tables`
+
+A matching If-None-Match (or, without one, an If-Modified-Since at or after
+Last-Modified) is answered with 304 and no body; the handler and the
+serializer never run. Every write to a table bumps its version
+(reports/signals.py), so the validators change exactly when the data can.
+`today` is part of the ETag because several reports default to the current
+month.
+
+The versions only change in the processes that share the report cache
+backend, so the validators are only used with settings.CONDITIONAL_GET,
+which defaults to on when REPORTS_CACHE_URL is a shared backend.
+"""
+
+import hashlib
+import json
+from datetime import date
+
+from django.conf import settings
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from employees.roles import get_roles
+
+from .cache import report_cache
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+class _NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+class ConditionalGetMixin:
+    """
+    Add to a DRF view and list the report_cache tables its GET responses
+    are built from in `etag_tables` (or override get_etag_tables()). Views
+    whose data is the same for every user who may see it (the reports) set
+    `etag_per_user = False`, which also skips the role lookup.
+    """
+
+    etag_tables = ()
+    etag_per_user = True
+
+    def get_etag_tables(self):
+        return self.etag_tables
+
+    def compute_validators(self, request):
+        tables = sorted(self.get_etag_tables())
+        payload = [
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+            date.today().isoformat(),
+            report_cache.versions(tables),
+        ]
+        if self.etag_per_user:
+            # Role-scoped querysets: the same URL shows different rows per user
+            payload += [request.user.pk, sorted(get_roles(request.user))]
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:32]
+        return f'"{digest}"', int(report_cache.last_modified(tables))
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validators = None
+        if (
+            request.method not in SAFE_METHODS
+            or not self.get_etag_tables()
+            or not getattr(settings, "CONDITIONAL_GET", False)
+        ):
+            return
+        etag, last_modified = self._validators = self.compute_validators(request)
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match is not None:
+            etags = parse_etags(if_none_match)
+            if "*" in etags or etag in etags:
+                raise _NotModified()
+            return
+        if_modified_since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+        if if_modified_since is not None and last_modified <= if_modified_since:
+            raise _NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, "_validators", None)
+        if validators is not None and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            response["Cache-Control"] = "private, no-cache"
+        return response
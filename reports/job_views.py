@@ -0,0 +1,61 @@
+# reports/job_views.py
+"""
+HTTP side of the background report jobs (reports/jobs.py).
+"""
+
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from employees.authentication import CachedTokenAuthentication
+from employees.roles import is_staff_role
+
+from .jobs import ReportJobCreateSerializer, ReportJobSerializer, enqueue
+from .models import ReportJob
+
+
+class ReportJobListAPIView(APIView):
+    """
+    POST /api/reports/jobs/
+    Body: {"report": "attendance-rate-matrix" | "performance-chart" | "timeseries",
+           "params": {...}}
+    Enqueues the report (or finds the user's identical job already queued) and
+    answers 202 with the job; poll its Location until "status" is "done"
+    or "failed".
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = ReportJobCreateSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        job, _ = enqueue(
+            serializer.validated_data["report"],
+            serializer.validated_data["params"],
+            user=request.user,
+        )
+        return Response(
+            ReportJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("report-job-detail", args=[job.pk])},
+        )
+
+
+class ReportJobDetailAPIView(APIView):
+    """
+    GET /api/reports/jobs/<id>/
+    The job's status and, once done, its result. Only Admin and HR can
+    read other users' jobs.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        jobs = ReportJob.objects.all()
+        if not is_staff_role(request.user):
+            jobs = jobs.filter(created_by=request.user)
+        job = get_object_or_404(jobs, pk=pk)
+        return Response(ReportJobSerializer(job).data, status=status.HTTP_200_OK)
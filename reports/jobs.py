@@ -0,0 +1,376 @@
+# reports/jobs.py
+"""
+Background report jobs.
+
+Long ranges (multi-year performance charts, department × month attendance
+matrices) can take seconds; instead of holding a web worker for that long,
+clients enqueue them:
+
+    POST /api/reports/jobs/     {"report": "attendance-rate-matrix",
+                                 "params": {"start": "2020-01", "end": "2024-12"}}
+        -> 202 {"id": 7, "status": "pending", ...}
+    GET  /api/reports/jobs/7/   -> {"status": "done", "result": {...}, ...}
+
+Jobs are ReportJob rows. `manage.py run_report_workers` runs worker
+processes that claim the oldest pending job with
+SELECT ... FOR UPDATE SKIP LOCKED, so workers never wait on or run each
+other's jobs, then store the result as zlib-compressed JSON. A job whose
+worker died is requeued once its lease (settings.REPORT_JOB_LEASE seconds)
+runs out, at most MAX_ATTEMPTS times.
+
+Parameters are validated and normalized on enqueue, with the same role
+rules as the synchronous endpoints (a time series of a user without the
+Admin or HR role is limited to their own rows). A request identical to a
+job of the same user still pending or running returns that job instead of
+a new one (the reportjob_unique_active partial unique index backs this up
+under races). Only the creator, Admin and HR can read a job.
+
+Jobs always compute from the database, never from the report cache: the
+worker process cannot see the invalidations of the web processes unless
+the cache is shared.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import serializers
+
+from employee_project.renderers import FastJSONRenderer
+
+from .models import ReportJob
+from .timeseries import SOURCES, time_series
+from .views import (
+    attendance_rate_matrix,
+    monthly_average_ratings,
+    parse_month,
+    scope_time_series,
+)
+
+logger = logging.getLogger(__name__)
+
+ACTIVE = (ReportJob.PENDING, ReportJob.RUNNING)
+MAX_ATTEMPTS = 3
+
+
+# ─────────── reports ───────────
+
+
+class MonthField(serializers.Field):
+    """
+    "YYYY-MM" <-> date(YYYY, MM, 1).
+    """
+
+    default_error_messages = {"invalid": "Use YYYY-MM."}
+
+    def to_internal_value(self, data):
+        try:
+            return parse_month(str(data))
+        except ValueError:
+            self.fail("invalid")
+
+    def to_representation(self, value):
+        return value.strftime("%Y-%m")
+
+
+class JobParams(serializers.Serializer):
+    """
+    Parameters of a job report; subclasses add the fields and a
+    run(**validated params) staticmethod computing the report.
+    """
+
+    @staticmethod
+    def scope(user, params):
+        """
+        `params` as `user` may run them (raises serializers.ValidationError
+        or PermissionDenied otherwise).
+        """
+        return params
+
+
+class AttendanceRateMatrixParams(JobParams):
+    start = MonthField()
+    end = MonthField()
+    department_id = serializers.IntegerField(required=False, allow_null=True, default=None)
+
+    @staticmethod
+    def run(start, end, department_id):
+        return attendance_rate_matrix.uncached(start, end, department_id)
+
+
+class PerformanceChartParams(JobParams):
+    start = MonthField()
+    end = MonthField()
+
+    @staticmethod
+    def run(start, end):
+        labels, data_values = monthly_average_ratings.uncached(start, end)
+        return {"labels": labels, "data": data_values}
+
+
+class TimeSeriesParams(JobParams):
+    source = serializers.ChoiceField(choices=list(SOURCES))
+    granularity = serializers.CharField(default="month")
+    start = serializers.DateField()
+    end = serializers.DateField()
+    group_by = serializers.ListField(child=serializers.CharField(), default=list)
+    measures = serializers.ListField(child=serializers.CharField(), default=lambda: ["count"])
+    filters = serializers.DictField(child=serializers.CharField(), default=dict)
+
+    @staticmethod
+    def scope(user, params):
+        # the rules of TimeSeriesAPIView
+        try:
+            filters = scope_time_series(
+                user, params["source"], params["group_by"], params["filters"]
+            )
+        except ValueError as exc:
+            raise serializers.ValidationError({"group_by": [str(exc)]})
+        return dict(params, filters=filters)
+
+    @staticmethod
+    def run(**params):
+        result = time_series(**params)
+        payload = dict(result, source=params["source"])
+        payload["buckets"] = [bucket.isoformat() for bucket in result["buckets"]]
+        return payload
+
+
+# name -> parameter serializer, whose run(**validated params) computes the report
+JOB_REPORTS = {
+    "attendance-rate-matrix": AttendanceRateMatrixParams,
+    "performance-chart": PerformanceChartParams,
+    "timeseries": TimeSeriesParams,
+}
+
+
+def validated_params(report, params):
+    """
+    Validated parameters for `report`; raises serializers.ValidationError.
+    """
+    serializer = JOB_REPORTS[report](data=params)
+    serializer.is_valid(raise_exception=True)
+    return serializer
+
+
+def dedupe_key(report, params, user=None):
+    user_id = user.pk if user is not None else None
+    payload = json.dumps([report, params, user_id], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def encode_result(data):
+    body = FastJSONRenderer().render(data)
+    return zlib.compress(body, 6), len(body)
+
+
+def decode_result(blob):
+    return json.loads(zlib.decompress(bytes(blob)))
+
+
+# ─────────── API serializers ───────────
+
+
+class ReportJobCreateSerializer(serializers.Serializer):
+    """
+    Validates a job request; with a "request" in the context the parameters
+    are also restricted to what its user may see.
+    """
+
+    report = serializers.ChoiceField(choices=sorted(JOB_REPORTS))
+    params = serializers.DictField(default=dict)
+
+    def validate(self, attrs):
+        try:
+            params = validated_params(attrs["report"], attrs["params"])
+            # normalized form (e.g. "2024-1" -> "2024-01", defaults filled in)
+            normalized = dict(params.data)
+            request = self.context.get("request")
+            if request is not None:
+                normalized = JOB_REPORTS[attrs["report"]].scope(request.user, normalized)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"params": exc.detail})
+        attrs["params"] = normalized
+        return attrs
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    result = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id", "report", "params", "status", "created_at", "started_at",
+            "finished_at", "attempts", "result_bytes", "error", "result",
+        ]
+
+    def get_result(self, job):
+        if job.status != ReportJob.DONE or job.result is None:
+            return None
+        return decode_result(job.result)
+
+
+# ─────────── queue ───────────
+
+
+def enqueue(report, params, user=None):
+    """
+    (job, created): a new pending job, or the identical one of the same
+    user already pending or running. `params` must be normalized and scoped
+    (ReportJobCreateSerializer).
+    """
+    key = dedupe_key(report, params, user)
+    active = ReportJob.objects.filter(dedupe_key=key, status__in=ACTIVE)
+    job = active.first()
+    if job is not None:
+        return job, False
+    try:
+        with transaction.atomic():
+            job = ReportJob.objects.create(
+                report=report, params=params, dedupe_key=key, created_by=user
+            )
+    except IntegrityError:
+        # a concurrent request enqueued it first
+        job = active.first()
+        if job is None:
+            raise
+        return job, False
+    return job, True
+
+
+def claim_job(worker):
+    """
+    Mark the oldest pending job as running by `worker` and return it, or
+    None when there is none.
+
+    Rows locked by other workers are skipped. Databases without
+    SELECT ... FOR UPDATE (SQLite) run both statements in autocommit, as a
+    read-then-write transaction there can deadlock on the lock upgrade, and
+    the conditional UPDATE decides which worker wins.
+    """
+    locking = connection.features.has_select_for_update
+    while True:
+        with transaction.atomic() if locking else nullcontext():
+            job = (
+                ReportJob.objects.select_for_update(skip_locked=True)
+                .filter(status=ReportJob.PENDING)
+                .order_by("created_at", "id")
+                .only("id")
+                .first()
+            )
+            if job is None:
+                return None
+            claimed = ReportJob.objects.filter(pk=job.pk, status=ReportJob.PENDING).update(
+                status=ReportJob.RUNNING,
+                started_at=timezone.now(),
+                worker=worker,
+                attempts=F("attempts") + 1,
+            )
+        if claimed:
+            return ReportJob.objects.defer("result").get(pk=job.pk)
+
+
+def requeue_stale(lease=None):
+    """
+    Return running jobs older than `lease` seconds (their worker is gone)
+    to the queue, or fail them after MAX_ATTEMPTS. Returns the number of
+    jobs touched.
+    """
+    lease = settings.REPORT_JOB_LEASE if lease is None else lease
+    if lease <= 0:
+        return 0
+    now = timezone.now()
+    stale = ReportJob.objects.filter(
+        status=ReportJob.RUNNING, started_at__lt=now - timedelta(seconds=lease)
+    )
+    failed = stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+        status=ReportJob.FAILED,
+        finished_at=now,
+        error=f"Worker lost after {MAX_ATTEMPTS} attempts.",
+    )
+    return failed + stale.update(status=ReportJob.PENDING, worker="")
+
+
+def run_job(job):
+    """
+    Compute a claimed job and store its result or error. Returns the final
+    status; a job requeued meanwhile (lease ran out) is left to its new
+    worker.
+    """
+    status, fields = ReportJob.DONE, {"error": ""}
+    try:
+        if job.report not in JOB_REPORTS:
+            raise ValueError(f"Unknown report '{job.report}'.")
+        params = validated_params(job.report, job.params)
+        data = params.run(**params.validated_data)
+        fields["result"], fields["result_bytes"] = encode_result(data)
+    except (ValueError, serializers.ValidationError) as exc:
+        # unknown report, invalid parameters or range (e.g. too many buckets)
+        status, fields["error"] = ReportJob.FAILED, str(exc)
+    except Exception as exc:
+        logger.exception("Report job %s failed", job.pk)
+        status, fields["error"] = ReportJob.FAILED, f"{type(exc).__name__}: {exc}"
+
+    updated = ReportJob.objects.filter(
+        pk=job.pk, status=ReportJob.RUNNING, attempts=job.attempts
+    ).update(status=status, finished_at=timezone.now(), **fields)
+    return status if updated else None
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(burst=False, poll_interval=1.0, max_jobs=None, lease=None):
+    """
+    Worker loop: claim and run jobs, sleeping `poll_interval` seconds when
+    the queue is empty. With `burst`, return once it is empty. Returns the
+    number of jobs run.
+    """
+    worker = worker_name()
+    count = 0
+    while max_jobs is None or count < max_jobs:
+        requeue_stale(lease)
+        job = claim_job(worker)
+        if job is None:
+            if burst:
+                break
+            time.sleep(poll_interval)
+            continue
+        status = run_job(job)
+        logger.info("Report job %s (%s) %s", job.pk, job.report, status or "requeued")
+        count += 1
+    return count
+
+
+def _init_process():
+    import django
+    from django.apps import apps
+
+    if not apps.ready:  # "spawn" start method
+        django.setup()
+
+
+def run_workers(processes=1, **options):
+    """
+    work(**options) in `processes` worker processes (in this process when
+    1). Returns the total number of jobs run.
+    """
+    if processes <= 1:
+        return work(**options)
+    # forked children must open their own connections
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_process) as pool:
+        futures = [pool.submit(work, **options) for _ in range(processes)]
+        return sum(future.result() for future in futures)
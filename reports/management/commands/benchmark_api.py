@@ -0,0 +1,148 @@
+# reports/management/commands/benchmark_api.py
+
+import json
+import platform
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from reports.benchmark import SCALES, compare, is_seeded, run_benchmark, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database at the chosen scale, request every GET route as "
+        "Admin/HR/Employee and record latency percentiles, query counts and DB time. "
+        "With --baseline, fail when an endpoint exceeds its query or latency budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=list(SCALES),
+            default="small",
+            help="Dataset size (default: small)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed for the generated data")
+        parser.add_argument(
+            "--workers", type=int, default=1, help="Processes used to generate the dataset"
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Requests per endpoint and role (default: 20)",
+        )
+        parser.add_argument(
+            "--output",
+            default="benchmark-report.json",
+            help="Where to write the JSON report (default: benchmark-report.json)",
+        )
+        parser.add_argument(
+            "--baseline",
+            help="Previous report to compare against; budgets are derived from it",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Write this run's report to --baseline instead of comparing",
+        )
+        parser.add_argument(
+            "--latency-factor",
+            type=float,
+            default=1.5,
+            help="Allowed p95 growth over the baseline (default: 1.5x)",
+        )
+        parser.add_argument(
+            "--latency-slack-ms",
+            type=float,
+            default=5.0,
+            help="Absolute p95 allowance on top of the factor, for noise (default: 5 ms)",
+        )
+        parser.add_argument(
+            "--query-slack",
+            type=int,
+            default=0,
+            help="Extra queries allowed over the baseline (default: 0)",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the test database between runs (skips re-seeding if it exists)",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        if options["update_baseline"] and not options["baseline"]:
+            raise CommandError("--update-baseline needs --baseline.")
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False, keepdb=options["keepdb"])
+        old_config = runner.setup_databases()
+        try:
+            if not is_seeded(options["seed"]):
+                self.stdout.write(f"Seeding '{options['scale']}' dataset ...")
+                seed_dataset(options["scale"], seed=options["seed"], workers=options["workers"])
+            results = run_benchmark(seed=options["seed"], iterations=options["iterations"])
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        report = {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "scale": options["scale"],
+                "seed": options["seed"],
+                "iterations": options["iterations"],
+                "database": connection.vendor,
+                "python": platform.python_version(),
+            },
+            "endpoints": results,
+        }
+        self._print_table(results)
+        self._write(options["output"], report)
+
+        if not options["baseline"]:
+            return
+        if options["update_baseline"]:
+            self._write(options["baseline"], report)
+            return
+
+        try:
+            with open(options["baseline"], encoding="utf-8") as fh:
+                baseline = json.load(fh)["endpoints"]
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Cannot read baseline {options['baseline']}: {exc}")
+
+        violations = compare(
+            results,
+            baseline,
+            latency_factor=options["latency_factor"],
+            latency_slack_ms=options["latency_slack_ms"],
+            query_slack=options["query_slack"],
+        )
+        if violations:
+            for violation in violations:
+                self.stdout.write(self.style.ERROR(violation))
+            raise CommandError(f"{len(violations)} endpoint budget(s) exceeded.")
+        self.stdout.write(self.style.SUCCESS("All endpoints within budget."))
+
+    def _print_table(self, results):
+        self.stdout.write(
+            f"{'endpoint':60} {'status':>8} {'queries':>7} {'db ms':>8} {'p50 ms':>8} {'p95 ms':>8}"
+        )
+        for key, row in sorted(results.items()):
+            status = ",".join(str(code) for code in row["status"])
+            self.stdout.write(
+                f"{key:60} {status:>8} {row['queries']:>7} {row['db_ms']:>8.2f} "
+                f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+            )
+
+    def _write(self, path, report):
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -0,0 +1,64 @@
+# reports/management/commands/benchmark_asgi.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from reports.benchmark import SCALES, is_seeded, seed_dataset, server_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database, then send the same concurrent report API requests "
+        "through the WSGI handler (sync views on threads) and the ASGI handler (async views "
+        "on an event loop) and compare throughput and p50/p95/p99 latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=list(SCALES), default="small", help="Dataset size (default: small)")
+        parser.add_argument("--seed", type=int, default=0, help="Seed for the generated data")
+        parser.add_argument("--requests", type=int, default=500, help="Requests per server (default: 500)")
+        parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight (default: 32)")
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Keep the report cache on (default: off, so every request queries the database)",
+        )
+        parser.add_argument("--keepdb", action="store_true", help="Reuse the test database between runs")
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be at least 1.")
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False, keepdb=options["keepdb"])
+        old_config = runner.setup_databases()
+        try:
+            if not is_seeded(options["seed"]):
+                self.stdout.write(f"Seeding '{options['scale']}' dataset ...")
+                seed_dataset(options["scale"], seed=options["seed"])
+            results = server_benchmark(
+                seed=options["seed"],
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+                cached=options["cached"],
+            )
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(
+            f"{'server':<6} {'conc':>5} {'requests':>8} {'errors':>6} {'req/s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['server']:<6} {row['concurrency']:>5} {row['requests']:>8} {row['errors']:>6} "
+                f"{row['throughput_rps']:>8.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+            )
@@ -0,0 +1,35 @@
+# reports/management/commands/benchmark_renderers.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.benchmark import renderer_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Time DRF's JSONRenderer against the orjson and MessagePack renderers on attendance "
+        "list and monthly attendance rate payloads, with encoded and gzipped sizes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Attendance rows per page (default: 1000)")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per renderer; the best is kept (default: 20)")
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+    def handle(self, *args, **options):
+        if options["rows"] < 1 or options["repeat"] < 1:
+            raise CommandError("--rows and --repeat must be at least 1.")
+        results = renderer_benchmark(rows=options["rows"], repeat=options["repeat"])
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(
+            f"{'payload':<24} {'renderer':<9} {'backend':<8} {'encode ms':>10} {'bytes':>9} {'gzip':>8}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['payload']:<24} {row['renderer']:<9} {row['backend']:<8} "
+                f"{row['encode_ms']:>10.2f} {row['bytes']:>9} {row['gzip_bytes']:>8}"
+            )
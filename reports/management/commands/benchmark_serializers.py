@@ -0,0 +1,35 @@
+# reports/management/commands/benchmark_serializers.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.benchmark import serializer_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Time DRF serialization of in-memory rows against the compiled values_list() "
+        "fast path (employees/fastpath.py) and check both render identical JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Rows per serializer (default: 10000)")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per path; the best is kept (default: 5)")
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+    def handle(self, *args, **options):
+        if options["rows"] < 1 or options["repeat"] < 1:
+            raise CommandError("--rows and --repeat must be at least 1.")
+        results = serializer_benchmark(rows=options["rows"], repeat=options["repeat"])
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(f"{'serializer':<12} {'rows':>7} {'drf ms':>9} {'fast ms':>9} {'speedup':>8}  json")
+        for row in results:
+            self.stdout.write(
+                f"{row['serializer']:<12} {row['rows']:>7} {row['drf_ms']:>9.1f} {row['fast_ms']:>9.1f} "
+                f"{row['speedup']:>7.1f}x  {'identical' if row['identical'] else 'DIFFERENT'}"
+            )
+        if not all(row["identical"] for row in results):
+            raise CommandError("The fast path rendered different JSON.")
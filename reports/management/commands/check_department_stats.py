@@ -0,0 +1,40 @@
+# reports/management/commands/check_department_stats.py
+
+from django.core.management.base import BaseCommand
+
+from reports.cache import report_cache
+from reports.stats import find_stats_drift, rebuild_department_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DepartmentStats with the Employee/Performance tables and report drift. "
+        "Use --fix to rewrite the drifted rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute and overwrite the rows that drifted",
+        )
+
+    def handle(self, *args, **options):
+        drift = find_stats_drift()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Department stats are consistent."))
+            return
+
+        for department_id, stored, expected in drift:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"department={department_id}: stored {stored}, expected {expected}"
+                )
+            )
+        self.stdout.write(self.style.WARNING(f"{len(drift)} drifted department(s)."))
+
+        if options["fix"]:
+            fixed = rebuild_department_stats([department_id for department_id, _, _ in drift])
+            # average-performance results were computed from the drifted rows
+            report_cache.bump("employee", "performance")
+            self.stdout.write(self.style.SUCCESS(f"Fixed {fixed} department(s)."))
@@ -0,0 +1,77 @@
+# reports/management/commands/rebuild_attendance_rollups.py
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.cache import report_cache
+from reports.rollups import find_drift, rebuild_rollups, refresh_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the DailyAttendanceRollup table from raw Attendance rows. "
+        "Use --check to only report drift, or --check --fix to repair just the drifted cells."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            type=str,
+            help="First date to process, YYYY-MM-DD (default: earliest attendance date)",
+        )
+        parser.add_argument(
+            "--end",
+            type=str,
+            help="Last date to process, YYYY-MM-DD (default: latest attendance date)",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Compare rollups with raw data and report drift without writing",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="With --check: recompute only the cells that drifted",
+        )
+
+    def handle(self, *args, **options):
+        start = self._parse_date(options["start"], "--start")
+        end = self._parse_date(options["end"], "--end")
+        if start and end and start > end:
+            raise CommandError("--start must be on or before --end.")
+
+        if not options["check"]:
+            written = rebuild_rollups(start, end)
+            # cached reports may have been computed from the drifted rollups
+            report_cache.bump("attendance")
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} rollup rows."))
+            return
+
+        drift = find_drift(start, end)
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Rollups are consistent."))
+            return
+
+        for department_id, day, stored, expected in drift:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"department={department_id} date={day}: stored {stored}, expected {expected}"
+                )
+            )
+        self.stdout.write(self.style.WARNING(f"{len(drift)} drifted cell(s)."))
+
+        if options["fix"]:
+            for department_id, day, _, _ in drift:
+                refresh_rollups([day], [department_id])
+            report_cache.bump("attendance")
+            self.stdout.write(self.style.SUCCESS(f"Fixed {len(drift)} cell(s)."))
+
+    def _parse_date(self, value, flag):
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise CommandError(f"{flag} must be a date in YYYY-MM-DD format.")
@@ -0,0 +1,49 @@
+# reports/management/commands/run_report_workers.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.jobs import run_workers
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background report jobs queued through POST /api/reports/jobs/ in a pool of "
+        "worker processes. Each worker claims the oldest pending job (FOR UPDATE SKIP LOCKED), "
+        "runs it and stores the compressed result."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=1, help="Worker processes (default: 1, in this process)"
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds a worker sleeps when the queue is empty (default: 1)",
+        )
+        parser.add_argument(
+            "--burst", action="store_true", help="Exit once the queue is empty instead of polling"
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            help="Jobs per worker before it exits (default: no limit)",
+        )
+
+    def handle(self, *args, **options):
+        if options["processes"] < 1:
+            raise CommandError("--processes must be at least 1.")
+        if options["max_jobs"] is not None and options["max_jobs"] < 1:
+            raise CommandError("--max-jobs must be at least 1.")
+        try:
+            count = run_workers(
+                processes=options["processes"],
+                burst=options["burst"],
+                poll_interval=options["poll_interval"],
+                max_jobs=options["max_jobs"],
+            )
+        except KeyboardInterrupt:
+            self.stdout.write("Interrupted.")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Ran {count} report job(s)."))
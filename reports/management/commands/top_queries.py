@@ -0,0 +1,72 @@
+# reports/management/commands/top_queries.py
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.slow_queries import aggregate, read_log, slow_query_log
+
+
+class Command(BaseCommand):
+    help = (
+        "Rank the statements captured by the slow query log by fingerprint "
+        "(total time, call count or p95)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            help="Slow query log to read (default: settings.SLOW_QUERY_LOG_FILE, rotated files included)",
+        )
+        parser.add_argument(
+            "--by",
+            choices=["total", "count", "p95"],
+            default="total",
+            help="Ranking (default: total time)",
+        )
+        parser.add_argument("--limit", type=int, default=20, help="Rows to show (default: 20)")
+        parser.add_argument("--since", help="Only entries at or after this ISO timestamp")
+        parser.add_argument("--view", help="Only entries issued by this view, e.g. AttendanceViewSet.list")
+        parser.add_argument("--json", action="store_true", help="Print the rows as JSON")
+
+    def handle(self, *args, **options):
+        path = options["file"] or getattr(settings, "SLOW_QUERY_LOG_FILE", "")
+        if path:
+            entries = read_log(path)
+        else:
+            # Without a log file only this process' buffer is available (e.g. a shell session)
+            entries = slow_query_log.recent()
+
+        since, view = options["since"], options["view"]
+        entries = [
+            entry
+            for entry in entries
+            if (not since or entry["ts"] >= since) and (not view or entry.get("view") == view)
+        ]
+        if not entries:
+            raise CommandError(
+                "No slow queries captured"
+                + (f" in {path}." if path else "; set SLOW_QUERY_LOG_FILE to collect them.")
+            )
+
+        ranked = aggregate(entries, order_by=options["by"])
+        rows = ranked[: options["limit"]]
+        if options["json"]:
+            self.stdout.write(json.dumps(rows, indent=2))
+            return
+
+        self.stdout.write(
+            f"{len(entries)} slow statements, {len(rows)} of "
+            f"{len(ranked)} fingerprints by {options['by']}:\n"
+        )
+        for rank, row in enumerate(rows, start=1):
+            self.stdout.write(
+                f"#{rank}  total {row['total_ms']:.1f} ms  calls {row['count']}  "
+                f"p95 {row['p95_ms']:.1f} ms  max {row['max_ms']:.1f} ms"
+            )
+            self.stdout.write(f"    views: {', '.join(row['views'][:3])}")
+            self.stdout.write(f"    {row['fingerprint'][:300]}")
+            for frame in row["stack"][-3:]:
+                self.stdout.write(f"      at {frame}")
+            self.stdout.write("")
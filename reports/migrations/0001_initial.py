@@ -0,0 +1,71 @@
+# Generated by Django 4.2.4 on 2026-10-18 12:15
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+import django.db.models.deletion
+
+
+def backfill_rollups(apps, schema_editor):
+    Attendance = apps.get_model("attendance", "Attendance")
+    DailyAttendanceRollup = apps.get_model("reports", "DailyAttendanceRollup")
+    statuses = ("present", "absent", "late")
+
+    rows = (
+        Attendance.objects.order_by()
+        .values("employee__department_id", "date")
+        .annotate(**{s: Count("id", filter=Q(status=s)) for s in statuses})
+    )
+    DailyAttendanceRollup.objects.bulk_create(
+        (
+            DailyAttendanceRollup(
+                department_id=row["employee__department_id"],
+                date=row["date"],
+                **{s: row[s] for s in statuses},
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("employees", "0001_initial"),
+        ("attendance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyAttendanceRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("present", models.IntegerField(default=0)),
+                ("absent", models.IntegerField(default=0)),
+                ("late", models.IntegerField(default=0)),
+                (
+                    "department",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attendance_rollups",
+                        to="employees.department",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("date", "department")},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.4 on 2026-10-18 12:22
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+import django.db.models.deletion
+
+
+def backfill_department_stats(apps, schema_editor):
+    Department = apps.get_model("employees", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    Performance = apps.get_model("performance", "Performance")
+    DepartmentStats = apps.get_model("reports", "DepartmentStats")
+
+    stats = {
+        pk: DepartmentStats(department_id=pk)
+        for pk in Department.objects.values_list("pk", flat=True)
+    }
+    for row in Employee.objects.order_by().values("department_id").annotate(n=Count("id")):
+        stats[row["department_id"]].employee_count = row["n"]
+    reviews = (
+        Performance.objects.order_by()
+        .values("employee__department_id")
+        .annotate(
+            n=Count("id"),
+            total=Sum("rating"),
+            total_sq=Sum(F("rating") * F("rating")),
+        )
+    )
+    for row in reviews:
+        dept_stats = stats[row["employee__department_id"]]
+        dept_stats.review_count = row["n"]
+        dept_stats.rating_sum = row["total"] or 0
+        dept_stats.rating_sumsq = row["total_sq"] or 0
+    DepartmentStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0001_initial"),
+        ("performance", "0001_initial"),
+        ("reports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DepartmentStats",
+            fields=[
+                (
+                    "department",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="employees.department",
+                    ),
+                ),
+                ("employee_count", models.IntegerField(default=0)),
+                ("review_count", models.IntegerField(default=0)),
+                ("rating_sum", models.BigIntegerField(default=0)),
+                ("rating_sumsq", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_department_stats, migrations.RunPython.noop),
+    ]
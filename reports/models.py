@@ -1,3 +1,115 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from employees.models import Department
+
+
+class DailyAttendanceRollup(models.Model):
+    """
+    Attendance counts per (department, date, status).
+    - Kept in step with Attendance by the receivers in reports/signals.py.
+    - Rebuilt / reconciled with `manage.py rebuild_attendance_rollups`.
+    """
+
+    department = models.ForeignKey(
+        Department, on_delete=models.CASCADE, related_name="attendance_rollups"
+    )
+    date = models.DateField()
+    present = models.IntegerField(default=0)
+    absent = models.IntegerField(default=0)
+    late = models.IntegerField(default=0)
+
+    class Meta:
+        # Date-leading so a month's rollup is a single index range read
+        unique_together = ("date", "department")
+
+    @property
+    def total(self):
+        return self.present + self.absent + self.late
+
+    def __str__(self):
+        return f"{self.department_id} @ {self.date}: {self.present}/{self.absent}/{self.late}"
+
+
+class DepartmentStats(models.Model):
+    """
+    Denormalized per-department totals behind the headcount and rating reports.
+    - Kept in step with Employee/Performance writes by reports/signals.py.
+    - Checked / repaired with `manage.py check_department_stats [--fix]`.
+    """
+
+    department = models.OneToOneField(
+        Department, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    employee_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    rating_sumsq = models.BigIntegerField(default=0)
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.review_count if self.review_count else None
+
+    @property
+    def rating_variance(self):
+        if not self.review_count:
+            return None
+        mean = self.rating_sum / self.review_count
+        return self.rating_sumsq / self.review_count - mean * mean
+
+    def __str__(self):
+        return f"{self.department_id}: {self.employee_count} employees, {self.review_count} reviews"
+
+
+class ReportJob(models.Model):
+    """
+    A report computed in the background (reports/jobs.py).
+    - Created by POST /api/reports/jobs/; an identical job of the same user
+      still pending or running is returned instead of a new one (`dedupe_key`).
+    - Claimed and run by `manage.py run_report_workers`.
+    - The result is stored as zlib-compressed JSON.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    report = models.CharField(max_length=64)
+    params = models.JSONField(default=dict)
+    # sha256 of (report, normalized params, creator id)
+    dedupe_key = models.CharField(max_length=64)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True)
+    result = models.BinaryField(null=True, blank=True)
+    result_bytes = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            # the workers' "oldest pending job" scan
+            models.Index(fields=["status", "created_at"], name="reportjob_status_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="reportjob_unique_active",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.report} #{self.pk} ({self.status})"
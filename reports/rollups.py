@@ -0,0 +1,207 @@
+# reports/rollups.py
+
+import calendar
+from datetime import date, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Q
+
+from attendance.models import Attendance
+from attendance.partitioning import attached_since
+from .models import DailyAttendanceRollup
+
+# Attendance.status values, which double as DailyAttendanceRollup column names
+STATUSES = tuple(value for value, _ in Attendance.STATUS_CHOICES)
+
+_date_field = Attendance._meta.get_field("date")
+
+
+def to_date(value):
+    """
+    Normalize a date or 'YYYY-MM-DD' string (as accepted by Attendance.date).
+    """
+    return _date_field.to_python(value)
+
+
+def month_bounds(year, month):
+    """
+    Return (first_day, first_day_of_next_month) for a year/month pair.
+    Raises ValueError for an invalid month.
+    """
+    first = date(year, month, 1)
+    num_days = calendar.monthrange(year, month)[1]
+    return first, first + timedelta(days=num_days)
+
+
+def apply_delta(department_id, day, status, delta):
+    """
+    Add `delta` to one rollup cell, creating the row on first increment.
+    """
+    if department_id is None or status not in STATUSES or not delta:
+        return
+    cell = DailyAttendanceRollup.objects.filter(department_id=department_id, date=day)
+    if cell.update(**{status: F(status) + delta}) or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            DailyAttendanceRollup.objects.create(
+                department_id=department_id, date=day, **{status: delta}
+            )
+    except IntegrityError:
+        # A concurrent writer created the row first; increment it instead
+        cell.update(**{status: F(status) + delta})
+
+
+def aggregate_cells(attendance_qs):
+    """
+    Group an Attendance queryset into unsaved DailyAttendanceRollup rows
+    (one GROUP BY query).
+    """
+    rows = (
+        attendance_qs.order_by()
+        .values("employee__department_id", "date")
+        .annotate(
+            **{status: Count("id", filter=Q(status=status)) for status in STATUSES}
+        )
+    )
+    return [
+        DailyAttendanceRollup(
+            department_id=row["employee__department_id"],
+            date=row["date"],
+            **{status: row[status] for status in STATUSES},
+        )
+        for row in rows
+    ]
+
+
+def refresh_rollups(dates, department_ids=None):
+    """
+    Recompute the rollup cells for the given dates (optionally restricted to
+    some departments) from the raw Attendance table.
+    Used by bulk write paths that bypass the per-row signals.
+    """
+    dates = sorted({to_date(day) for day in dates})
+    if not dates:
+        return 0
+
+    cells = DailyAttendanceRollup.objects.filter(date__in=dates)
+    source = Attendance.objects.filter(date__in=dates)
+    if department_ids is not None:
+        cells = cells.filter(department_id__in=department_ids)
+        source = source.filter(employee__department_id__in=department_ids)
+
+    with transaction.atomic():
+        cells.delete()
+        created = DailyAttendanceRollup.objects.bulk_create(
+            aggregate_cells(source), batch_size=1000
+        )
+    return len(created)
+
+
+def iter_months(start, end):
+    """
+    Yield (first_day, next_month_first_day) for every month touching [start, end].
+    """
+    year, month = start.year, start.month
+    while date(year, month, 1) <= end:
+        yield month_bounds(year, month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def attendance_date_range():
+    """
+    Return (min_date, max_date) over Attendance and the rollup table,
+    or (None, None) when both are empty.
+    """
+    raw = Attendance.objects.aggregate(lo=Min("date"), hi=Max("date"))
+    rolled = DailyAttendanceRollup.objects.aggregate(lo=Min("date"), hi=Max("date"))
+    lows = [d for d in (raw["lo"], rolled["lo"]) if d]
+    highs = [d for d in (raw["hi"], rolled["hi"]) if d]
+    if not lows:
+        return None, None
+    return min(lows), max(highs)
+
+
+def rebuildable_windows(start, end):
+    """
+    Yield the [window_start, window_end) part of every month in [start, end]
+    whose rollups can be recomputed, skipping detached months: on a
+    partitioned table (attendance/partitioning.py), months before the
+    earliest attached partition without any attendance rows left, whose
+    rollups are the only record kept.
+    """
+    floor = attached_since()
+    for first, next_first in iter_months(start, end):
+        window_start = max(first, start)
+        window_end = min(next_first, end + timedelta(days=1))
+        if (
+            floor is not None
+            and first < floor
+            and not Attendance.objects.filter(
+                date__gte=window_start, date__lt=window_end
+            ).exists()
+        ):
+            continue
+        yield window_start, window_end
+
+
+def rebuild_rollups(start=None, end=None):
+    """
+    Replace the rollup rows in [start, end] (default: everything) with fresh
+    aggregates, one month per transaction; detached months are kept as they
+    are. Returns the number of rows written.
+    """
+    lo, hi = attendance_date_range()
+    if lo is None:
+        return 0
+    start = start or lo
+    end = end or hi
+
+    written = 0
+    for window_start, window_end in rebuildable_windows(start, end):
+        with transaction.atomic():
+            DailyAttendanceRollup.objects.filter(
+                date__gte=window_start, date__lt=window_end
+            ).delete()
+            rows = aggregate_cells(
+                Attendance.objects.filter(date__gte=window_start, date__lt=window_end)
+            )
+            written += len(
+                DailyAttendanceRollup.objects.bulk_create(rows, batch_size=1000)
+            )
+    return written
+
+
+def find_drift(start=None, end=None):
+    """
+    Compare stored rollups with fresh aggregates (detached months excluded).
+    Returns a list of (department_id, date, stored_counts, expected_counts),
+    where each counts value is a {status: n} dict.
+    """
+    lo, hi = attendance_date_range()
+    if lo is None:
+        return []
+    start = start or lo
+    end = end or hi
+
+    empty = {status: 0 for status in STATUSES}
+    drift = []
+    for window_start, window_end in rebuildable_windows(start, end):
+        expected = {
+            (row.department_id, row.date): {s: getattr(row, s) for s in STATUSES}
+            for row in aggregate_cells(
+                Attendance.objects.filter(date__gte=window_start, date__lt=window_end)
+            )
+        }
+        stored = {
+            (row["department_id"], row["date"]): {s: row[s] for s in STATUSES}
+            for row in DailyAttendanceRollup.objects.filter(
+                date__gte=window_start, date__lt=window_end
+            ).values("department_id", "date", *STATUSES)
+        }
+        for key in sorted(set(expected) | set(stored), key=lambda k: (k[1], k[0])):
+            have = stored.get(key, empty)
+            want = expected.get(key, empty)
+            if have != want:
+                drift.append((key[0], key[1], have, want))
+    return drift
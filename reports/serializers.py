@@ -16,11 +16,12 @@ class DepartmentAttendanceSerializer(serializers.Serializer):
     Serializer for monthly-attendance-rate-by-department endpoint.
     Expects objects with:
       'department_id', 'department_name', 'total_days',
-      'days_present', 'days_absent', 'attendance_rate'
+      'days_present', 'days_absent', 'days_late', 'attendance_rate'
     """
     department_id = serializers.IntegerField()
     department_name = serializers.CharField()
     total_days = serializers.IntegerField()
     days_present = serializers.IntegerField()
     days_absent = serializers.IntegerField()
+    days_late = serializers.IntegerField()
     attendance_rate = serializers.FloatField()
@@ -0,0 +1,223 @@
+# reports/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from attendance.models import Attendance
+from attendance.signals import attendance_bulk_changed
+from employees.models import Department, Employee
+from performance.models import Performance
+
+from .cache import report_cache
+from .models import DepartmentStats
+from .rollups import apply_delta, refresh_rollups, to_date
+from .stats import adjust_stats, mark_deleting, review_totals, unmark_deleting
+
+
+def _department_id(attendance):
+    """
+    Department of an Attendance row's employee, without re-fetching the
+    employee when it is already cached (e.g. select_related / serializer).
+    """
+    if Attendance.employee.is_cached(attendance):
+        return attendance.employee.department_id
+    return (
+        Employee.objects.filter(pk=attendance.employee_id)
+        .values_list("department_id", flat=True)
+        .first()
+    )
+
+
+# ─────────── Attendance → DailyAttendanceRollup ───────────
+
+@receiver(pre_save, sender=Attendance)
+def remember_previous_attendance_cell(sender, instance, raw=False, **kwargs):
+    instance._rollup_previous = None
+    if raw or instance.pk is None:
+        return
+    instance._rollup_previous = (
+        Attendance.objects.filter(pk=instance.pk)
+        .values_list("employee__department_id", "date", "status")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Attendance)
+def update_rollup_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    current = (_department_id(instance), to_date(instance.date), instance.status)
+    if previous == current:
+        return
+    with transaction.atomic():
+        if previous is not None:
+            apply_delta(*previous, delta=-1)
+        apply_delta(*current, delta=1)
+
+
+@receiver(post_delete, sender=Attendance)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    department_id = _department_id(instance)
+    if department_id is not None:
+        apply_delta(department_id, to_date(instance.date), instance.status, delta=-1)
+
+
+@receiver(attendance_bulk_changed, sender=Attendance)
+def refresh_rollup_on_bulk_change(sender, dates, employee_ids, **kwargs):
+    department_ids = set(
+        Employee.objects.filter(pk__in=employee_ids).values_list(
+            "department_id", flat=True
+        )
+    )
+    refresh_rollups(dates, department_ids)
+
+
+# ─────────── Employee department moves ───────────
+
+@receiver(pre_save, sender=Employee)
+def remember_previous_department(sender, instance, raw=False, **kwargs):
+    instance._previous_department_id = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_department_id = (
+        Employee.objects.filter(pk=instance.pk)
+        .values_list("department_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Employee)
+def move_rollups_with_employee(sender, instance, created=False, raw=False, **kwargs):
+    previous = getattr(instance, "_previous_department_id", None)
+    if raw or created or previous is None or previous == instance.department_id:
+        return
+    dates = instance.attendances.values_list("date", flat=True)
+    refresh_rollups(dates, {previous, instance.department_id})
+
+
+# ─────────── DepartmentStats ───────────
+
+@receiver(post_save, sender=Department)
+def create_department_stats(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        DepartmentStats.objects.get_or_create(department=instance)
+
+
+@receiver(pre_delete, sender=Department)
+def mark_department_deleting(sender, instance, using=None, **kwargs):
+    # the cascade deletes the stats row along with the employees and
+    # reviews; their delete signals must not touch it
+    mark_deleting(instance.pk, using)
+
+
+@receiver(post_delete, sender=Department)
+def unmark_department_deleting(sender, instance, using=None, **kwargs):
+    unmark_deleting(instance.pk, using)
+
+
+@receiver(post_save, sender=Employee)
+def update_stats_on_employee_save(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        adjust_stats(instance.department_id, employee_count=1)
+        return
+    previous = getattr(instance, "_previous_department_id", None)
+    if previous is None or previous == instance.department_id:
+        return
+    # The employee and all of their reviews move to the new department
+    totals = review_totals(instance.performances.all())
+    with transaction.atomic():
+        adjust_stats(previous, employee_count=-1, **{k: -v for k, v in totals.items()})
+        adjust_stats(instance.department_id, employee_count=1, **totals)
+
+
+@receiver(post_delete, sender=Employee)
+def update_stats_on_employee_delete(sender, instance, **kwargs):
+    # Reviews are removed first by the cascade and handled below
+    adjust_stats(instance.department_id, employee_count=-1)
+
+
+def _review_deltas(department_id, rating, sign):
+    return department_id, {
+        "review_count": sign,
+        "rating_sum": sign * rating,
+        "rating_sumsq": sign * rating * rating,
+    }
+
+
+def _review_department_id(performance):
+    if Performance.employee.is_cached(performance):
+        return performance.employee.department_id
+    return (
+        Employee.objects.filter(pk=performance.employee_id)
+        .values_list("department_id", flat=True)
+        .first()
+    )
+
+
+@receiver(pre_save, sender=Performance)
+def remember_previous_review(sender, instance, raw=False, **kwargs):
+    instance._stats_previous = None
+    if raw or instance.pk is None:
+        return
+    instance._stats_previous = (
+        Performance.objects.filter(pk=instance.pk)
+        .values_list("employee__department_id", "rating")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Performance)
+def update_stats_on_review_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_stats_previous", None)
+    current = (_review_department_id(instance), int(instance.rating))
+    if previous == current:
+        return
+    with transaction.atomic():
+        if previous is not None:
+            department_id, deltas = _review_deltas(*previous, sign=-1)
+            adjust_stats(department_id, **deltas)
+        department_id, deltas = _review_deltas(*current, sign=1)
+        adjust_stats(department_id, **deltas)
+
+
+@receiver(post_delete, sender=Performance)
+def update_stats_on_review_delete(sender, instance, **kwargs):
+    department_id, deltas = _review_deltas(
+        _review_department_id(instance), int(instance.rating), sign=-1
+    )
+    adjust_stats(department_id, **deltas)
+
+
+# ─────────── report cache invalidation ───────────
+
+def _connect_version_bump(model, table):
+    def bump_version(sender, raw=False, **kwargs):
+        report_cache.bump_on_commit(table)
+
+    for signal, action in ((post_save, "save"), (post_delete, "delete")):
+        signal.connect(
+            bump_version,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"report-cache-{table}-{action}",
+        )
+
+
+for _model, _table in (
+    (Attendance, "attendance"),
+    (Performance, "performance"),
+    (Employee, "employee"),
+    (Department, "department"),
+):
+    _connect_version_bump(_model, _table)
+
+
+@receiver(attendance_bulk_changed, sender=Attendance)
+def bump_version_on_bulk_change(sender, **kwargs):
+    report_cache.bump_on_commit("attendance")
@@ -0,0 +1,240 @@
+# reports/slow_queries.py
+"""
+Slow query log.
+
+An execute wrapper installed on every database connection (connection_created,
+see reports/apps.py) times each statement. Statements slower than
+settings.SLOW_QUERY_MS are recorded with:
+
+- fingerprint: the SQL with literals replaced by `?` and IN lists collapsed,
+  so `WHERE id IN (1, 2, 3)` and `WHERE id IN (4)` count as one query
+- view: the view serving the request, e.g. MonthlyAttendanceRateByDepartmentView.get
+  (set by MetricsMiddleware.process_view)
+- stack: the innermost project frames that issued the query
+
+Records go to an in-process ring buffer (`slow_query_log.recent()`) and,
+with settings.SLOW_QUERY_LOG_FILE, as JSON lines to a size-rotated file that
+`manage.py top_queries` aggregates across processes.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import traceback
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+
+current_view = ContextVar("slow_query_view", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.\"])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(?:\((?:\s*\?\s*,?)+\)\s*,?\s*)+", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+_SQL_MAX_LENGTH = 2000
+
+
+def fingerprint(sql):
+    """
+    SQL with literal values and list lengths normalized away.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _VALUES_LIST.sub("VALUES (...) ", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def view_label(view_func, request):
+    """
+    'ClassName.method' for class-based views, the function name otherwise.
+    """
+    view_class = getattr(view_func, "view_class", None) or getattr(view_func, "cls", None)
+    if view_class is None:
+        return getattr(view_func, "__qualname__", repr(view_func))
+    actions = getattr(view_func, "actions", None) or {}
+    method = request.method.lower()
+    return f"{view_class.__name__}.{actions.get(method, method)}"
+
+
+def _stack_excerpt(limit=5):
+    base = str(settings.BASE_DIR)
+    frames = [
+        f"{os.path.relpath(frame.filename, base)}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base)
+        and "site-packages" not in frame.filename
+        and not frame.filename.endswith("slow_queries.py")
+    ]
+    return frames[-limit:]
+
+
+class SlowQueryLog:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer = None
+        self._logger = None
+        self._file = None
+
+    @property
+    def threshold_ms(self):
+        return getattr(settings, "SLOW_QUERY_MS", 200)
+
+    @property
+    def buffer(self):
+        size = getattr(settings, "SLOW_QUERY_BUFFER_SIZE", 500)
+        if self._buffer is None or self._buffer.maxlen != size:
+            with self._lock:
+                self._buffer = deque(self._buffer or (), maxlen=size)
+        return self._buffer
+
+    def _file_logger(self):
+        path = getattr(settings, "SLOW_QUERY_LOG_FILE", "")
+        if not path:
+            return None
+        if self._file != path:
+            with self._lock:
+                logger = logging.getLogger("reports.slow_queries.file")
+                logger.propagate = False
+                logger.setLevel(logging.INFO)
+                for handler in list(logger.handlers):
+                    logger.removeHandler(handler)
+                    handler.close()
+                logger.addHandler(
+                    RotatingFileHandler(
+                        path,
+                        maxBytes=getattr(settings, "SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024),
+                        backupCount=getattr(settings, "SLOW_QUERY_LOG_BACKUPS", 5),
+                        encoding="utf-8",
+                    )
+                )
+                self._logger, self._file = logger, path
+        return self._logger
+
+    def record(self, sql, duration_ms, alias):
+        entry = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "ms": round(duration_ms, 3),
+            "alias": alias,
+            "fingerprint": fingerprint(sql),
+            "sql": sql[:_SQL_MAX_LENGTH],
+            "view": current_view.get(),
+            "stack": _stack_excerpt(),
+        }
+        self.buffer.append(entry)
+        logger = self._file_logger()
+        if logger is not None:
+            logger.info(json.dumps(entry))
+        return entry
+
+    def recent(self):
+        return list(self.buffer)
+
+    def clear(self):
+        self.buffer.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+class SlowQueryWrapper:
+    """
+    connection.execute_wrapper hook; one per connection.
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __call__(self, execute, sql, params, many, context):
+        threshold = slow_query_log.threshold_ms
+        if threshold is None or threshold < 0:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if elapsed >= threshold:
+                slow_query_log.record(sql, elapsed, self.alias)
+
+
+def install(sender, connection, **kwargs):
+    """
+    connection_created receiver. Inserted first so the wrappers pushed and
+    popped by execute_wrapper() context managers around it stay balanced.
+    """
+    if not any(isinstance(w, SlowQueryWrapper) for w in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, SlowQueryWrapper(connection.alias))
+
+
+# ─────────── aggregation (manage.py top_queries) ───────────
+
+
+def read_log(path):
+    """
+    Entries from `path` and its rotated siblings (path.1, path.2, ...),
+    oldest first. Unparseable lines are skipped.
+    """
+    paths = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        paths.append(f"{path}.{index}")
+        index += 1
+    paths.reverse()
+    if os.path.exists(path):
+        paths.append(path)
+    for name in paths:
+        with open(name, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+
+
+def aggregate(entries, order_by="total"):
+    """
+    One row per fingerprint with count, total/mean/p95/max ms, the views
+    issuing it (most frequent first) and the slowest occurrence's SQL and
+    stack, sorted by `order_by` (total, count or p95) descending.
+    """
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry["fingerprint"], []).append(entry)
+    rows = []
+    for key, items in groups.items():
+        durations = [item["ms"] for item in items]
+        slowest = max(items, key=lambda item: item["ms"])
+        views = {}
+        for item in items:
+            label = item.get("view") or "-"
+            views[label] = views.get(label, 0) + 1
+        rows.append(
+            {
+                "fingerprint": key,
+                "count": len(items),
+                "total_ms": round(sum(durations), 3),
+                "mean_ms": round(sum(durations) / len(durations), 3),
+                "p95_ms": round(_p95(durations), 3),
+                "max_ms": round(slowest["ms"], 3),
+                "views": sorted(views, key=views.get, reverse=True),
+                "example": slowest["sql"],
+                "stack": slowest.get("stack", []),
+            }
+        )
+    sort_key = {"total": "total_ms", "count": "count", "p95": "p95_ms"}[order_by]
+    rows.sort(key=lambda row: row[sort_key], reverse=True)
+    return rows
@@ -0,0 +1,151 @@
+# reports/stats.py
+
+from contextvars import ContextVar
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from employees.models import Department, Employee
+from performance.models import Performance
+from .models import DepartmentStats
+
+STAT_FIELDS = ("employee_count", "review_count", "rating_sum", "rating_sumsq")
+
+# (department id, atomic block) of departments whose delete (and cascade)
+# is in progress in this context
+_deleting = ContextVar("deleting_departments", default=frozenset())
+
+
+def _live_marks(using=None):
+    # marks whose atomic block is still open: the block a delete runs in
+    # exits, and is popped, even when the delete raises or rolls back
+    blocks = transaction.get_connection(using).atomic_blocks
+    return frozenset(mark for mark in _deleting.get() if mark[1] is None or mark[1] in blocks)
+
+
+def mark_deleting(department_id, using=None):
+    """
+    Ignore stats deltas for `department_id` until unmark_deleting() or the
+    end of the current atomic block (Collector.delete() opens one), so a
+    delete failing between pre_delete and post_delete leaves no mark behind.
+    """
+    blocks = transaction.get_connection(using).atomic_blocks
+    block = blocks[-1] if blocks else None
+    _deleting.set(_live_marks(using) | {(department_id, block)})
+
+
+def unmark_deleting(department_id, using=None):
+    _deleting.set(frozenset(mark for mark in _live_marks(using) if mark[0] != department_id))
+
+
+def is_deleting(department_id, using=None):
+    return any(mark[0] == department_id for mark in _live_marks(using))
+
+
+def review_totals(performance_qs):
+    """
+    {review_count, rating_sum, rating_sumsq} over a Performance queryset.
+    """
+    totals = performance_qs.aggregate(
+        review_count=Count("id"),
+        rating_sum=Sum("rating"),
+        rating_sumsq=Sum(F("rating") * F("rating")),
+    )
+    return {field: totals[field] or 0 for field in totals}
+
+
+def adjust_stats(department_id, **deltas):
+    """
+    Atomically add `deltas` (keyed by STAT_FIELDS) to a department's stats row,
+    creating the row if it does not exist yet.
+
+    Deltas for a department being deleted are ignored, and a missing row is
+    never created from a negative delta: the cascade may already have
+    removed it, and a row holding negative counts is wrong either way
+    (check_department_stats rebuilds missing rows).
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if department_id is None or not deltas or is_deleting(department_id):
+        return
+    row = DepartmentStats.objects.filter(department_id=department_id)
+    updates = {field: F(field) + value for field, value in deltas.items()}
+    if row.update(**updates):
+        return
+    if any(value < 0 for value in deltas.values()):
+        return
+    if not Department.objects.filter(pk=department_id).exists():
+        return
+    try:
+        with transaction.atomic():
+            DepartmentStats.objects.create(department_id=department_id, **deltas)
+    except IntegrityError:
+        row.update(**updates)
+
+
+def compute_stats(department_ids=None):
+    """
+    Fresh {department_id: {field: value}} from the raw tables
+    (two GROUP BY queries plus the department list).
+    """
+    departments = Department.objects.all()
+    employees = Employee.objects.all()
+    reviews = Performance.objects.all()
+    if department_ids is not None:
+        departments = departments.filter(pk__in=department_ids)
+        employees = employees.filter(department_id__in=department_ids)
+        reviews = reviews.filter(employee__department_id__in=department_ids)
+
+    stats = {pk: dict.fromkeys(STAT_FIELDS, 0) for pk in departments.values_list("pk", flat=True)}
+    for row in employees.order_by().values("department_id").annotate(n=Count("id")):
+        if row["department_id"] in stats:
+            stats[row["department_id"]]["employee_count"] = row["n"]
+    grouped = (
+        reviews.order_by()
+        .values("employee__department_id")
+        .annotate(
+            review_count=Count("id"),
+            rating_sum=Sum("rating"),
+            rating_sumsq=Sum(F("rating") * F("rating")),
+        )
+    )
+    for row in grouped:
+        department_id = row.pop("employee__department_id")
+        if department_id in stats:
+            stats[department_id].update({k: v or 0 for k, v in row.items()})
+    return stats
+
+
+def find_stats_drift(department_ids=None):
+    """
+    List of (department_id, stored, expected) for rows that disagree with the
+    raw tables; a missing row counts as all zeros.
+    """
+    expected = compute_stats(department_ids)
+    stored = {
+        row.pop("department_id"): row
+        for row in DepartmentStats.objects.filter(department_id__in=list(expected)).values(
+            "department_id", *STAT_FIELDS
+        )
+    }
+    empty = dict.fromkeys(STAT_FIELDS, 0)
+    return [
+        (department_id, stored.get(department_id, empty), values)
+        for department_id, values in sorted(expected.items())
+        if stored.get(department_id, empty) != values
+    ]
+
+
+def rebuild_department_stats(department_ids=None):
+    """
+    Overwrite stats rows with fresh aggregates. Used after bulk writes that
+    bypass the per-row signals, and by check_department_stats --fix.
+    """
+    stats = compute_stats(department_ids)
+    with transaction.atomic():
+        existing = DepartmentStats.objects.filter(department_id__in=list(stats))
+        existing.delete()
+        DepartmentStats.objects.bulk_create(
+            [DepartmentStats(department_id=pk, **values) for pk, values in stats.items()],
+            batch_size=1000,
+        )
+    return len(stats)
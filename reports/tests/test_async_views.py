@@ -0,0 +1,125 @@
+# reports/tests/test_async_views.py
+
+from datetime import date
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import resolve, reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITransactionTestCase
+
+from attendance.models import Attendance
+from employees.models import Department, Employee
+from performance.models import Performance
+from reports.async_views import attendance_rate_matrix_async
+from reports.benchmark import seed_dataset, server_benchmark
+from reports.cache import report_cache
+from reports.views import attendance_rate_matrix
+
+ASGI_URLCONF = "employee_project.urls_asgi"
+
+
+class AsyncReportViewTests(APITransactionTestCase):
+    # the async views query from pool threads, which only see committed rows
+
+    def setUp(self):
+        caches["reports"].clear()
+        eng = Department.objects.create(name="EngDept")
+        ops = Department.objects.create(name="Ops")
+        user = User.objects.create_user(username="alice", password="pass123")
+        self.token = Token.objects.create(user=user)
+        alice = Employee.objects.create(
+            name="Alice", email="alice@example.com", date_of_joining="2024-01-01",
+            department=eng, user=user,
+        )
+        bob = Employee.objects.create(
+            name="Bob", email="bob@example.com", date_of_joining="2024-01-01",
+            department=ops, user=User.objects.create_user(username="bob"),
+        )
+        for day, status in ((2, "present"), (3, "late"), (4, "absent")):
+            Attendance.objects.create(employee=alice, date=date(2024, 1, day), status=status)
+        Attendance.objects.create(employee=bob, date=date(2024, 3, 1), status="present")
+        Performance.objects.create(employee=alice, review_date=date(2024, 2, 1), rating=4)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+    def fetch(self, name, params, urlconf=None):
+        caches["reports"].clear()
+        if urlconf is None:
+            return self.client.get(reverse(name), params)
+        with override_settings(ROOT_URLCONF=urlconf):
+            return self.client.get(reverse(name), params)
+
+    def test_same_responses_as_the_sync_views(self):
+        cases = [
+            ("average-performance-by-department", {}),
+            ("monthly-attendance-rate-by-department", {"year": 2024, "month": 1}),
+            ("monthly-attendance-rate-by-department", {"start": "2024-01", "end": "2024-03"}),
+            ("monthly-attendance-rate-by-department", {"start": "2024-01", "end": "bad"}),
+            ("monthly-attendance-rate-by-department", {"department_id": "x"}),
+            ("monthly-attendance-chart-api", {"year": 2024, "month": 1}),
+            ("employees-per-department-api", {}),
+            ("monthly-attendance-overview-api", {"year": 2024, "month": 1}),
+            ("timeseries-api", {"source": "attendance", "start": "2024-01-01", "end": "2024-03-31"}),
+        ]
+        for name, params in cases:
+            with self.subTest(name, **params):
+                expected = self.fetch(name, params)
+                response = self.fetch(name, params, ASGI_URLCONF)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+
+    def test_report_routes_are_async(self):
+        with override_settings(ROOT_URLCONF=ASGI_URLCONF):
+            match = resolve(reverse("monthly-attendance-rate-by-department"))
+            self.assertTrue(match.func.view_class.view_is_async)
+            self.assertFalse(resolve(reverse("report-cache-stats-api")).func.view_class.view_is_async)
+
+    @override_settings(CONDITIONAL_GET=True)
+    def test_permissions_and_conditional_get(self):
+        with override_settings(ROOT_URLCONF=ASGI_URLCONF):
+            url = reverse("monthly-attendance-chart-api")
+            self.client.credentials()
+            self.assertEqual(self.client.get(url, {"year": 2024, "month": 1}).status_code, 401)
+
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+            response = self.client.get(url, {"year": 2024, "month": 1})
+            self.assertEqual(response.status_code, 200)
+            again = self.client.get(
+                url, {"year": 2024, "month": 1}, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+            self.assertEqual(again.status_code, 304)
+
+    @override_settings(REPORTS_CACHE_TIMEOUT=3600)
+    def test_matrix_shares_the_sync_cache_entry(self):
+        # as MonthlyAttendanceRateByDepartmentView calls it
+        args = (date(2024, 1, 1), date(2024, 3, 1), None)
+        matrix = async_to_sync(attendance_rate_matrix_async)(*args)
+        report_cache.reset_stats()
+        self.assertEqual(attendance_rate_matrix(*args), matrix)
+        self.assertEqual(report_cache.stats()["hits"], 1)
+
+    async def test_async_client(self):
+        with override_settings(ROOT_URLCONF=ASGI_URLCONF):
+            response = await self.async_client.get(
+                reverse("monthly-attendance-rate-by-department"),
+                {"start": "2024-01", "end": "2024-03"},
+                AUTHORIZATION="Token " + self.token.key,
+            )
+        self.assertEqual(response.status_code, 200)
+        rows = {row["department_name"]: row for row in response.json()["departments"]}
+        self.assertEqual(rows["EngDept"]["months"][0]["days_late"], 1)
+        self.assertEqual(rows["Ops"]["months"][2]["days_present"], 1)
+
+
+class ServerBenchmarkTests(APITransactionTestCase):
+    def test_wsgi_and_asgi_serve_the_same_requests(self):
+        seed_dataset("tiny", seed=5)
+        wsgi, asgi = server_benchmark(seed=5, requests=12, concurrency=3)
+        self.assertEqual((wsgi["server"], asgi["server"]), ("wsgi", "asgi"))
+        for row in (wsgi, asgi):
+            self.assertEqual(row["requests"], 12)
+            self.assertEqual(row["errors"], 0)
+            self.assertGreater(row["throughput_rps"], 0)
+            self.assertLessEqual(row["p50_ms"], row["p99_ms"])
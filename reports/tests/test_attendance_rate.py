@@ -0,0 +1,77 @@
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from employees.models import Department, Employee
+from attendance.models import Attendance
+from reports.views import attendance_rate_matrix
+from datetime import date
+
+
+class AttendanceRateMatrixTests(APITestCase):
+    def setUp(self):
+        caches["reports"].clear()
+
+        self.dept_eng = Department.objects.create(name="EngDept")
+        self.dept_hr = Department.objects.create(name="HRDept")
+
+        self.user = User.objects.create_user(username="alice", password="pass123")
+        self.token = Token.objects.create(user=self.user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_eng,
+            user=self.user
+        )
+        self.bob = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_hr,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+
+        Attendance.objects.create(employee=self.alice, date="2024-01-02", status="present")
+        Attendance.objects.create(employee=self.alice, date="2024-01-03", status="late")
+        Attendance.objects.create(employee=self.alice, date="2024-01-04", status="absent")
+        Attendance.objects.create(employee=self.alice, date="2024-01-05", status="present")
+        Attendance.objects.create(employee=self.bob, date="2024-03-01", status="present")
+
+        self.url = reverse("monthly-attendance-rate-by-department")
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+    def test_single_month_includes_late(self):
+        response = self.client.get(self.url, {"year": 2024, "month": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        eng = next(row for row in response.data if row["department_name"] == "EngDept")
+        self.assertEqual(eng["total_days"], 4)
+        self.assertEqual(eng["days_present"], 2)
+        self.assertEqual(eng["days_absent"], 1)
+        self.assertEqual(eng["days_late"], 1)
+        self.assertAlmostEqual(eng["attendance_rate"], 50.0)
+
+    def test_matrix_over_month_range(self):
+        response = self.client.get(self.url, {"start": "2024-01", "end": "2024-03"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["months"], ["2024-01", "2024-02", "2024-03"])
+
+        rows = {row["department_name"]: row["months"] for row in response.data["departments"]}
+        self.assertEqual([m["total_days"] for m in rows["EngDept"]], [4, 0, 0])
+        self.assertEqual([m["days_present"] for m in rows["HRDept"]], [0, 0, 1])
+        self.assertEqual(rows["HRDept"][2]["attendance_rate"], 100.0)
+
+    def test_query_count_independent_of_range_and_departments(self):
+        for i in range(5):
+            Department.objects.create(name=f"Extra{i}")
+        with self.assertNumQueries(2):
+            attendance_rate_matrix.uncached(date(2023, 1, 1), date(2024, 12, 1))
+
+    def test_invalid_range(self):
+        response = self.client.get(self.url, {"start": "2024-05", "end": "2024-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {"start": "2024", "end": "2024-02"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
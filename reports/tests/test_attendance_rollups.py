@@ -0,0 +1,105 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Department, Employee
+from attendance.models import Attendance
+from reports.models import DailyAttendanceRollup
+
+
+class DailyAttendanceRollupTests(APITestCase):
+    def setUp(self):
+        self.dept_eng = Department.objects.create(name="EngDept")
+        self.dept_hr = Department.objects.create(name="AB")
+
+        self.admin_group = Group.objects.create(name="Admin")
+        self.admin_user = User.objects.create_user(username="admin", password="pass123")
+        self.admin_group.user_set.add(self.admin_user)
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+        self.emp_user = User.objects.create_user(username="alice", password="pass123")
+        self.employee = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_eng,
+            user=self.emp_user
+        )
+        self.other_user = User.objects.create_user(username="bob", password="pass123")
+        self.other = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_hr,
+            user=self.other_user
+        )
+
+    def cell(self, department, day):
+        row = DailyAttendanceRollup.objects.filter(department=department, date=day).first()
+        return (row.present, row.absent, row.late) if row else (0, 0, 0)
+
+    def test_rollup_follows_create_update_delete(self):
+        att = Attendance.objects.create(employee=self.employee, date="2025-06-01", status="present")
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (1, 0, 0))
+
+        att.status = "late"
+        att.save()
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (0, 0, 1))
+
+        att.date = date(2025, 6, 2)
+        att.save()
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (0, 0, 0))
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 2)), (0, 0, 1))
+
+        att.delete()
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 2)), (0, 0, 0))
+
+    def test_rollup_follows_bulk_paths_and_department_moves(self):
+        Attendance.objects.bulk_create([
+            Attendance(employee=self.employee, date=date(2025, 6, 1), status="present"),
+            Attendance(employee=self.other, date=date(2025, 6, 1), status="absent"),
+        ])
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (1, 0, 0))
+        self.assertEqual(self.cell(self.dept_hr, date(2025, 6, 1)), (0, 1, 0))
+
+        Attendance.objects.filter(employee=self.other).update(status="present")
+        self.assertEqual(self.cell(self.dept_hr, date(2025, 6, 1)), (1, 0, 0))
+
+        self.employee.department = self.dept_hr
+        self.employee.save()
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (0, 0, 0))
+        self.assertEqual(self.cell(self.dept_hr, date(2025, 6, 1)), (2, 0, 0))
+
+        Attendance.objects.filter(employee=self.other).delete()
+        self.assertEqual(self.cell(self.dept_hr, date(2025, 6, 1)), (1, 0, 0))
+
+    def test_rebuild_command_repairs_drift(self):
+        Attendance.objects.create(employee=self.employee, date="2025-06-01", status="present")
+        DailyAttendanceRollup.objects.all().update(present=7)
+
+        out = StringIO()
+        call_command("rebuild_attendance_rollups", "--check", stdout=out)
+        self.assertIn("1 drifted cell(s)", out.getvalue())
+
+        call_command("rebuild_attendance_rollups", stdout=StringIO())
+        self.assertEqual(self.cell(self.dept_eng, date(2025, 6, 1)), (1, 0, 0))
+
+    def test_overview_reads_month_in_one_query(self):
+        Attendance.objects.create(employee=self.employee, date="2025-06-01", status="present")
+        Attendance.objects.create(employee=self.other, date="2025-06-01", status="present")
+        Attendance.objects.create(employee=self.other, date="2025-06-30", status="present")
+        url = reverse("monthly-attendance-overview-api")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.admin_token.key}")
+
+        # token lookup + rollup read
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {"year": 2025, "month": 6})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["present_counts"]), 30)
+        self.assertEqual(response.data["present_counts"][0], 2)
+        self.assertEqual(response.data["present_counts"][29], 1)
@@ -0,0 +1,69 @@
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from io import StringIO
+from reports.benchmark import compare, discover_routes, percentile, run_benchmark, seed_dataset
+
+
+class BenchmarkHelperTests(TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 95), 95)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_discover_routes_covers_api_reports_and_skips_admin(self):
+        names = {name for name, _ in discover_routes()}
+        for expected in (
+            "employee-list",
+            "employee-detail",
+            "attendance-export",
+            "timeseries-api",
+            "employees-per-department",
+            "schema-json",
+        ):
+            self.assertIn(expected, names)
+        self.assertFalse([name for name in names if name.startswith("admin:")])
+        # POST-only actions are not benchmarked
+        self.assertNotIn("attendance-bulk", names)
+
+    def test_compare_flags_query_and_latency_budgets(self):
+        baseline = {
+            "a [HR]": {"queries": 3, "p95_ms": 10.0},
+            "b [HR]": {"queries": 1, "p95_ms": 10.0},
+            "gone [HR]": {"queries": 1, "p95_ms": 1.0},
+        }
+        results = {
+            "a [HR]": {"queries": 4, "p95_ms": 12.0},
+            "b [HR]": {"queries": 1, "p95_ms": 30.0},
+        }
+        violations = compare(results, baseline, latency_factor=1.5, latency_slack_ms=5.0)
+        self.assertEqual(len(violations), 2)
+        self.assertTrue(violations[0].startswith("a [HR]: 4 queries"))
+        self.assertTrue(violations[1].startswith("b [HR]: p95"))
+        self.assertEqual(compare(results, baseline, query_slack=1, latency_factor=3), [])
+
+
+class BenchmarkRunTests(TestCase):
+    def test_every_route_is_measured_for_every_role(self):
+        seed_dataset("tiny", seed=3)
+        results = run_benchmark(seed=3, iterations=2)
+
+        for role in ("Admin", "HR", "Employee"):
+            row = results[f"employee-list [{role}]"]
+            self.assertEqual(row["status"], [200])
+            self.assertGreater(row["queries"], 0)
+            self.assertLessEqual(row["p50_ms"], row["max_ms"])
+        self.assertEqual(results["department-list [Employee]"]["status"], [403])
+        self.assertEqual(results["attendance-detail [Employee]"]["status"], [200])
+        self.assertFalse([key for key, row in results.items() if 500 in row["status"]])
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_update_baseline_requires_baseline(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_api", update_baseline=True, stdout=StringIO())
+
+    def test_iterations_must_be_positive(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_api", iterations=0, stdout=StringIO())
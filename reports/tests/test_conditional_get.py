@@ -0,0 +1,120 @@
+from datetime import date
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from attendance.models import Attendance
+from employees.authentication import token_cache
+from employees.models import Department, Employee
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "reports": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "conditional-tests",
+        },
+    },
+    CONDITIONAL_GET=True,
+    TOKEN_AUTH_CACHE_TTL=300,
+)
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        caches["reports"].clear()
+        token_cache.clear()
+        hr_group = Group.objects.create(name="HR")
+        emp_group = Group.objects.create(name="Employee")
+        self.hr_user = User.objects.create_user(username="hr", password="pass123")
+        hr_group.user_set.add(self.hr_user)
+        self.hr_token = Token.objects.create(user=self.hr_user)
+
+        dept = Department.objects.create(name="EngDept")
+        self.emp_user = User.objects.create_user(username="alice", password="pass123")
+        emp_group.user_set.add(self.emp_user)
+        self.emp_token = Token.objects.create(user=self.emp_user)
+        self.employee = Employee.objects.create(
+            name="Alice", email="alice@example.com", date_of_joining="2024-01-01",
+            department=dept, user=self.emp_user,
+        )
+        Attendance.objects.create(employee=self.employee, date=date(2025, 1, 6), status="present")
+        self.url = reverse("attendance-list")
+
+    def get(self, url=None, token=None, **headers):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + (token or self.hr_token).key)
+        return self.client.get(url or self.url, **headers)
+
+    def test_matching_etag_is_answered_without_running_the_view(self):
+        first = self.get()
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first["ETag"]
+        self.assertRegex(etag, r'^"[0-9a-f]{32}"$')
+        self.assertIn("Last-Modified", first)
+
+        with CaptureQueriesContext(connection) as context:
+            second = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second["ETag"], etag)
+        self.assertFalse([q for q in context.captured_queries if "attendance" in q["sql"]])
+
+    def test_writes_change_the_etag(self):
+        etag = self.get()["ETag"]
+        Attendance.objects.create(employee=self.employee, date=date(2025, 1, 7), status="late")
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_depends_on_user_and_query(self):
+        etag = self.get()["ETag"]
+        other = self.get(token=self.emp_token, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
+        filtered = self.get(self.url + "?status=late", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(filtered.status_code, status.HTTP_200_OK)
+
+    def test_if_modified_since(self):
+        last_modified = self.get()["Last-Modified"]
+        self.assertEqual(
+            self.get(HTTP_IF_MODIFIED_SINCE=last_modified).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        self.assertEqual(
+            self.get(HTTP_IF_MODIFIED_SINCE=http_date(0)).status_code, status.HTTP_200_OK
+        )
+
+    def test_reports_answer_304_without_queries(self):
+        url = reverse("monthly-attendance-chart-api") + "?year=2025&month=1"
+        etag = self.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        # report data is the same for every user
+        response = self.get(url, token=self.emp_token, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unsafe_methods_and_errors_get_no_validators(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.hr_token.key)
+        response = self.client.post(
+            self.url, {"employee": self.employee.pk, "date": "2025-01-08", "status": "present"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("ETag", response)
+        missing = self.get(reverse("attendance-detail", args=[999999]))
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", missing)
+
+    def test_off_without_a_shared_cache(self):
+        etag = self.get()["ETag"]
+        with override_settings(CONDITIONAL_GET=False):
+            response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
@@ -0,0 +1,124 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models.signals import pre_delete
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from employees.models import Department, Employee
+from performance.models import Performance
+from reports.models import DepartmentStats
+from reports.stats import compute_stats
+
+
+class DepartmentStatsTests(APITestCase):
+    def setUp(self):
+        self.dept_eng = Department.objects.create(name="EngDept")
+        self.dept_hr = Department.objects.create(name="AB")
+
+        self.user = User.objects.create_user(username="alice", password="pass123")
+        self.token = Token.objects.create(user=self.user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_eng,
+            user=self.user
+        )
+        self.bob = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_eng,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+
+    def stored(self, department):
+        row = DepartmentStats.objects.get(department=department)
+        return (row.employee_count, row.review_count, row.rating_sum, row.rating_sumsq)
+
+    def test_stats_follow_employee_and_review_writes(self):
+        self.assertEqual(self.stored(self.dept_eng), (2, 0, 0, 0))
+
+        review = Performance.objects.create(employee=self.alice, review_date="2025-01-10", rating=4)
+        Performance.objects.create(employee=self.bob, review_date="2025-01-11", rating=2)
+        self.assertEqual(self.stored(self.dept_eng), (2, 2, 6, 20))
+
+        review.rating = 5
+        review.save()
+        self.assertEqual(self.stored(self.dept_eng), (2, 2, 7, 29))
+
+        # Moving an employee moves their reviews too
+        self.alice.department = self.dept_hr
+        self.alice.save()
+        self.assertEqual(self.stored(self.dept_eng), (1, 1, 2, 4))
+        self.assertEqual(self.stored(self.dept_hr), (1, 1, 5, 25))
+
+        self.alice.delete()
+        self.assertEqual(self.stored(self.dept_hr), (0, 0, 0, 0))
+        self.assertEqual(
+            {pk: tuple(v.values()) for pk, v in compute_stats().items()},
+            {self.dept_eng.pk: self.stored(self.dept_eng), self.dept_hr.pk: self.stored(self.dept_hr)},
+        )
+
+    def test_deleting_a_department_with_employees_and_reviews(self):
+        Performance.objects.create(employee=self.alice, review_date="2024-02-01", rating=4)
+        Performance.objects.create(employee=self.bob, review_date="2024-02-01", rating=2)
+        department_id = self.dept_eng.pk
+
+        self.dept_eng.delete()
+        self.assertFalse(DepartmentStats.objects.filter(department_id=department_id).exists())
+        self.assertFalse(Employee.objects.filter(department_id=department_id).exists())
+
+        # later writes for other departments are still tracked
+        Employee.objects.create(
+            name="Carol", email="carol@example.com", date_of_joining="2024-01-01",
+            department=self.dept_hr, user=User.objects.create_user(username="carol"),
+        )
+        self.assertEqual(self.stored(self.dept_hr), (1, 0, 0, 0))
+
+    def test_a_failed_department_delete_keeps_stats_tracked(self):
+        def fail(sender, **kwargs):
+            raise RuntimeError("delete failed")
+
+        pre_delete.connect(fail, sender=Department)
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.dept_eng.delete()
+        finally:
+            pre_delete.disconnect(fail, sender=Department)
+
+        self.assertEqual(self.stored(self.dept_eng), (2, 0, 0, 0))
+        Performance.objects.create(employee=self.alice, review_date="2024-02-01", rating=4)
+        self.bob.delete()
+        self.assertEqual(self.stored(self.dept_eng), (1, 1, 4, 16))
+
+    def test_reports_read_precomputed_rows(self):
+        Performance.objects.create(employee=self.alice, review_date="2025-01-10", rating=4)
+        Performance.objects.create(employee=self.bob, review_date="2025-01-11", rating=3)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+        response = self.client.get(reverse("average-performance-by-department"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [{"department": "EngDept", "average_rating": 3.5, "num_reviews": 2}],
+        )
+
+        response = self.client.get(reverse("employees-per-department-api"))
+        counts = {row["department_name"]: row["employee_count"] for row in response.data}
+        self.assertEqual(counts, {"EngDept": 2, "AB": 0})
+
+    def test_check_command_reports_and_fixes_drift(self):
+        DepartmentStats.objects.filter(department=self.dept_eng).update(employee_count=9)
+
+        out = StringIO()
+        call_command("check_department_stats", stdout=out)
+        self.assertIn("1 drifted department(s)", out.getvalue())
+        self.assertEqual(self.stored(self.dept_eng)[0], 9)
+
+        call_command("check_department_stats", "--fix", stdout=StringIO())
+        self.assertEqual(self.stored(self.dept_eng), (2, 0, 0, 0))
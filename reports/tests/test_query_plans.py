@@ -0,0 +1,143 @@
+import re
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from employees.models import Department, Employee
+from attendance.models import Attendance
+from performance.models import Performance
+from reports.rollups import rebuild_rollups, refresh_rollups
+from reports.timeseries import time_series
+from reports.views import (
+    attendance_rate_matrix,
+    daily_present_counts,
+    monthly_attendance_totals,
+    monthly_average_ratings,
+)
+
+# Large tables that must always be read through an index
+FACT_TABLES = [
+    "attendance_attendance",
+    "performance_performance",
+    "reports_dailyattendancerollup",
+    "employees_employee",
+]
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("EXPLAIN " + sql)
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+
+def full_scans(plan):
+    """
+    Fact tables read with a sequential scan in an EXPLAIN plan.
+    """
+    tables = "|".join(FACT_TABLES)
+    if connection.vendor == "postgresql":
+        pattern = rf"Seq Scan on ({tables})\b"
+    else:
+        # SQLite: "SCAN t" is a table scan, "SCAN t USING ... INDEX" an index scan
+        pattern = rf"^\s*SCAN ({tables})\b(?!.*USING)"
+    return re.findall(pattern, plan, flags=re.MULTILINE)
+
+
+class ReportQueryPlanTests(TestCase):
+    """
+    EXPLAIN every query a report issues and fail if a fact table is read
+    with a sequential scan (e.g. after a non-sargable filter sneaks back in
+    or an index is dropped).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        departments = [Department.objects.create(name=f"Dept{i}") for i in range(3)]
+        employees = [
+            Employee.objects.create(
+                name=f"Emp{i}",
+                email=f"emp{i}@example.com",
+                date_of_joining=date(2023, 1 + i % 12, 1),
+                department=departments[i % 3],
+                user=User.objects.create_user(username=f"emp{i}", password="pass123"),
+            )
+            for i in range(12)
+        ]
+        start = date(2024, 1, 1)
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    employee=employee,
+                    date=start + timedelta(days=day),
+                    status=("present", "absent", "late")[(day + employee.id) % 3],
+                )
+                for employee in employees
+                for day in range(90)
+            ]
+        )
+        Performance.objects.bulk_create(
+            [
+                Performance(
+                    employee=employee,
+                    review_date=start + timedelta(days=30 * n),
+                    rating=1 + (employee.id + n) % 5,
+                )
+                for employee in employees
+                for n in range(3)
+            ]
+        )
+
+    def setUp(self):
+        if connection.vendor == "postgresql":
+            # Tiny test tables make sequential scans look cheapest; with them
+            # disabled a Seq Scan in the plan means no index can serve the query
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertIndexedPlans(self, label, func):
+        with CaptureQueriesContext(connection) as context:
+            func()
+        statements = [
+            q["sql"]
+            for q in context.captured_queries
+            if q["sql"].lstrip().upper().startswith(("SELECT", "DELETE", "UPDATE"))
+        ]
+        self.assertTrue(statements, label)
+        for sql in statements:
+            plan = explain(sql)
+            self.assertEqual(full_scans(plan), [], f"{label}:\n{sql}\n{plan}")
+
+    def test_report_queries_use_indexes(self):
+        first, last = date(2024, 1, 1), date(2024, 3, 1)
+        cases = {
+            "attendance rate matrix": lambda: attendance_rate_matrix.uncached(first, last),
+            "monthly attendance totals": lambda: monthly_attendance_totals.uncached(
+                first, date(2024, 2, 1)
+            ),
+            "daily present counts": lambda: daily_present_counts.uncached(2024, 2),
+            "monthly average ratings": lambda: monthly_average_ratings.uncached(first, last),
+            "attendance by department/status": lambda: time_series(
+                "attendance", "month", first, last, group_by=["department", "status"]
+            ),
+            "absences per day": lambda: time_series(
+                "attendance", "day", first, last, filters={"status": "absent"}
+            ),
+            "ratings by department": lambda: time_series(
+                "performance", "quarter", first, last,
+                group_by=["department"], measures=["avg:rating"],
+            ),
+            "hires per month": lambda: time_series(
+                "employees", "month", date(2023, 1, 1), date(2023, 12, 31),
+                group_by=["department"],
+            ),
+            "rollup refresh": lambda: refresh_rollups([date(2024, 1, 5)]),
+            "rollup rebuild": lambda: rebuild_rollups(date(2024, 2, 1), date(2024, 2, 29)),
+        }
+        for label, func in cases.items():
+            with self.subTest(label):
+                self.assertIndexedPlans(label, func)
@@ -0,0 +1,102 @@
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from employees.models import Department, Employee
+from performance.models import Performance
+from reports.cache import report_cache
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "reports": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "reports-tests",
+        },
+    },
+    REPORTS_CACHE_TIMEOUT=3600,
+    TOKEN_AUTH_CACHE_TTL=300,
+)
+class ReportCacheTests(APITestCase):
+    def setUp(self):
+        caches["reports"].clear()
+        report_cache.reset_stats()
+
+        self.admin_group = Group.objects.create(name="Admin")
+        self.admin_user = User.objects.create_user(username="admin", password="pass123")
+        self.admin_group.user_set.add(self.admin_user)
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+        self.dept = Department.objects.create(name="EngDept")
+        self.employee = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept,
+            user=User.objects.create_user(username="alice", password="pass123")
+        )
+        Performance.objects.create(employee=self.employee, review_date="2025-01-10", rating=4)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.admin_token.key}")
+
+    def test_repeated_report_is_served_from_cache(self):
+        url = reverse("average-performance-by-department")
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        # The token and the result are both cached: no queries at all
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(report_cache.stats()["hits"], 1)
+        self.assertEqual(report_cache.stats()["misses"], 1)
+
+    def test_writes_invalidate_cached_results(self):
+        url = reverse("average-performance-by-department")
+        self.assertEqual(self.client.get(url).data[0]["num_reviews"], 1)
+
+        Performance.objects.create(employee=self.employee, review_date="2025-02-10", rating=2)
+        response = self.client.get(url)
+        self.assertEqual(response.data[0]["num_reviews"], 2)
+        self.assertEqual(response.data[0]["average_rating"], 3.0)
+
+        self.dept.name = "Platform"
+        self.dept.save()
+        self.assertEqual(self.client.get(url).data[0]["department"], "Platform")
+        self.assertEqual(report_cache.stats()["hits"], 0)
+
+    def test_rebuild_commands_bump_versions(self):
+        before = report_cache.versions(["attendance", "performance"])
+        call_command("rebuild_attendance_rollups", stdout=StringIO())
+        after = report_cache.versions(["attendance", "performance"])
+        self.assertNotEqual(after["attendance"], before["attendance"])
+        self.assertEqual(after["performance"], before["performance"])
+
+    @override_settings(REPORTS_CACHE_TIMEOUT=0)
+    def test_timeout_zero_turns_caching_off(self):
+        url = reverse("average-performance-by-department")
+        first = self.client.get(url)
+        self.assertEqual(self.client.get(url).data, first.data)
+        self.assertEqual(report_cache.stats(), {"hits": 0, "misses": 0, "hit_rate": 0.0})
+        self.assertFalse(any(key.startswith(":1:report:") for key in caches["reports"]._cache))
+
+    def test_key_depends_on_params_and_versions(self):
+        key_a = report_cache.make_key("r", {"year": 2025}, {"attendance": 1})
+        self.assertNotEqual(key_a, report_cache.make_key("r", {"year": 2024}, {"attendance": 1}))
+        self.assertNotEqual(key_a, report_cache.make_key("r", {"year": 2025}, {"attendance": 2}))
+
+    def test_cache_stats_endpoint_is_admin_only(self):
+        url = reverse("report-cache-stats-api")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"hits", "misses", "hit_rate", "token_auth"})
+
+        other = Token.objects.create(user=self.employee.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {other.key}")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
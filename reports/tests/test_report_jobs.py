@@ -0,0 +1,199 @@
+# reports/tests/test_report_jobs.py
+
+import zlib
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from attendance.models import Attendance
+from employees.models import Department, Employee
+from performance.models import Performance
+from reports.jobs import MAX_ATTEMPTS, claim_job, enqueue, requeue_stale, run_job
+from reports.cache import report_cache
+from reports.models import ReportJob
+from reports.views import attendance_rate_matrix
+
+
+class ReportJobTests(APITestCase):
+    def setUp(self):
+        caches["reports"].clear()
+        self.user = User.objects.create_user(username="alice", password="pass123")
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=self.user).key)
+        employee = Employee.objects.create(
+            name="Alice", email="alice@example.com", date_of_joining="2024-01-01",
+            department=Department.objects.create(name="EngDept"), user=self.user,
+        )
+        self.employee = employee
+        for day, state in ((2, "present"), (3, "late"), (4, "absent")):
+            Attendance.objects.create(employee=employee, date=date(2024, 1, day), status=state)
+        Performance.objects.create(employee=employee, review_date=date(2024, 2, 1), rating=4)
+        self.url = reverse("report-job-list")
+
+    def submit(self, report, **params):
+        return self.client.post(self.url, {"report": report, "params": params}, format="json")
+
+    def login(self, username, group=None):
+        user = User.objects.create_user(username=username)
+        if group:
+            user.groups.add(Group.objects.get_or_create(name=group)[0])
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+        return user
+
+    def run_workers(self):
+        out = StringIO()
+        call_command("run_report_workers", burst=True, stdout=out)
+        return out.getvalue()
+
+    def test_enqueue_returns_pending_job_with_location(self):
+        response = self.submit("attendance-rate-matrix", start="2024-1", end="2024-03")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(
+            response.data["params"], {"start": "2024-01", "end": "2024-03", "department_id": None}
+        )
+        self.assertEqual(response["Location"], reverse("report-job-detail", args=[response.data["id"]]))
+        self.assertEqual(ReportJob.objects.get().created_by, self.user)
+
+    def test_identical_active_jobs_are_deduplicated(self):
+        first = self.submit("attendance-rate-matrix", start="2024-01", end="2024-03")
+        again = self.submit("attendance-rate-matrix", start="2024-1", end="2024-3", department_id=None)
+        other = self.submit("attendance-rate-matrix", start="2024-01", end="2024-04")
+        self.assertEqual(again.data["id"], first.data["id"])
+        self.assertNotEqual(other.data["id"], first.data["id"])
+
+        self.run_workers()
+        # a finished job is not reused
+        later = self.submit("attendance-rate-matrix", start="2024-01", end="2024-03")
+        self.assertNotEqual(later.data["id"], first.data["id"])
+        self.assertEqual(ReportJob.objects.count(), 3)
+
+    def test_invalid_requests_are_rejected(self):
+        self.assertEqual(self.submit("salaries").status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.submit("attendance-rate-matrix", start="January", end="2024-03")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("start", response.data["params"])
+
+        self.client.credentials()
+        response = self.submit("performance-chart", start="2024-01", end="2024-03")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_worker_stores_compressed_result_matching_the_report(self):
+        job_id = self.submit("attendance-rate-matrix", start="2024-01", end="2024-03").data["id"]
+        detail = reverse("report-job-detail", args=[job_id])
+        self.assertIsNone(self.client.get(detail).data["result"])
+
+        self.assertIn("Ran 1 report job(s).", self.run_workers())
+        response = self.client.get(detail)
+        self.assertEqual(response.data["status"], "done")
+        expected = self.client.get(
+            reverse("monthly-attendance-rate-by-department"), {"start": "2024-01", "end": "2024-03"}
+        )
+        self.assertEqual(response.data["result"], expected.json())
+
+        job = ReportJob.objects.get(pk=job_id)
+        self.assertEqual(len(zlib.decompress(job.result)), job.result_bytes)
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_performance_chart_and_timeseries_jobs(self):
+        chart = self.submit("performance-chart", start="2024-01", end="2024-03").data["id"]
+        series = self.submit(
+            "timeseries", source="attendance", start="2024-01-01", end="2024-01-31",
+            granularity="day", filters={"status": "late"},
+        ).data["id"]
+        self.run_workers()
+
+        result = self.client.get(reverse("report-job-detail", args=[chart])).data["result"]
+        self.assertEqual(result, {"labels": ["1/2024", "2/2024", "3/2024"], "data": [0.0, 4.0, 0.0]})
+        result = self.client.get(reverse("report-job-detail", args=[series])).data["result"]
+        self.assertEqual(result["source"], "attendance")
+        self.assertEqual(len(result["buckets"]), 31)
+        self.assertEqual(sum(result["series"][0]["values"]["count"]), 1)
+
+    def test_report_errors_fail_the_job(self):
+        job_id = self.submit(
+            "timeseries", source="attendance", start="2000-01-01", end="2024-12-31", granularity="day"
+        ).data["id"]
+        self.run_workers()
+        response = self.client.get(reverse("report-job-detail", args=[job_id]))
+        self.assertEqual(response.data["status"], "failed")
+        self.assertIn("Range too large", response.data["error"])
+        self.assertIsNone(response.data["result"])
+
+    def test_jobs_are_visible_to_their_creator_and_staff(self):
+        job_id = self.submit("performance-chart", start="2024-01", end="2024-03").data["id"]
+        detail = reverse("report-job-detail", args=[job_id])
+
+        self.login("bob")
+        self.assertEqual(self.client.get(detail).status_code, status.HTTP_404_NOT_FOUND)
+        # the same request from another user is a separate job
+        other = self.submit("performance-chart", start="2024-01", end="2024-03").data["id"]
+        self.assertNotEqual(other, job_id)
+
+        self.login("hana", group="HR")
+        self.assertEqual(self.client.get(detail).status_code, status.HTTP_200_OK)
+
+    def test_timeseries_jobs_follow_the_role_rules(self):
+        params = {"source": "attendance", "start": "2024-01-01", "end": "2024-01-31"}
+        response = self.submit("timeseries", group_by=["employee"], **params)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("group_by", response.data["params"])
+
+        response = self.submit("timeseries", filters={"employee": "999"}, **params)
+        self.assertEqual(response.data["params"]["filters"], {"employee": str(self.employee.pk)})
+
+        self.login("hana", group="HR")
+        response = self.submit("timeseries", group_by=["employee"], **params)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+    @override_settings(REPORTS_CACHE_TIMEOUT=3600)
+    def test_jobs_do_not_read_the_report_cache(self):
+        args = (date(2024, 1, 1), date(2024, 3, 1), None)
+        # e.g. an entry another process has not seen invalidated
+        key, _ = attendance_rate_matrix.lookup(*args)
+        report_cache.store(key, {"stale": True})
+        job_id = self.submit("attendance-rate-matrix", start="2024-01", end="2024-03").data["id"]
+        self.run_workers()
+        result = self.client.get(reverse("report-job-detail", args=[job_id])).data["result"]
+        self.assertEqual(result, attendance_rate_matrix.uncached(*args))
+        self.assertEqual(attendance_rate_matrix(*args), {"stale": True})
+
+    def test_claim_takes_the_oldest_pending_job(self):
+        older, _ = enqueue("performance-chart", {"start": "2024-01", "end": "2024-02"})
+        newer, _ = enqueue("performance-chart", {"start": "2024-01", "end": "2024-03"})
+        self.assertEqual(claim_job("w1").pk, older.pk)
+        claimed = claim_job("w2")
+        self.assertEqual((claimed.pk, claimed.status, claimed.worker), (newer.pk, "running", "w2"))
+        self.assertIsNone(claim_job("w3"))
+
+    def test_lost_jobs_are_requeued_then_failed(self):
+        job, _ = enqueue("performance-chart", {"start": "2024-01", "end": "2024-02"})
+        claimed = claim_job("lost")
+        long_ago = timezone.now() - timedelta(hours=1)
+        ReportJob.objects.filter(pk=job.pk).update(started_at=long_ago)
+
+        self.assertEqual(requeue_stale(lease=60), 1)
+        self.assertEqual(ReportJob.objects.get(pk=job.pk).status, "pending")
+        # the first worker finishing late does not overwrite the requeued job
+        self.assertIsNone(run_job(claimed))
+
+        ReportJob.objects.filter(pk=job.pk).update(
+            status="running", started_at=long_ago, attempts=MAX_ATTEMPTS
+        )
+        requeue_stale(lease=60)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertIn("Worker lost", job.error)
+
+    def test_command_validates_options(self):
+        with self.assertRaises(CommandError):
+            call_command("run_report_workers", processes=0, stdout=StringIO())
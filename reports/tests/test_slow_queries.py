@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User, Group
+from rest_framework.authtoken.models import Token
+from reports.slow_queries import aggregate, fingerprint, read_log, slow_query_log
+
+
+class FingerprintTests(APITestCase):
+    def test_literals_and_lists_are_normalized(self):
+        a = fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'x''y' AND t2.v > 1.5")
+        b = fingerprint("SELECT  *  FROM t WHERE id IN (7) AND name = 'z' AND t2.v > 10")
+        self.assertEqual(a, b)
+        self.assertEqual(a, "SELECT * FROM t WHERE id IN (...) AND name = ? AND t2.v > ?")
+        self.assertEqual(
+            fingerprint('INSERT INTO "t" ("a") VALUES (%s), (%s), (%s)'),
+            'INSERT INTO "t" ("a") VALUES (...)',
+        )
+
+    def test_aggregate_ranks_by_total_count_and_p95(self):
+        entries = [
+            {"fingerprint": "A", "ms": 10, "sql": "a", "view": "V.get"} for _ in range(10)
+        ] + [
+            {"fingerprint": "B", "ms": 300, "sql": "b", "view": "W.list"},
+            {"fingerprint": "B", "ms": 20, "sql": "b", "view": "W.list"},
+        ]
+        self.assertEqual([r["fingerprint"] for r in aggregate(entries)], ["B", "A"])
+        self.assertEqual([r["fingerprint"] for r in aggregate(entries, "count")], ["A", "B"])
+        top = aggregate(entries, "p95")[0]
+        self.assertEqual((top["fingerprint"], top["p95_ms"], top["count"]), ("B", 300, 2))
+        self.assertEqual(top["views"], ["W.list"])
+
+
+@override_settings(SLOW_QUERY_MS=0)
+class SlowQueryCaptureTests(APITestCase):
+    def setUp(self):
+        slow_query_log.clear()
+        hr_group = Group.objects.create(name="HR")
+        user = User.objects.create_user(username="hr", password="pass123")
+        hr_group.user_set.add(user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+        slow_query_log.clear()
+
+    def tearDown(self):
+        slow_query_log.clear()
+
+    def test_queries_are_recorded_with_view_and_stack(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slow.jsonl")
+            with override_settings(SLOW_QUERY_LOG_FILE=path):
+                self.client.get(
+                    reverse("monthly-attendance-rate-by-department"), {"year": 2024, "month": 1}
+                )
+            entries = list(read_log(path))
+            self.assertEqual(len(entries), len(slow_query_log.recent()))
+
+        views = {entry["view"] for entry in entries}
+        self.assertIn("MonthlyAttendanceRateByDepartmentView.get", views)
+        report = [e for e in entries if e["view"] == "MonthlyAttendanceRateByDepartmentView.get"]
+        self.assertTrue(any("reports/views.py" in frame for e in report for frame in e["stack"]))
+
+    def test_threshold_filters_fast_queries(self):
+        with override_settings(SLOW_QUERY_MS=10_000):
+            User.objects.count()
+        self.assertEqual(slow_query_log.recent(), [])
+        User.objects.count()
+        self.assertEqual(len(slow_query_log.recent()), 1)
+        self.assertEqual(slow_query_log.recent()[0]["alias"], connection.alias)
+
+    def test_top_queries_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slow.jsonl")
+            with override_settings(SLOW_QUERY_LOG_FILE=path):
+                for pk in range(3):
+                    User.objects.filter(pk=pk).exists()
+            # a rotated file is read as well
+            os.rename(path, path + ".1")
+            with override_settings(SLOW_QUERY_LOG_FILE=path):
+                User.objects.filter(pk=99).exists()
+
+            out = StringIO()
+            call_command("top_queries", file=path, by="count", json=True, stdout=out)
+            rows = json.loads(out.getvalue())
+            self.assertEqual(rows[0]["count"], 4)
+            self.assertIn('"auth_user"."id" = ?', rows[0]["fingerprint"])
+
+            out = StringIO()
+            call_command("top_queries", file=path, limit=1, stdout=out)
+            self.assertIn("#1  total", out.getvalue())
+
+            with self.assertRaises(CommandError):
+                call_command("top_queries", file=path, view="Nope.get", stdout=StringIO())
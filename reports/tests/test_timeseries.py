@@ -0,0 +1,146 @@
+from datetime import date
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import Group, User
+from rest_framework.authtoken.models import Token
+from employees.models import Department, Employee
+from attendance.models import Attendance
+from performance.models import Performance
+from reports.timeseries import time_series, bucket_range
+
+
+class TimeSeriesEngineTests(APITestCase):
+    def setUp(self):
+        self.dept_eng = Department.objects.create(name="EngDept")
+        self.dept_hr = Department.objects.create(name="AB")
+
+        self.user = User.objects.create_user(username="alice", password="pass123")
+        self.token = Token.objects.create(user=self.user)
+        self.alice = Employee.objects.create(
+            name="Alice",
+            email="alice@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_eng,
+            user=self.user
+        )
+        self.bob = Employee.objects.create(
+            name="Bob",
+            email="bob@example.com",
+            date_of_joining="2024-01-01",
+            department=self.dept_hr,
+            user=User.objects.create_user(username="bob", password="pass123")
+        )
+
+        Performance.objects.create(employee=self.alice, review_date="2024-01-10", rating=4)
+        Performance.objects.create(employee=self.bob, review_date="2024-01-20", rating=2)
+        Performance.objects.create(employee=self.alice, review_date="2024-03-05", rating=5)
+        Attendance.objects.create(employee=self.alice, date="2024-01-01", status="present")
+        Attendance.objects.create(employee=self.bob, date="2024-01-01", status="absent")
+        Attendance.objects.create(employee=self.bob, date="2024-01-02", status="present")
+
+    def test_bucket_range_per_granularity(self):
+        self.assertEqual(
+            bucket_range(date(2024, 1, 3), date(2024, 1, 15), "week"),
+            [date(2024, 1, 1), date(2024, 1, 8), date(2024, 1, 15)],
+        )
+        self.assertEqual(
+            bucket_range(date(2024, 2, 1), date(2024, 7, 1), "quarter"),
+            [date(2024, 1, 1), date(2024, 4, 1), date(2024, 7, 1)],
+        )
+        with self.assertRaises(ValueError):
+            bucket_range(date(2024, 1, 1), date(2024, 1, 1), "fortnight")
+
+    def test_dense_zero_filled_series_in_one_query(self):
+        with self.assertNumQueries(1):
+            result = time_series(
+                "performance",
+                "month",
+                date(2024, 1, 1),
+                date(2024, 4, 30),
+                measures=["count", "avg:rating", "max:rating"],
+            )
+        values = result["series"][0]["values"]
+        self.assertEqual(len(result["buckets"]), 4)
+        self.assertEqual(values["count"], [2, 0, 1, 0])
+        self.assertEqual(values["avg_rating"], [3.0, 0, 5.0, 0])
+        self.assertEqual(values["max_rating"], [4, 0, 5, 0])
+
+    def test_group_by_dimensions(self):
+        result = time_series(
+            "attendance",
+            "day",
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+            group_by=["department", "status"],
+        )
+        groups = {
+            (s["group"]["department"], s["group"]["status"]): s["values"]["count"]
+            for s in result["series"]
+        }
+        self.assertEqual(groups[(self.dept_eng.id, "present")], [1, 0])
+        self.assertEqual(groups[(self.dept_hr.id, "absent")], [1, 0])
+        self.assertEqual(groups[(self.dept_hr.id, "present")], [0, 1])
+
+    def test_performance_chart_costs_one_aggregate_query(self):
+        self.client.force_login(self.user)
+        url = reverse("performance-chart")
+        params = {"start_year": 2022, "start_month": 1, "end_year": 2023, "end_month": 12}
+        # session + user lookups, then the single GROUP BY
+        with self.assertNumQueries(3):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.context["chart_data"]), 24)
+
+    def test_timeseries_endpoint(self):
+        self.user.groups.add(Group.objects.create(name="HR"))
+        url = reverse("timeseries-api")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+        response = self.client.get(url, {
+            "source": "performance",
+            "granularity": "quarter",
+            "start": "2024-01-01",
+            "end": "2024-06-30",
+            "group_by": "department",
+            "measures": "count,avg:rating",
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["buckets"], ["2024-01-01", "2024-04-01"])
+        by_dept = {s["group"]["department"]: s["values"] for s in response.data["series"]}
+        self.assertEqual(by_dept[self.dept_eng.id]["count"], [2, 0])
+        self.assertEqual(by_dept[self.dept_hr.id]["avg_rating"], [2.0, 0])
+
+        response = self.client.get(url, {"source": "performance", "measures": "avg:status"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(url, {"source": "payroll"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_timeseries_is_scoped_to_the_employee(self):
+        url = reverse("timeseries-api")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        params = {"source": "attendance", "start": "2024-01-01", "end": "2024-01-31"}
+
+        response = self.client.get(url, dict(params, group_by="employee"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # another employee's id is replaced by the user's own
+        response = self.client.get(url, dict(params, employee=self.bob.id, group_by="status"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {s["group"]["status"]: s["values"]["count"] for s in response.data["series"]}
+        self.assertEqual(counts, {"present": [1]})
+
+        # department-level sources are not per employee
+        response = self.client.get(
+            url, {"source": "employees", "start": "2024-01-01", "end": "2024-01-31"}
+        )
+        self.assertEqual(response.data["series"][0]["values"]["count"], [2])
+
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Token " + Token.objects.create(
+                user=User.objects.create_user(username="carol")
+            ).key
+        )
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,254 @@
+# reports/timeseries.py
+"""
+Time-bucketed aggregation shared by the report endpoints.
+
+`time_series()` turns (source, granularity, date range, group-by dimensions,
+measures) into a single GROUP BY query and returns dense series where every
+bucket in the range is present (missing buckets are filled with `fill`).
+"""
+
+from datetime import date, timedelta
+
+from django.db.models import Avg, Count, Max, Min, Sum
+from django.db.models.functions import (
+    TruncDay,
+    TruncMonth,
+    TruncQuarter,
+    TruncWeek,
+    TruncYear,
+)
+
+from attendance.models import Attendance
+from employees.models import Employee
+from performance.models import Performance
+from .models import DailyAttendanceRollup
+
+GRANULARITIES = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+    "quarter": TruncQuarter,
+    "year": TruncYear,
+}
+
+AGGREGATES = {
+    "count": Count,
+    "avg": Avg,
+    "sum": Sum,
+    "min": Min,
+    "max": Max,
+}
+
+# Upper bound on buckets per request (e.g. ~5 years of days)
+MAX_BUCKETS = 2000
+
+
+class Source:
+    """
+    A reportable table: its date column, the dimensions it can be grouped or
+    filtered by (public name -> ORM path), the numeric fields measures may
+    aggregate and the data tables its results depend on (for reports.cache).
+    """
+
+    def __init__(self, model, date_field, dimensions, fields=(), tables=()):
+        self.model = model
+        self.date_field = date_field
+        self.dimensions = dimensions
+        self.fields = tuple(fields)
+        self.tables = tuple(tables)
+
+    def queryset(self):
+        return self.model.objects.all()
+
+
+SOURCES = {
+    "attendance": Source(
+        Attendance,
+        "date",
+        {
+            "department": "employee__department_id",
+            "status": "status",
+            "employee": "employee_id",
+        },
+        tables=["attendance", "employee"],
+    ),
+    "performance": Source(
+        Performance,
+        "review_date",
+        {"department": "employee__department_id", "employee": "employee_id"},
+        fields=["rating"],
+        tables=["performance", "employee"],
+    ),
+    "attendance_rollup": Source(
+        DailyAttendanceRollup,
+        "date",
+        {"department": "department_id"},
+        fields=["present", "absent", "late"],
+        tables=["attendance", "employee"],
+    ),
+    "employees": Source(
+        Employee,
+        "date_of_joining",
+        {"department": "department_id"},
+        tables=["employee"],
+    ),
+}
+
+
+# ─────────── bucket arithmetic (mirrors the database Trunc* functions) ───────────
+
+def bucket_start(day, granularity):
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    return date(day.year, 1, 1)
+
+
+def next_bucket(bucket, granularity):
+    if granularity == "day":
+        return bucket + timedelta(days=1)
+    if granularity == "week":
+        return bucket + timedelta(days=7)
+    if granularity == "year":
+        return date(bucket.year + 1, 1, 1)
+    step = 1 if granularity == "month" else 3
+    index = bucket.year * 12 + bucket.month - 1 + step
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def bucket_range(start, end, granularity):
+    """
+    Return every bucket start touching [start, end] (inclusive).
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(
+            f"Unknown granularity '{granularity}'. Choose from: {', '.join(GRANULARITIES)}."
+        )
+    if end < start:
+        raise ValueError("The end date must be on or after the start date.")
+    buckets = []
+    bucket = bucket_start(start, granularity)
+    while bucket <= end:
+        buckets.append(bucket)
+        if len(buckets) > MAX_BUCKETS:
+            raise ValueError(f"Range too large: more than {MAX_BUCKETS} buckets.")
+        bucket = next_bucket(bucket, granularity)
+    return buckets
+
+
+# ─────────── measures ───────────
+
+def parse_measure(spec, source):
+    """
+    'count' -> ('count', Count('pk')); 'avg:rating' -> ('avg_rating', Avg('rating')).
+    """
+    func_name, _, field = spec.partition(":")
+    if func_name not in AGGREGATES:
+        raise ValueError(
+            f"Unknown measure '{spec}'. Use count or one of "
+            f"{', '.join(f for f in AGGREGATES if f != 'count')} with ':<field>'."
+        )
+    if func_name == "count":
+        if field:
+            raise ValueError("'count' does not take a field.")
+        return "count", Count("pk")
+    if field not in source.fields:
+        allowed = ", ".join(source.fields) or "none"
+        raise ValueError(f"Measure '{spec}' needs a numeric field ({allowed}).")
+    return f"{func_name}_{field}", AGGREGATES[func_name](field)
+
+
+def time_series(
+    source,
+    granularity,
+    start,
+    end,
+    group_by=(),
+    measures=("count",),
+    filters=None,
+    fill=0,
+):
+    """
+    Aggregate `source` (a key of SOURCES) over [start, end] in one query.
+
+    - group_by: dimension names, e.g. ["department", "status"].
+    - measures: specs such as "count", "avg:rating", "sum:present".
+    - filters: {dimension: value} applied before grouping.
+
+    Returns:
+      {
+        "granularity": "month",
+        "buckets": [date, ...],
+        "series": [{"group": {"department": 1}, "values": {"count": [..]}}, ...],
+      }
+    Series are ordered by group key; a query without group_by always yields
+    exactly one series, even when there is no data.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}'. Choose from: {', '.join(SOURCES)}.")
+    src = SOURCES[source]
+
+    buckets = bucket_range(start, end, granularity)
+    group_by = list(group_by)
+    for dimension in list(group_by) + list(filters or {}):
+        if dimension not in src.dimensions:
+            raise ValueError(
+                f"Unknown dimension '{dimension}' for {source}. "
+                f"Choose from: {', '.join(src.dimensions)}."
+            )
+    if not measures:
+        raise ValueError("At least one measure is required.")
+    parsed = dict(parse_measure(spec, src) for spec in measures)
+
+    # Sargable range on the raw date column, then truncate for grouping
+    qs = src.queryset().filter(
+        **{
+            f"{src.date_field}__gte": buckets[0],
+            f"{src.date_field}__lt": next_bucket(buckets[-1], granularity),
+        }
+    )
+    for dimension, value in (filters or {}).items():
+        qs = qs.filter(**{src.dimensions[dimension]: value})
+
+    paths = [src.dimensions[d] for d in group_by]
+    rows = (
+        qs.order_by()
+        .annotate(_bucket=GRANULARITIES[granularity](src.date_field))
+        .values("_bucket", *paths)
+        .annotate(**parsed)
+    )
+
+    index = {bucket: i for i, bucket in enumerate(buckets)}
+    series = {}
+    if not group_by:
+        series[()] = {name: [fill] * len(buckets) for name in parsed}
+    for row in rows:
+        bucket = row["_bucket"]
+        if hasattr(bucket, "date"):
+            bucket = bucket.date()
+        key = tuple(row[path] for path in paths)
+        values = series.setdefault(key, {name: [fill] * len(buckets) for name in parsed})
+        for name in parsed:
+            if row[name] is not None:
+                values[name][index[bucket]] = row[name]
+
+    return {
+        "granularity": granularity,
+        "buckets": buckets,
+        "series": [
+            {"group": dict(zip(group_by, key)), "values": series[key]}
+            for key in sorted(series, key=lambda k: tuple((v is None, v) for v in k))
+        ],
+    }
+
+
+def single_series(result):
+    """
+    The values of an ungrouped time_series() result.
+    """
+    return result["series"][0]["values"]
@@ -3,6 +3,7 @@ from .views import (
     AveragePerformanceByDepartmentView,
     MonthlyAttendanceRateByDepartmentView,
     MonthlyAttendanceChartView,
+    TimeSeriesAPIView,
     attendance_chart_view,
     performance_chart_view,
     employees_per_department_view,
@@ -26,6 +27,11 @@ urlpatterns = [
         MonthlyAttendanceChartView.as_view(),
         name="monthly_attendance_chart_api",
     ),
+    path(
+        "timeseries/",
+        TimeSeriesAPIView.as_view(),
+        name="timeseries_api",
+    ),
 
     # Template‐rendered pages (Django templates)
     path(
@@ -2,73 +2,186 @@ from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 
 from rest_framework import permissions, views, status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
-
-from django.db.models import (
-    OuterRef,
-    Subquery,
-    Value,
-    Avg,
-    Count,
-    Q,
-    IntegerField,
-)
-from django.db.models.functions import Coalesce
 
-from employees.models import Department
-from performance.models import Performance
-from attendance.models import Attendance
+from employees.models import Department, Employee
+from employees.authentication import CachedTokenAuthentication, token_cache
+from employees.permissions import IsAdminGroup
+from employees.roles import is_staff_role
 
+from .cache import TABLES, report_cache
+from .conditional import ConditionalGetMixin
+from .models import DepartmentStats
+from .rollups import month_bounds
+from .timeseries import SOURCES, time_series, single_series
 from .serializers import DepartmentPerformanceSerializer, DepartmentAttendanceSerializer
 
-from datetime import date
-import calendar
+from datetime import date, timedelta
+
+
+@report_cache.cached("average-performance", tables=["performance", "employee", "department"])
+def average_performance_by_department():
+    # O(departments) read of the precomputed totals (see reports/stats.py)
+    queryset = (
+        DepartmentStats.objects.filter(review_count__gt=0)
+        .select_related("department")
+        .order_by("department_id")
+    )
+
+    return [
+        {
+            "department": stats.department.name,
+            "average_rating": round(stats.average_rating, 2),
+            "num_reviews": stats.review_count,
+        }
+        for stats in queryset
+    ]
 
 
-class AveragePerformanceByDepartmentView(APIView):
-    authentication_classes = [TokenAuthentication]
+class AveragePerformanceByDepartmentView(ConditionalGetMixin, APIView):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    etag_tables = ("performance", "employee", "department")
+    etag_per_user = False
 
     def get(self, request):
-        queryset = Department.objects.annotate(
-            avg_rating=Avg("employees__performances__rating"),
-            review_count=Count("employees__performances", distinct=True),
-        ).filter(review_count__gt=0)
-
-        data = [
-            {
-                "department": dept.name,
-                "average_rating": round(dept.avg_rating or 0, 2),
-                "num_reviews": dept.review_count,
-            }
-            for dept in queryset
-        ]
+        data = average_performance_by_department()
 
         serializer = DepartmentPerformanceSerializer(data=data, many=True)
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class MonthlyAttendanceRateByDepartmentView(APIView):
-    authentication_classes = [TokenAuthentication]
+def parse_month(value):
+    """
+    'YYYY-MM' -> date(YYYY, MM, 1). Raises ValueError when malformed.
+    """
+    year, _, month = (value or "").partition("-")
+    return date(int(year), int(month), 1)
+
+
+def _rate_cell(present, absent, late):
+    total = present + absent + late
+    return {
+        "total_days": total,
+        "days_present": present,
+        "days_absent": absent,
+        "days_late": late,
+        "attendance_rate": (present / total * 100) if total else 0,
+    }
+
+
+def attendance_rate_series(first_month, last_month, department_id=None):
+    """
+    Monthly present/absent/late sums per department from the daily rollup.
+    Raises ValueError for an invalid or oversized range.
+    """
+    filters = {"department": department_id} if department_id is not None else None
+    return time_series(
+        "attendance_rollup",
+        "month",
+        first_month,
+        last_month,
+        group_by=["department"],
+        measures=["sum:present", "sum:absent", "sum:late"],
+        filters=filters,
+    )
+
+
+def department_names(department_id=None):
+    """
+    [(id, name)] of the departments listed in the rate matrix.
+    """
+    dept_qs = Department.objects.order_by("name")
+    if department_id is not None:
+        dept_qs = dept_qs.filter(pk=department_id)
+    return list(dept_qs.values_list("id", "name"))
+
+
+def build_rate_matrix(result, departments):
+    by_department = {
+        series["group"]["department"]: series["values"] for series in result["series"]
+    }
+    empty = {
+        name: [0] * len(result["buckets"])
+        for name in ("sum_present", "sum_absent", "sum_late")
+    }
+
+    rows = []
+    for dept_id, dept_name in departments:
+        values = by_department.get(dept_id, empty)
+        rows.append(
+            {
+                "department_id": dept_id,
+                "department_name": dept_name,
+                "months": [
+                    dict(
+                        month=bucket.strftime("%Y-%m"),
+                        **_rate_cell(
+                            values["sum_present"][i],
+                            values["sum_absent"][i],
+                            values["sum_late"][i],
+                        ),
+                    )
+                    for i, bucket in enumerate(result["buckets"])
+                ],
+            }
+        )
+
+    return {
+        "months": [bucket.strftime("%Y-%m") for bucket in result["buckets"]],
+        "departments": rows,
+    }
+
+
+@report_cache.cached(
+    "attendance-rate-matrix", tables=["attendance", "employee", "department"]
+)
+def attendance_rate_matrix(first_month, last_month, department_id=None):
+    """
+    Department × month attendance counts and rates for [first_month, last_month].
+    Every status is counted in one grouped scan of the daily rollup, so the
+    cost is two queries however many departments and months are requested
+    (the async view runs the two concurrently).
+    Raises ValueError for an invalid or oversized range.
+    """
+    return build_rate_matrix(
+        attendance_rate_series(first_month, last_month, department_id),
+        department_names(department_id),
+    )
+
+
+class MonthlyAttendanceRateByDepartmentView(ConditionalGetMixin, APIView):
+    """
+    GET /api/reports/monthly-attendance-rate/?year=YYYY&month=MM[&department_id=N]
+        -> one row per department for that month.
+    GET /api/reports/monthly-attendance-rate/?start=YYYY-MM&end=YYYY-MM[&department_id=N]
+        -> department × month matrix for the whole range in one response.
+    """
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    etag_tables = ("attendance", "employee", "department")
+    etag_per_user = False
 
     def get(self, request, *args, **kwargs):
-        year_str = request.GET.get("year")
-        month_str = request.GET.get("month")
-
+        query = self.rate_query(request)
+        if isinstance(query, Response):
+            return query
+        first_month, last_month, dept_id_int = query
         try:
-            year_int = int(year_str)
-            month_int = int(month_str)
-        except (TypeError, ValueError):
-            return Response(
-                {"detail": "Invalid year or month parameter. Must be integers."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
+            matrix = attendance_rate_matrix(first_month, last_month, dept_id_int)
+        except ValueError as exc:
+            return self.range_error(exc)
+        return self.rate_response(request, matrix)
+
+    def rate_query(self, request):
+        """
+        (first_month, last_month, department_id) from the query string, or
+        a 400 Response.
+        """
         dept_id = request.GET.get("department_id")
         try:
             dept_id_int = int(dept_id) if dept_id is not None else None
@@ -78,72 +191,58 @@ class MonthlyAttendanceRateByDepartmentView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        attendance_qs = Attendance.objects.filter(
-            date__year=year_int,
-            date__month=month_int,
-            employee__department=OuterRef("pk"),
-        )
+        if self.is_range(request):
+            try:
+                first_month = parse_month(request.GET.get("start"))
+                last_month = parse_month(request.GET.get("end"))
+            except ValueError as exc:
+                return self.range_error(exc)
+            return first_month, last_month, dept_id_int
 
-        total_days_subquery = (
-            attendance_qs.values("employee__department")
-            .annotate(cnt=Count("id"))
-            .values("cnt")
-        )
+        year_str = request.GET.get("year")
+        month_str = request.GET.get("month")
 
-        present_days_subquery = (
-            attendance_qs.filter(status="present")
-            .values("employee__department")
-            .annotate(cnt=Count("id"))
-            .values("cnt")
-        )
+        try:
+            month_start = date(int(year_str), int(month_str), 1)
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "Invalid year or month parameter. Must be integers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return month_start, month_start, dept_id_int
 
-        absent_days_subquery = (
-            attendance_qs.filter(status="absent")
-            .values("employee__department")
-            .annotate(cnt=Count("id"))
-            .values("cnt")
+    @staticmethod
+    def is_range(request):
+        return "start" in request.GET or "end" in request.GET
+
+    @staticmethod
+    def range_error(exc):
+        return Response(
+            {"detail": f"Invalid start/end range; use YYYY-MM. {exc}".strip()},
+            status=status.HTTP_400_BAD_REQUEST,
         )
 
-        dept_qs = Department.objects.all()
-        if dept_id_int is not None:
-            dept_qs = dept_qs.filter(pk=dept_id_int)
-
-        dept_qs = dept_qs.annotate(
-            total_days=Coalesce(
-                Subquery(total_days_subquery, output_field=IntegerField()), Value(0)
-            ),
-            days_present=Coalesce(
-                Subquery(present_days_subquery, output_field=IntegerField()), Value(0)
-            ),
-            days_absent=Coalesce(
-                Subquery(absent_days_subquery, output_field=IntegerField()), Value(0)
-            ),
-        ).order_by("name")
-
-        data = []
-        for dept in dept_qs:
-            total = dept.total_days
-            present = dept.days_present
-            absent = dept.days_absent
-            attendance_rate = (present / total * 100) if total else 0
-
-            data.append(
-                {
-                    "department_id": dept.id,
-                    "department_name": dept.name,
-                    "total_days": total,
-                    "days_present": present,
-                    "days_absent": absent,
-                    "attendance_rate": attendance_rate,
-                }
+    def rate_response(self, request, matrix):
+        if self.is_range(request):
+            return Response(matrix, status=status.HTTP_200_OK)
+
+        data = [
+            dict(
+                department_id=row["department_id"],
+                department_name=row["department_name"],
+                **{k: v for k, v in row["months"][0].items() if k != "month"},
             )
+            for row in matrix["departments"]
+        ]
 
         return Response(data, status=status.HTTP_200_OK)
 
 
-class MonthlyAttendanceChartView(APIView):
-    authentication_classes = [TokenAuthentication]
+class MonthlyAttendanceChartView(ConditionalGetMixin, APIView):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    etag_tables = ("attendance",)
+    etag_per_user = False
 
     def get(self, request, *args, **kwargs):
         year_str = request.GET.get("year")
@@ -158,11 +257,18 @@ class MonthlyAttendanceChartView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        monthly_records = Attendance.objects.filter(date__year=year, date__month=month)
+        try:
+            first_day, next_month = month_bounds(year, month)
+        except ValueError:
+            return Response(
+                {"detail": "Invalid year or month parameter. Expect integers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        total_count = monthly_records.count()
-        present_count = monthly_records.filter(status="present").count()
-        absent_count = monthly_records.filter(status="absent").count()
+        totals = monthly_attendance_totals(first_day, next_month)
+        present_count = totals["present"]
+        absent_count = totals["absent"]
+        total_count = present_count + absent_count + totals["late"]
 
         data = {
             "year": year,
@@ -175,6 +281,44 @@ class MonthlyAttendanceChartView(APIView):
         return Response(data, status=status.HTTP_200_OK)
 
 
+@report_cache.cached("monthly-attendance-totals", tables=["attendance"])
+def monthly_attendance_totals(first_day, next_month):
+    """
+    Present/absent/late totals for one month, from a single rollup query.
+    """
+    result = time_series(
+        "attendance_rollup",
+        "month",
+        first_day,
+        next_month - timedelta(days=1),
+        measures=["sum:present", "sum:absent", "sum:late"],
+    )
+    values = single_series(result)
+    return {
+        "present": values["sum_present"][0],
+        "absent": values["sum_absent"][0],
+        "late": values["sum_late"][0],
+    }
+
+
+@report_cache.cached("daily-present-counts", tables=["attendance"])
+def daily_present_counts(year, month):
+    """
+    Present counts for each day of the month, read from the daily rollup
+    in a single range query. Days without data are 0.
+    Raises ValueError for an invalid month.
+    """
+    first_day, next_month = month_bounds(year, month)
+    result = time_series(
+        "attendance_rollup",
+        "day",
+        first_day,
+        next_month - timedelta(days=1),
+        measures=["sum:present"],
+    )
+    return single_series(result)["sum_present"]
+
+
 @login_required
 def attendance_chart_view(request):
     """
@@ -191,15 +335,16 @@ def attendance_chart_view(request):
         year = today.year
         month = today.month
 
-    qs = Attendance.objects.filter(date__year=year, date__month=month)
-
-    totals = qs.aggregate(
-        present_count=Count("id", filter=Q(status="present")),
-        absent_count=Count("id", filter=Q(status="absent")),
-    )
+    try:
+        first_day, next_month = month_bounds(year, month)
+    except ValueError:
+        year = today.year
+        month = today.month
+        first_day, next_month = month_bounds(year, month)
 
-    present_count = totals.get("present_count") or 0
-    absent_count = totals.get("absent_count") or 0
+    totals = monthly_attendance_totals(first_day, next_month)
+    present_count = totals["present"]
+    absent_count = totals["absent"]
 
     context = {
         "year": year,
@@ -210,6 +355,22 @@ def attendance_chart_view(request):
     return render(request, "reports/attendance_chart.html", context)
 
 
+@report_cache.cached("monthly-average-ratings", tables=["performance"])
+def monthly_average_ratings(first_month, last_month):
+    """
+    (labels, averages) for each month in [first_month, last_month], using
+    one GROUP BY over the whole range instead of one aggregate per month.
+    """
+    result = time_series(
+        "performance", "month", first_month, last_month, measures=["avg:rating"]
+    )
+    labels = [f"{bucket.month}/{bucket.year}" for bucket in result["buckets"]]
+    data_values = [
+        round(avg_score or 0.0, 1) for avg_score in single_series(result)["avg_rating"]
+    ]
+    return labels, data_values
+
+
 @login_required
 def performance_chart_view(request):
     """
@@ -241,31 +402,19 @@ def performance_chart_view(request):
         start_year = total_months_start // 12
         start_month = (total_months_start % 12) + 1
 
-    def build_year_month_list(s_year, s_month, e_year, e_month):
-        ym_list = []
-        start_index = s_year * 12 + (s_month - 1)
-        end_index = e_year * 12 + (e_month - 1)
-        if end_index < start_index:
-            start_index, end_index = end_index, start_index
-        for idx in range(start_index, end_index + 1):
-            y = idx // 12
-            m = (idx % 12) + 1
-            ym_list.append((y, m))
-        return ym_list
-
-    year_month_pairs = build_year_month_list(
-        start_year, start_month, end_year, end_month
-    )
+    start_index = start_year * 12 + (start_month - 1)
+    end_index = end_year * 12 + (end_month - 1)
+    if end_index < start_index:
+        start_index, end_index = end_index, start_index
 
-    labels = []
-    data_values = []
-    for y, m in year_month_pairs:
-        avg_obj = Performance.objects.filter(
-            review_date__year=y, review_date__month=m
-        ).aggregate(avg_score=Avg("rating"))
-        avg_score = avg_obj.get("avg_score") or 0.0
-        labels.append(f"{m}/{y}")
-        data_values.append(round(avg_score, 1))
+    try:
+        labels, data_values = monthly_average_ratings(
+            date(start_index // 12, start_index % 12 + 1, 1),
+            date(end_index // 12, end_index % 12 + 1, 1),
+        )
+    except ValueError:
+        # Out-of-range years or an oversized range: render an empty chart
+        labels, data_values = [], []
 
     context = {
         "chart_labels": labels,
@@ -278,15 +427,33 @@ def performance_chart_view(request):
     return render(request, "reports/performance_chart.html", context)
 
 
+@report_cache.cached("employees-per-department", tables=["employee", "department"])
+def employees_per_department():
+    # Headcount comes from DepartmentStats (LEFT JOIN, so departments without
+    # a stats row yet still show up with 0)
+    qs = Department.objects.order_by("id").values_list(
+        "id", "name", "stats__employee_count"
+    )
+
+    return [
+        {
+            "department_id": dept_id,
+            "department_name": name,
+            "employee_count": employee_count or 0,
+        }
+        for dept_id, name, employee_count in qs
+    ]
+
+
 @login_required
 def employees_per_department_view(request):
     """
     Renders a pie chart that shows, for each Department, how many Employees it has.
     """
-    qs = Department.objects.annotate(emp_count=Count("employees"))
+    rows = employees_per_department()
 
-    labels = [dept.name for dept in qs]
-    data_values = [dept.emp_count for dept in qs]
+    labels = [row["department_name"] for row in rows]
+    data_values = [row["employee_count"] for row in rows]
 
     context = {
         "chart_labels": labels,
@@ -312,18 +479,13 @@ def monthly_attendance_overview_view(request):
         year = today.year
         month = today.month
 
-    num_days = calendar.monthrange(year, month)[1]
-    labels = list(range(1, num_days + 1))
-
-    data_values = []
-    for day in labels:
-        count_present = Attendance.objects.filter(
-            date__year=year,
-            date__month=month,
-            date__day=day,
-            status="present",
-        ).count()
-        data_values.append(count_present)
+    try:
+        data_values = daily_present_counts(year, month)
+    except ValueError:
+        year = today.year
+        month = today.month
+        data_values = daily_present_counts(year, month)
+    labels = list(range(1, len(data_values) + 1))
 
     context = {
         "year": year,
@@ -332,36 +494,32 @@ def monthly_attendance_overview_view(request):
         "chart_data": data_values,
     }
     return render(request, "reports/monthly_attendance_overview.html", context)
-class EmployeesPerDepartmentAPIView(APIView):
+
+
+class EmployeesPerDepartmentAPIView(ConditionalGetMixin, APIView):
     """
     GET /api/reports/employees-per-department/
     Returns JSON: each { department_name, employee_count }.
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    etag_tables = ("employee", "department")
+    etag_per_user = False
 
     def get(self, request):
-        # Annotate each Department with its employee count (reverse FK 'employees')
-        qs = Department.objects.annotate(emp_count=Count("employees"))
-
-        data = [
-            {
-                "department_id": dept.id,
-                "department_name": dept.name,
-                "employee_count": dept.emp_count,
-            }
-            for dept in qs
-        ]
+        data = employees_per_department()
         return Response(data, status=status.HTTP_200_OK)
 
-class MonthlyAttendanceOverviewAPIView(APIView):
+class MonthlyAttendanceOverviewAPIView(ConditionalGetMixin, APIView):
     """
     GET /api/reports/monthly-attendance-overview/?year=YYYY&month=MM
     Returns JSON: daily present‐counts for the specified month.
     If no year/month provided, defaults to current month.
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    etag_tables = ("attendance",)
+    etag_per_user = False
 
     def get(self, request):
         today = date.today()
@@ -376,20 +534,15 @@ class MonthlyAttendanceOverviewAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # How many days in that month?
-        num_days = calendar.monthrange(year, month)[1]
-        labels = list(range(1, num_days + 1))  # [1,2,...,28/29/30/31]
-
         # Count “present” per day
-        data_values = []
-        for day in labels:
-            count_present = Attendance.objects.filter(
-                date__year=year,
-                date__month=month,
-                date__day=day,
-                status="present",
-            ).count()
-            data_values.append(count_present)
+        try:
+            data_values = daily_present_counts(year, month)
+        except ValueError:
+            return Response(
+                {"detail": "Invalid year/month; must be integers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        labels = list(range(1, len(data_values) + 1))  # [1,2,...,28/29/30/31]
 
         response_payload = {
             "year": year,
@@ -397,4 +550,112 @@ class MonthlyAttendanceOverviewAPIView(APIView):
             "labels": labels,
             "present_counts": data_values,
         }
-        return Response(response_payload, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(response_payload, status=status.HTTP_200_OK)
+
+
+def scope_time_series(user, source, group_by, filters):
+    """
+    Time series filters `user` may query. Admin/HR see every employee;
+    anyone else may not group by employee, and sources with an employee
+    dimension are limited to the user's own rows. Raises ValueError for
+    group_by=employee and PermissionDenied for a user without an employee
+    profile.
+    """
+    if is_staff_role(user) or "employee" not in SOURCES[source].dimensions:
+        return filters
+    if "employee" in group_by:
+        raise ValueError("Grouping by employee requires the Admin or HR role.")
+    employee_id = Employee.objects.filter(user=user).values_list("pk", flat=True).first()
+    if employee_id is None:
+        raise PermissionDenied("No employee profile is linked to this user.")
+    return dict(filters, employee=str(employee_id))
+
+
+class TimeSeriesAPIView(ConditionalGetMixin, APIView):
+    """
+    GET /api/reports/timeseries/
+    Generic time-bucketed aggregation over one report source.
+
+    Query parameters:
+      - source: attendance | performance | attendance_rollup | employees
+      - granularity: day | week | month (default) | quarter | year
+      - start, end: YYYY-MM-DD (default: January 1st of this year → today)
+      - group_by: comma-separated dimensions, e.g. "department,status"
+      - measures: comma-separated, e.g. "count,avg:rating" (default: count)
+      - any dimension name as a filter, e.g. ?department=3&status=present
+
+    Users without the Admin or HR role only see their own attendance and
+    reviews (see scope_time_series).
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    # Sources join each other's tables (e.g. attendance grouped by department)
+    etag_tables = TABLES
+
+    def get(self, request):
+        source = request.GET.get("source", "")
+        if source not in SOURCES:
+            return Response(
+                {"detail": f"Invalid source. Choose from: {', '.join(SOURCES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        today = date.today()
+        try:
+            start = date.fromisoformat(request.GET.get("start", date(today.year, 1, 1).isoformat()))
+            end = date.fromisoformat(request.GET.get("end", today.isoformat()))
+        except ValueError:
+            return Response(
+                {"detail": "Invalid start/end; use YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        group_by = [d for d in request.GET.get("group_by", "").split(",") if d]
+        measures = [m for m in request.GET.get("measures", "count").split(",") if m]
+        filters = {
+            dimension: request.GET[dimension]
+            for dimension in SOURCES[source].dimensions
+            if dimension in request.GET
+        }
+        try:
+            filters = scope_time_series(request.user, source, group_by, filters)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        params = {
+            "source": source,
+            "granularity": request.GET.get("granularity", "month"),
+            "start": start,
+            "end": end,
+            "group_by": group_by,
+            "measures": measures,
+            "filters": filters,
+        }
+        try:
+            result = report_cache.get_or_compute(
+                "timeseries",
+                params,
+                SOURCES[source].tables,
+                lambda: time_series(**params),
+            )
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload = dict(result, source=source)
+        payload["buckets"] = [bucket.isoformat() for bucket in result["buckets"]]
+        return Response(payload, status=status.HTTP_200_OK)
+
+
+class ReportCacheStatsAPIView(APIView):
+    """
+    GET /api/reports/cache-stats/
+    Hit/miss counters of the report result cache and, under "token_auth",
+    of the token -> user cache (this worker process only).
+    Admin only.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated & IsAdminGroup]
+
+    def get(self, request):
+        data = dict(report_cache.stats(), token_auth=token_cache.stats())
+        return Response(data, status=status.HTTP_200_OK)